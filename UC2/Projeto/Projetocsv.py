@@ -1,299 +1,461 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
 import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
-# Configurar estilo dos gráficos
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# matplotlib/seaborn só são importados quando alguma figura é gerada
+# (veja carregar_bibliotecas_graficas), assim o modo texto inicia rápido
+plt = None
+sns = None
+
+def carregar_bibliotecas_graficas():
+    """Importa matplotlib/seaborn e configura o estilo dos gráficos (uma vez só)"""
+    global plt, sns
+    if plt is None:
+        import matplotlib.pyplot as pyplot
+        import seaborn
+
+        # Configurar estilo dos gráficos
+        pyplot.style.use('seaborn-v0_8-darkgrid')
+        seaborn.set_palette("husl")
+        plt, sns = pyplot, seaborn
+    return plt
+
+# Funções estatísticas compartilhadas (UC2/aula7/statistic.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aula7'))
+from statistic import calcular_estatisticas_de_ordem
+from cache_medidas import obter_medidas_em_cache
+from colunar import carregar_tabela
 
 # Função para formatar valores em Reais
 def formatar_reais(valor):
     return f"R$ {valor:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
 
-# Funções de análise interpretativa
+# ============================================================================
+# ANÁLISES INTERPRETATIVAS (CLASSIFICAÇÃO VETORIZADA)
+# ============================================================================
+# Cada análise tem uma tabela de faixas. As funções classificar_* recebem
+# escalares ou arrays (ex.: uma medida por vendedor) e devolvem só o código
+# da faixa (posição na tabela), com np.digitize/np.select. As funções
+# analisar_* classificam um único valor e montam o dicionário com os textos.
+
+FAIXAS_MEDIA_MEDIANA = (
+    {
+        'status': '✅ BALANCEADO',
+        'descricao': 'Média e mediana próximas (diferença de {dif_percent:.1f}%)',
+        'interpretacao': 'Distribuição aproximadamente simétrica. A média representa bem o valor típico.',
+        'recomendacao': 'Pode usar a média como referência principal para decisões.',
+        'cor': 'green'
+    },
+    {
+        'status': '⚠️ MODERADA DIFERENÇA',
+        'descricao': 'Média {dif_percent:.1f}% diferente da mediana',
+        'interpretacao': 'Moderada assimetria. Valores extremos estão influenciando a média.',
+        'recomendacao': 'Considere usar a mediana para decisões mais robustas.',
+        'cor': 'orange'
+    },
+    {
+        'status': '❌ ALTA DIFERENÇA',
+        'descricao': 'Média {dif_percent:.1f}% {direcao} da mediana',
+        'interpretacao': 'Alta assimetria. Valores muito {extremos} estão distorcendo a média.',
+        'recomendacao': 'Use a mediana como referência. Investigue os valores extremos.',
+        'cor': 'red'
+    },
+)
+
+FAIXAS_VARIABILIDADE = (
+    {
+        'status': '✅ BAIXA VARIABILIDADE',
+        'descricao': 'CV = {cv:.1f}% (consistente)',
+        'interpretacao': 'Valores muito homogêneos. Padrão de vendas estável.',
+        'recomendacao': 'Previsões financeiras mais confiáveis.',
+        'cor': 'green'
+    },
+    {
+        'status': '⚠️ VARIABILIDADE MODERADA',
+        'descricao': 'CV = {cv:.1f}% (moderado)',
+        'interpretacao': 'Variabilidade aceitável. Alguma dispersão nos valores.',
+        'recomendacao': 'Monitorar periodicamente para detectar mudanças.',
+        'cor': 'orange'
+    },
+    {
+        'status': '⚠️ ALTA VARIABILIDADE',
+        'descricao': 'CV = {cv:.1f}% (alto)',
+        'interpretacao': 'Valores bastante dispersos. Diferentes perfis de compra.',
+        'recomendacao': 'Segmentar análise por faixa de valor.',
+        'cor': 'red'
+    },
+    {
+        'status': '❌ VARIABILIDADE MUITO ALTA',
+        'descricao': 'CV = {cv:.1f}% (muito alto)',
+        'interpretacao': 'Extrema dispersão. Difícil estabelecer padrão típico.',
+        'recomendacao': 'Analisar separadamente diferentes grupos de clientes.',
+        'cor': 'darkred'
+    },
+)
+
+FAIXAS_ASSIMETRIA = (
+    {
+        'status': '✅ SIMÉTRICA',
+        'descricao': 'Assimetria = {assimetria:.3f} (balanceada)',
+        'interpretacao': 'Distribuição equilibrada. Valores igualmente distribuídos.',
+        'recomendacao': 'Análise simplificada, comporta-se como normal.',
+        'cor': 'green'
+    },
+    {
+        'status': '⚠️ ASSIMETRIA POSITIVA MODERADA',
+        'descricao': 'Assimetria = {assimetria:.3f} (positiva moderada)',
+        'interpretacao': 'Cauda à direita. Alguns valores altos puxam a distribuição.',
+        'recomendacao': 'Focar em vendas de alto valor como oportunidade.',
+        'cor': 'orange'
+    },
+    {
+        'status': '❌ ASSIMETRIA POSITIVA FORTE',
+        'descricao': 'Assimetria = {assimetria:.3f} (positiva forte)',
+        'interpretacao': 'Cauda longa à direita. Muitos valores muito altos.',
+        'recomendacao': 'Analisar separadamente os grandes pedidos.',
+        'cor': 'red'
+    },
+    {
+        'status': '⚠️ ASSIMETRIA NEGATIVA MODERADA',
+        'descricao': 'Assimetria = {assimetria:.3f} (negativa moderada)',
+        'interpretacao': 'Cauda à esquerda. Prevalência de valores baixos.',
+        'recomendacao': 'Rever estratégia para aumentar ticket médio.',
+        'cor': 'orange'
+    },
+    {
+        'status': '❌ ASSIMETRIA NEGATIVA FORTE',
+        'descricao': 'Assimetria = {assimetria:.3f} (negativa forte)',
+        'interpretacao': 'Cauda longa à esquerda. Muitos valores muito baixos.',
+        'recomendacao': 'Investigar causas dos valores baixos recorrentes.',
+        'cor': 'red'
+    },
+)
+
+FAIXAS_CURTOSE = (
+    {
+        'status': '✅ MESOCÚRTICA',
+        'descricao': 'Curtose = {curtose:.3f} (similar à normal)',
+        'interpretacao': 'Distribuição com altura similar à normal.',
+        'recomendacao': 'Métodos estatísticos paramétricos são apropriados.',
+        'cor': 'green'
+    },
+    {
+        'status': '⚠️ LEPTOCÚRTICA',
+        'descricao': 'Curtose = {curtose:.3f} (pico alto)',
+        'interpretacao': 'Valores concentrados perto da média, caudas pesadas.',
+        'recomendacao': 'Maior probabilidade de outliers extremos.',
+        'cor': 'orange'
+    },
+    {
+        'status': '⚠️ PLATICÚRTICA',
+        'descricao': 'Curtose = {curtose:.3f} (pico baixo)',
+        'interpretacao': 'Valores mais espalhados, menor concentração na média.',
+        'recomendacao': 'Maior variabilidade, menor previsibilidade.',
+        'cor': 'orange'
+    },
+)
+
+FAIXAS_OUTLIERS = (
+    {
+        'status': '✅ SEM OUTLIERS',
+        'descricao': 'Nenhum outlier detectado',
+        'interpretacao': 'Dados consistentes, sem valores atípicos.',
+        'recomendacao': 'Análise simplificada, todos os valores são típicos.',
+        'cor': 'green'
+    },
+    {
+        'status': '⚠️ POUCOS OUTLIERS',
+        'descricao': '{n_outliers} outliers ({percent:.1f}%)',
+        'interpretacao': 'Poucos valores atípicos, impacto limitado.',
+        'recomendacao': 'Verificar individualmente, mas provavelmente OK.',
+        'cor': 'orange'
+    },
+    {
+        'status': '⚠️ OUTLIERS MODERADOS',
+        'descricao': '{n_outliers} outliers ({percent:.1f}%)',
+        'interpretacao': 'Quantidade significativa de valores atípicos.',
+        'recomendacao': 'Analisar separadamente estes casos.',
+        'cor': 'red'
+    },
+    {
+        'status': '❌ MUITOS OUTLIERS',
+        'descricao': '{n_outliers} outliers ({percent:.1f}%)',
+        'interpretacao': 'Alta proporção de valores atípicos.',
+        'recomendacao': 'Revisar processo de coleta/validação de dados.',
+        'cor': 'darkred'
+    },
+)
+
+FAIXAS_FAIXA_VALORES = (
+    {
+        'status': '✅ FAIXA ADEQUADA',
+        'descricao': 'Amplitude: {amplitude}',
+        'interpretacao': 'Faixa de valores proporcional à média.',
+        'recomendacao': 'Valores dentro de expectativas razoáveis.',
+        'cor': 'green'
+    },
+    {
+        'status': '⚠️ FAIXA AMPLA',
+        'descricao': 'Amplitude: {amplitude}',
+        'interpretacao': 'Diferença considerável entre mínimo e máximo.',
+        'recomendacao': 'Considerar segmentação por valor.',
+        'cor': 'orange'
+    },
+    {
+        'status': '❌ FAIXA MUITO AMPLA',
+        'descricao': 'Amplitude: {amplitude}',
+        'interpretacao': 'Extrema diferença entre valores extremos.',
+        'recomendacao': 'Investigar valores extremos individualmente.',
+        'cor': 'red'
+    },
+)
+
+# Limites que separam as faixas (valor < limite -> faixa anterior)
+LIMITES_MEDIA_MEDIANA = [10, 30]      # diferença média/mediana em %
+LIMITES_VARIABILIDADE = [15, 30, 50]  # CV em %
+LIMITES_OUTLIERS = [5, 10]            # % de outliers
+LIMITES_FAIXA_VALORES = [3, 5]        # máximo / média
+LIMITE_FORMA = 0.5                    # |assimetria| e |curtose| "normais"
+LIMITE_ASSIMETRIA_FORTE = 1
+
+# Tabela de cada análise, com as mesmas chaves de executar_analises()
+FAIXAS = {
+    'media_mediana': FAIXAS_MEDIA_MEDIANA,
+    'variabilidade': FAIXAS_VARIABILIDADE,
+    'assimetria': FAIXAS_ASSIMETRIA,
+    'curtose': FAIXAS_CURTOSE,
+    'outliers': FAIXAS_OUTLIERS,
+    'faixa': FAIXAS_FAIXA_VALORES,
+}
+
+def _diferenca_percentual(media, mediana):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.abs((np.asarray(media, dtype=float) - mediana) / mediana) * 100
+
+def _percentual_outliers(n_outliers, total):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.asarray(n_outliers, dtype=float) / total * 100
+
+def _relacao_maximo_media(maximo, media):
+    media = np.asarray(media, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(media > 0, np.asarray(maximo, dtype=float) / media, 0.0)
+
+def classificar_media_mediana(media, mediana):
+    """Código da faixa (0 a 2) da diferença entre média e mediana"""
+    return np.digitize(_diferenca_percentual(media, mediana), LIMITES_MEDIA_MEDIANA).astype(np.int8)
+
+def classificar_variabilidade(cv):
+    """Código da faixa (0 a 3) do coeficiente de variação"""
+    return np.digitize(np.asarray(cv, dtype=float), LIMITES_VARIABILIDADE).astype(np.int8)
+
+def classificar_assimetria(assimetria):
+    """Código da faixa (0 a 4) do coeficiente de assimetria"""
+    assimetria = np.asarray(assimetria, dtype=float)
+    condicoes = [
+        np.abs(assimetria) <= LIMITE_FORMA,
+        (assimetria > LIMITE_FORMA) & (assimetria <= LIMITE_ASSIMETRIA_FORTE),
+        assimetria > LIMITE_ASSIMETRIA_FORTE,
+        (assimetria >= -LIMITE_ASSIMETRIA_FORTE) & (assimetria < -LIMITE_FORMA),
+    ]
+    return np.select(condicoes, [0, 1, 2, 3], default=4).astype(np.int8)
+
+def classificar_curtose(curtose):
+    """Código da faixa (0 a 2) do coeficiente de curtose"""
+    curtose = np.asarray(curtose, dtype=float)
+    condicoes = [np.abs(curtose) <= LIMITE_FORMA, curtose > LIMITE_FORMA]
+    return np.select(condicoes, [0, 1], default=2).astype(np.int8)
+
+def classificar_outliers(n_outliers, total):
+    """Código da faixa (0 a 3) da proporção de outliers"""
+    faixa_percentual = np.digitize(_percentual_outliers(n_outliers, total), LIMITES_OUTLIERS) + 1
+    return np.where(np.asarray(n_outliers) == 0, 0, faixa_percentual).astype(np.int8)
+
+def classificar_faixa_valores(maximo, media):
+    """Código da faixa (0 a 2) da relação entre o máximo e a média"""
+    return np.digitize(_relacao_maximo_media(maximo, media), LIMITES_FAIXA_VALORES).astype(np.int8)
+
+def status_categorico(chave, codigos):
+    """Converte códigos de faixa em um pd.Categorical com os textos de status"""
+    categorias = [faixa['status'] for faixa in FAIXAS[chave]]
+    return pd.Categorical.from_codes(np.asarray(codigos), categories=categorias)
+
+def classificar_em_lote(medidas):
+    """
+    Classifica várias séries de uma vez (ex.: uma linha por vendedor).
+
+    Args:
+        medidas (pd.DataFrame): Colunas media, mediana, cv, assimetria,
+            curtose, n_outliers, n, minimo e maximo, como as chaves de
+            calcular_medidas_projeto().
+
+    Returns:
+        pd.DataFrame: Uma coluna categórica de status por análise, com o
+        mesmo índice. Os dicionários completos de uma linha podem ser
+        montados depois com executar_analises(medidas.loc[chave], None).
+    """
+    codigos = {
+        'media_mediana': classificar_media_mediana(medidas['media'], medidas['mediana']),
+        'variabilidade': classificar_variabilidade(medidas['cv']),
+        'assimetria': classificar_assimetria(medidas['assimetria']),
+        'curtose': classificar_curtose(medidas['curtose']),
+        'outliers': classificar_outliers(medidas['n_outliers'], medidas['n']),
+        'faixa': classificar_faixa_valores(medidas['maximo'], medidas['media']),
+    }
+    return pd.DataFrame({chave: status_categorico(chave, codigo) for chave, codigo in codigos.items()},
+                        index=medidas.index)
+
+def _montar_analise(faixas, codigo, **valores):
+    faixa = faixas[int(codigo)]
+    analise = dict(faixa)
+    analise['descricao'] = faixa['descricao'].format(**valores)
+    analise['interpretacao'] = faixa['interpretacao'].format(**valores)
+    return analise
+
 def analisar_media_mediana(media, mediana, dados):
     """Analisa a relação entre média e mediana"""
-    dif_percent = abs((media - mediana) / mediana) * 100
-    
-    if dif_percent < 10:
-        return {
-            'status': '✅ BALANCEADO',
-            'descricao': f'Média e mediana próximas (diferença de {dif_percent:.1f}%)',
-            'interpretacao': 'Distribuição aproximadamente simétrica. A média representa bem o valor típico.',
-            'recomendacao': 'Pode usar a média como referência principal para decisões.',
-            'cor': 'green'
-        }
-    elif dif_percent < 30:
-        return {
-            'status': '⚠️ MODERADA DIFERENÇA',
-            'descricao': f'Média {dif_percent:.1f}% diferente da mediana',
-            'interpretacao': 'Moderada assimetria. Valores extremos estão influenciando a média.',
-            'recomendacao': 'Considere usar a mediana para decisões mais robustas.',
-            'cor': 'orange'
-        }
-    else:
-        direcao = "acima" if media > mediana else "abaixo"
-        return {
-            'status': '❌ ALTA DIFERENÇA',
-            'descricao': f'Média {dif_percent:.1f}% {direcao} da mediana',
-            'interpretacao': f'Alta assimetria. Valores muito { "altos" if media > mediana else "baixos" } estão distorcendo a média.',
-            'recomendacao': 'Use a mediana como referência. Investigue os valores extremos.',
-            'cor': 'red'
-        }
+    return _montar_analise(FAIXAS_MEDIA_MEDIANA, classificar_media_mediana(media, mediana),
+                           dif_percent=float(_diferenca_percentual(media, mediana)),
+                           direcao="acima" if media > mediana else "abaixo",
+                           extremos="altos" if media > mediana else "baixos")
 
 def analisar_variabilidade(cv):
     """Analisa o coeficiente de variação"""
-    if cv < 15:
-        return {
-            'status': '✅ BAIXA VARIABILIDADE',
-            'descricao': f'CV = {cv:.1f}% (consistente)',
-            'interpretacao': 'Valores muito homogêneos. Padrão de vendas estável.',
-            'recomendacao': 'Previsões financeiras mais confiáveis.',
-            'cor': 'green'
-        }
-    elif cv < 30:
-        return {
-            'status': '⚠️ VARIABILIDADE MODERADA',
-            'descricao': f'CV = {cv:.1f}% (moderado)',
-            'interpretacao': 'Variabilidade aceitável. Alguma dispersão nos valores.',
-            'recomendacao': 'Monitorar periodicamente para detectar mudanças.',
-            'cor': 'orange'
-        }
-    elif cv < 50:
-        return {
-            'status': '⚠️ ALTA VARIABILIDADE',
-            'descricao': f'CV = {cv:.1f}% (alto)',
-            'interpretacao': 'Valores bastante dispersos. Diferentes perfis de compra.',
-            'recomendacao': 'Segmentar análise por faixa de valor.',
-            'cor': 'red'
-        }
-    else:
-        return {
-            'status': '❌ VARIABILIDADE MUITO ALTA',
-            'descricao': f'CV = {cv:.1f}% (muito alto)',
-            'interpretacao': 'Extrema dispersão. Difícil estabelecer padrão típico.',
-            'recomendacao': 'Analisar separadamente diferentes grupos de clientes.',
-            'cor': 'darkred'
-        }
+    return _montar_analise(FAIXAS_VARIABILIDADE, classificar_variabilidade(cv), cv=cv)
 
 def analisar_assimetria(assimetria):
     """Analisa o coeficiente de assimetria"""
-    if -0.5 <= assimetria <= 0.5:
-        return {
-            'status': '✅ SIMÉTRICA',
-            'descricao': f'Assimetria = {assimetria:.3f} (balanceada)',
-            'interpretacao': 'Distribuição equilibrada. Valores igualmente distribuídos.',
-            'recomendacao': 'Análise simplificada, comporta-se como normal.',
-            'cor': 'green'
-        }
-    elif 0.5 < assimetria <= 1:
-        return {
-            'status': '⚠️ ASSIMETRIA POSITIVA MODERADA',
-            'descricao': f'Assimetria = {assimetria:.3f} (positiva moderada)',
-            'interpretacao': 'Cauda à direita. Alguns valores altos puxam a distribuição.',
-            'recomendacao': 'Focar em vendas de alto valor como oportunidade.',
-            'cor': 'orange'
-        }
-    elif assimetria > 1:
-        return {
-            'status': '❌ ASSIMETRIA POSITIVA FORTE',
-            'descricao': f'Assimetria = {assimetria:.3f} (positiva forte)',
-            'interpretacao': 'Cauda longa à direita. Muitos valores muito altos.',
-            'recomendacao': 'Analisar separadamente os grandes pedidos.',
-            'cor': 'red'
-        }
-    elif -1 <= assimetria < -0.5:
-        return {
-            'status': '⚠️ ASSIMETRIA NEGATIVA MODERADA',
-            'descricao': f'Assimetria = {assimetria:.3f} (negativa moderada)',
-            'interpretacao': 'Cauda à esquerda. Prevalência de valores baixos.',
-            'recomendacao': 'Rever estratégia para aumentar ticket médio.',
-            'cor': 'orange'
-        }
-    else:
-        return {
-            'status': '❌ ASSIMETRIA NEGATIVA FORTE',
-            'descricao': f'Assimetria = {assimetria:.3f} (negativa forte)',
-            'interpretacao': 'Cauda longa à esquerda. Muitos valores muito baixos.',
-            'recomendacao': 'Investigar causas dos valores baixos recorrentes.',
-            'cor': 'red'
-        }
+    return _montar_analise(FAIXAS_ASSIMETRIA, classificar_assimetria(assimetria), assimetria=assimetria)
 
 def analisar_curtose(curtose):
     """Analisa o coeficiente de curtose"""
-    if -0.5 <= curtose <= 0.5:
-        return {
-            'status': '✅ MESOCÚRTICA',
-            'descricao': f'Curtose = {curtose:.3f} (similar à normal)',
-            'interpretacao': 'Distribuição com altura similar à normal.',
-            'recomendacao': 'Métodos estatísticos paramétricos são apropriados.',
-            'cor': 'green'
-        }
-    elif curtose > 0.5:
-        return {
-            'status': '⚠️ LEPTOCÚRTICA',
-            'descricao': f'Curtose = {curtose:.3f} (pico alto)',
-            'interpretacao': 'Valores concentrados perto da média, caudas pesadas.',
-            'recomendacao': 'Maior probabilidade de outliers extremos.',
-            'cor': 'orange'
-        }
-    else:
-        return {
-            'status': '⚠️ PLATICÚRTICA',
-            'descricao': f'Curtose = {curtose:.3f} (pico baixo)',
-            'interpretacao': 'Valores mais espalhados, menor concentração na média.',
-            'recomendacao': 'Maior variabilidade, menor previsibilidade.',
-            'cor': 'orange'
-        }
+    return _montar_analise(FAIXAS_CURTOSE, classificar_curtose(curtose), curtose=curtose)
 
 def analisar_outliers(n_outliers, total):
     """Analisa a presença de outliers"""
-    percent = (n_outliers / total) * 100
-    
-    if n_outliers == 0:
-        return {
-            'status': '✅ SEM OUTLIERS',
-            'descricao': 'Nenhum outlier detectado',
-            'interpretacao': 'Dados consistentes, sem valores atípicos.',
-            'recomendacao': 'Análise simplificada, todos os valores são típicos.',
-            'cor': 'green'
-        }
-    elif percent < 5:
-        return {
-            'status': '⚠️ POUCOS OUTLIERS',
-            'descricao': f'{n_outliers} outliers ({percent:.1f}%)',
-            'interpretacao': 'Poucos valores atípicos, impacto limitado.',
-            'recomendacao': 'Verificar individualmente, mas provavelmente OK.',
-            'cor': 'orange'
-        }
-    elif percent < 10:
-        return {
-            'status': '⚠️ OUTLIERS MODERADOS',
-            'descricao': f'{n_outliers} outliers ({percent:.1f}%)',
-            'interpretacao': 'Quantidade significativa de valores atípicos.',
-            'recomendacao': 'Analisar separadamente estes casos.',
-            'cor': 'red'
-        }
-    else:
-        return {
-            'status': '❌ MUITOS OUTLIERS',
-            'descricao': f'{n_outliers} outliers ({percent:.1f}%)',
-            'interpretacao': 'Alta proporção de valores atípicos.',
-            'recomendacao': 'Revisar processo de coleta/validação de dados.',
-            'cor': 'darkred'
-        }
+    return _montar_analise(FAIXAS_OUTLIERS, classificar_outliers(n_outliers, total),
+                           n_outliers=n_outliers, percent=float(_percentual_outliers(n_outliers, total)))
 
 def analisar_faixa_valores(minimo, maximo, media):
     """Analisa a faixa de valores"""
-    amplitude = maximo - minimo
-    relacao_max_media = maximo / media if media > 0 else 0
-    
-    if relacao_max_media < 3:
-        return {
-            'status': '✅ FAIXA ADEQUADA',
-            'descricao': f'Amplitude: {formatar_reais(amplitude)}',
-            'interpretacao': 'Faixa de valores proporcional à média.',
-            'recomendacao': 'Valores dentro de expectativas razoáveis.',
-            'cor': 'green'
-        }
-    elif relacao_max_media < 5:
-        return {
-            'status': '⚠️ FAIXA AMPLA',
-            'descricao': f'Amplitude: {formatar_reais(amplitude)}',
-            'interpretacao': 'Diferença considerável entre mínimo e máximo.',
-            'recomendacao': 'Considerar segmentação por valor.',
-            'cor': 'orange'
-        }
-    else:
-        return {
-            'status': '❌ FAIXA MUITO AMPLA',
-            'descricao': f'Amplitude: {formatar_reais(amplitude)}',
-            'interpretacao': 'Extrema diferença entre valores extremos.',
-            'recomendacao': 'Investigar valores extremos individualmente.',
-            'cor': 'red'
-        }
-
-# Obter diretório atual para salvar as imagens
-diretorio_atual = os.getcwd()
-print(f"📁 Diretório atual: {diretorio_atual}")
-print(f"💾 As imagens serão salvas neste diretório")
-
-# Carregar o DataFrame
-try:
-    pedidos_df = pd.read_csv("../aula9/orders.csv")
-    
-    if 'TotalAmount' not in pedidos_df.columns:
-        print("Erro: Coluna 'TotalAmount' não encontrada")
-        print(f"Colunas disponíveis: {list(pedidos_df.columns)}")
-    else:
-        dados_valor_total = pedidos_df['TotalAmount'].dropna()
-        
-        if dados_valor_total.empty:
-            print("Erro: Nenhum dado disponível")
-        else:
-            # Cálculo das medidas estatísticas
-            media_vendas = dados_valor_total.mean()
-            mediana_vendas = dados_valor_total.median()
-            moda_valor = dados_valor_total.mode()[0] if not dados_valor_total.mode().empty else 0
-            desvio_padrao_vendas = np.std(dados_valor_total, ddof=0)
-            cv_vendas = (desvio_padrao_vendas / media_vendas) * 100
-            assimetria = dados_valor_total.skew()
-            curtose = dados_valor_total.kurtosis()
-            
-            # Calcular quartis e outliers
-            Q1 = dados_valor_total.quantile(0.25)
-            Q3 = dados_valor_total.quantile(0.75)
-            IQR = Q3 - Q1
-            limite_inferior = Q1 - 1.5 * IQR
-            limite_superior = Q3 + 1.5 * IQR
-            outliers = dados_valor_total[(dados_valor_total < limite_inferior) | 
-                                        (dados_valor_total > limite_superior)]
-            n_outliers = len(outliers)
-            
-            # Executar todas as análises
-            analise_media_mediana = analisar_media_mediana(media_vendas, mediana_vendas, dados_valor_total)
-            analise_variabilidade = analisar_variabilidade(cv_vendas)
-            analise_assimetria = analisar_assimetria(assimetria)
-            analise_curtose = analisar_curtose(curtose)
-            analise_outliers = analisar_outliers(n_outliers, len(dados_valor_total))
-            analise_faixa = analisar_faixa_valores(dados_valor_total.min(), dados_valor_total.max(), media_vendas)
-            
-            # Criar lista para armazenar nomes dos arquivos salvos
-            arquivos_salvos = []
-            
-            # ============================================================================
-            # 1. PRIMEIRA FIGURA: HISTOGRAMA COM ANÁLISE
-            # ============================================================================
-            fig1, ((ax1_graph, ax1_desc), (ax1_analise, _)) = plt.subplots(2, 2, figsize=(16, 10))
-            fig1.suptitle('VISUALIZAÇÃO 1: DISTRIBUIÇÃO DOS VALORES - HISTOGRAMA', 
-                         fontsize=16, fontweight='bold', y=0.98)
-            
-            # Gráfico Histograma
-            n, bins, patches = ax1_graph.hist(dados_valor_total, bins=30, edgecolor='black', 
-                                            alpha=0.7, density=True, color='skyblue')
-            
-            ax1_graph.axvline(media_vendas, color='red', linestyle='--', linewidth=2, 
-                            label=f'Média: {formatar_reais(media_vendas)}')
-            
-            ax1_graph.axvline(mediana_vendas, color='green', linestyle='--', linewidth=2,
-                            label=f'Mediana: {formatar_reais(mediana_vendas)}')
-            
-            dados_valor_total.plot(kind='kde', ax=ax1_graph, color='darkblue', linewidth=2)
-            
-            ax1_graph.set_title('📊 HISTOGRAMA - DISTRIBUIÇÃO', fontsize=14, fontweight='bold', pad=10)
-            ax1_graph.set_xlabel('Valor do Pedido (R$)', fontsize=11)
-            ax1_graph.set_ylabel('Densidade', fontsize=11)
-            ax1_graph.legend(fontsize=9)
-            ax1_graph.grid(True, alpha=0.3)
-            
-            # Descrição do Histograma
-            ax1_desc.axis('off')
-            desc_text1 = """
+    return _montar_analise(FAIXAS_FAIXA_VALORES, classificar_faixa_valores(maximo, media),
+                           amplitude=formatar_reais(maximo - minimo))
+
+def calcular_medidas_projeto(dados_valor_total):
+    """Calcula todas as medidas usadas nas figuras e no relatório"""
+    media_vendas = dados_valor_total.mean()
+    # Quartis e mediana em uma única partição dos dados
+    Q1, mediana_vendas, Q3 = calcular_estatisticas_de_ordem(dados_valor_total, (0.25, 0.5, 0.75))
+    moda = dados_valor_total.mode()
+    desvio_padrao_vendas = np.std(dados_valor_total, ddof=0)
+    IQR = Q3 - Q1
+    limite_inferior = Q1 - 1.5 * IQR
+    limite_superior = Q3 + 1.5 * IQR
+
+    return {
+        'n': len(dados_valor_total),
+        'media': media_vendas,
+        'mediana': mediana_vendas,
+        'moda': moda[0] if not moda.empty else 0,
+        'desvio_padrao': desvio_padrao_vendas,
+        'cv': (desvio_padrao_vendas / media_vendas) * 100,
+        'assimetria': dados_valor_total.skew(),
+        'curtose': dados_valor_total.kurtosis(),
+        'Q1': Q1,
+        'Q3': Q3,
+        'IQR': IQR,
+        'limite_inferior': limite_inferior,
+        'limite_superior': limite_superior,
+        'n_outliers': int(((dados_valor_total < limite_inferior) |
+                           (dados_valor_total > limite_superior)).sum()),
+        'minimo': dados_valor_total.min(),
+        'maximo': dados_valor_total.max(),
+    }
+
+def executar_analises(medidas_projeto, dados_valor_total):
+    """Executa todas as análises interpretativas a partir das medidas"""
+    return {
+        'media_mediana': analisar_media_mediana(medidas_projeto['media'], medidas_projeto['mediana'], dados_valor_total),
+        'variabilidade': analisar_variabilidade(medidas_projeto['cv']),
+        'assimetria': analisar_assimetria(medidas_projeto['assimetria']),
+        'curtose': analisar_curtose(medidas_projeto['curtose']),
+        'outliers': analisar_outliers(medidas_projeto['n_outliers'], medidas_projeto['n']),
+        'faixa': analisar_faixa_valores(medidas_projeto['minimo'], medidas_projeto['maximo'], medidas_projeto['media']),
+    }
+
+def avaliar_geral(analises):
+    """Lista os pontos de atenção e classifica a avaliação geral dos dados"""
+    problemas = []
+    if analises['media_mediana']['cor'] in ['orange', 'red', 'darkred']:
+        problemas.append("Relação média-mediana")
+    if analises['variabilidade']['cor'] in ['orange', 'red', 'darkred']:
+        problemas.append("Variabilidade")
+    if analises['assimetria']['cor'] in ['orange', 'red', 'darkred']:
+        problemas.append("Assimetria")
+    if analises['outliers']['cor'] in ['orange', 'red', 'darkred']:
+        problemas.append("Outliers")
+
+    avaliacao_geral = "EXCELENTE" if len(problemas) == 0 else "BOA" if len(problemas) <= 1 else "REGULAR" if len(problemas) <= 2 else "CRÍTICA"
+    return problemas, avaliacao_geral
+
+def preparar_contexto(dados_valor_total, medidas_projeto):
+    """
+    Junta dados, medidas e análises em um único objeto compartilhado por
+    todas as figuras (e enviado uma vez para cada processo).
+    """
+    return {
+        'dados': dados_valor_total,
+        'medidas': medidas_projeto,
+        'analises': executar_analises(medidas_projeto, dados_valor_total),
+    }
+
+# ============================================================================
+# FIGURAS DO RELATÓRIO
+# ============================================================================
+# Cada figura é gerada por uma função independente que recebe o contexto
+# já calculado e o caminho do arquivo. Assim elas podem ser geradas uma por
+# vez ou em paralelo, em processos separados, com o mesmo resultado.
+
+def gerar_figura_histograma(contexto, caminho, mostrar=False):
+    """Figura 1: histograma com análise da relação média-mediana"""
+    carregar_bibliotecas_graficas()
+    medidas = contexto['medidas']
+    analises = contexto['analises']
+    dados_valor_total = contexto['dados']
+    media_vendas = medidas['media']
+    mediana_vendas = medidas['mediana']
+    analise_media_mediana = analises['media_mediana']
+
+    fig1, ((ax1_graph, ax1_desc), (ax1_analise, _)) = plt.subplots(2, 2, figsize=(16, 10))
+    fig1.suptitle('VISUALIZAÇÃO 1: DISTRIBUIÇÃO DOS VALORES - HISTOGRAMA', 
+                 fontsize=16, fontweight='bold', y=0.98)
+    
+    # Gráfico Histograma
+    n, bins, patches = ax1_graph.hist(dados_valor_total, bins=30, edgecolor='black', 
+                                    alpha=0.7, density=True, color='skyblue')
+    
+    ax1_graph.axvline(media_vendas, color='red', linestyle='--', linewidth=2, 
+                    label=f'Média: {formatar_reais(media_vendas)}')
+    
+    ax1_graph.axvline(mediana_vendas, color='green', linestyle='--', linewidth=2,
+                    label=f'Mediana: {formatar_reais(mediana_vendas)}')
+    
+    dados_valor_total.plot(kind='kde', ax=ax1_graph, color='darkblue', linewidth=2)
+    
+    ax1_graph.set_title('📊 HISTOGRAMA - DISTRIBUIÇÃO', fontsize=14, fontweight='bold', pad=10)
+    ax1_graph.set_xlabel('Valor do Pedido (R$)', fontsize=11)
+    ax1_graph.set_ylabel('Densidade', fontsize=11)
+    ax1_graph.legend(fontsize=9)
+    ax1_graph.grid(True, alpha=0.3)
+    
+    # Descrição do Histograma
+    ax1_desc.axis('off')
+    desc_text1 = """
             📋 GRÁFICO 1: HISTOGRAMA
             
             🎯 O QUE ESTE GRÁFICO MOSTRA:
@@ -313,19 +475,19 @@ try:
             3. Pico à direita = Maioria com valores altos
             4. Múltiplos picos = Vários padrões de compra
             """
-            
-            ax1_desc.text(0, 1, desc_text1, transform=ax1_desc.transAxes, fontsize=10,
-                         verticalalignment='top', fontfamily='monospace',
-                         bbox=dict(boxstyle='round', facecolor='#E8F4FD', alpha=0.9, edgecolor='blue'))
-            
-            # ANÁLISE DETALHADA DA RELAÇÃO MÉDIA-MEDIANA
-            ax1_analise.axis('off')
-            
-            # Calcular diferença percentual
-            dif_percent = abs((media_vendas - mediana_vendas) / mediana_vendas) * 100
-            direcao = "acima" if media_vendas > mediana_vendas else "abaixo"
-            
-            analise_text1 = f"""
+    
+    ax1_desc.text(0, 1, desc_text1, transform=ax1_desc.transAxes, fontsize=10,
+                 verticalalignment='top', fontfamily='monospace',
+                 bbox=dict(boxstyle='round', facecolor='#E8F4FD', alpha=0.9, edgecolor='blue'))
+    
+    # ANÁLISE DETALHADA DA RELAÇÃO MÉDIA-MEDIANA
+    ax1_analise.axis('off')
+    
+    # Calcular diferença percentual
+    dif_percent = abs((media_vendas - mediana_vendas) / mediana_vendas) * 100
+    direcao = "acima" if media_vendas > mediana_vendas else "abaixo"
+    
+    analise_text1 = f"""
             🔍 ANÁLISE: RELAÇÃO MÉDIA vs MEDIANA
             
             📊 VALORES CALCULADOS:
@@ -346,66 +508,73 @@ try:
             {"🚨 ATENÇÃO: A média está muito distante da mediana! Use a mediana como referência mais confiável." 
              if dif_percent > 30 else "✅ A média representa bem o valor típico dos pedidos."}
             """
-            
-            # Usar cor baseada na análise
-            cor_fundo = {
-                'green': '#E8F6F3',
-                'orange': '#FFF3E0',
-                'red': '#FFEBEE',
-                'darkred': '#FCE4EC'
-            }.get(analise_media_mediana['cor'], '#F5F5F5')
-            
-            ax1_analise.text(0, 1, analise_text1, transform=ax1_analise.transAxes, fontsize=9.5,
-                           verticalalignment='top', fontfamily='monospace',
-                           bbox=dict(boxstyle='round', facecolor=cor_fundo, alpha=0.9, 
-                                   edgecolor=analise_media_mediana['cor']))
-            
-            # Remover o quarto subplot não usado
-            fig1.delaxes(_)
-            
-            plt.tight_layout()
-            
-            # Salvar a figura 1
-            nome_arquivo1 = '01_histograma_com_analise.png'
-            caminho_completo1 = os.path.join(diretorio_atual, nome_arquivo1)
-            fig1.savefig(caminho_completo1, dpi=300, bbox_inches='tight', facecolor='white')
-            arquivos_salvos.append(nome_arquivo1)
-            print(f"✅ Figura 1 salva como: {nome_arquivo1}")
-            plt.show()
-            plt.close(fig1)
-            
-            # ============================================================================
-            # 2. SEGUNDA FIGURA: BOXPLOT COM ANÁLISE DE DISPERSÃO
-            # ============================================================================
-            fig2, ((ax2_graph, ax2_desc), (ax2_analise, _)) = plt.subplots(2, 2, figsize=(16, 10))
-            fig2.suptitle('VISUALIZAÇÃO 2: DISPERSÃO DOS VALORES - BOXPLOT', 
-                         fontsize=16, fontweight='bold', y=0.98)
-            
-            # Gráfico Boxplot
-            box = ax2_graph.boxplot([dados_valor_total], patch_artist=True,
-                                   boxprops=dict(facecolor='lightcoral', alpha=0.7),
-                                   medianprops=dict(color='black', linewidth=2),
-                                   whiskerprops=dict(color='gray', linewidth=1.5),
-                                   capprops=dict(color='gray', linewidth=1.5),
-                                   flierprops=dict(marker='o', markersize=8, 
-                                                   markerfacecolor='red', alpha=0.6))
-            
-            ax2_graph.set_title('📦 BOXPLOT - DISPERSÃO', fontsize=14, fontweight='bold', pad=10)
-            ax2_graph.set_ylabel('Valor (R$)', fontsize=11)
-            ax2_graph.set_xticklabels(['Valores dos Pedidos'])
-            ax2_graph.grid(True, alpha=0.3)
-            
-            # Adicionar estatísticas no boxplot
-            ax2_graph.text(0.05, 0.95, f'Q1: {formatar_reais(Q1)}',
-                          transform=ax2_graph.transAxes, fontsize=9, fontweight='bold',
-                          bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-            ax2_graph.text(0.05, 0.88, f'Q3: {formatar_reais(Q3)}',
-                          transform=ax2_graph.transAxes, fontsize=9, fontweight='bold',
-                          bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-            
-            # Descrição do Boxplot
-            ax2_desc.axis('off')
-            desc_text2 = """
+    
+    # Usar cor baseada na análise
+    cor_fundo = {
+        'green': '#E8F6F3',
+        'orange': '#FFF3E0',
+        'red': '#FFEBEE',
+        'darkred': '#FCE4EC'
+    }.get(analise_media_mediana['cor'], '#F5F5F5')
+    
+    ax1_analise.text(0, 1, analise_text1, transform=ax1_analise.transAxes, fontsize=9.5,
+                   verticalalignment='top', fontfamily='monospace',
+                   bbox=dict(boxstyle='round', facecolor=cor_fundo, alpha=0.9, 
+                           edgecolor=analise_media_mediana['cor']))
+    
+    # Remover o quarto subplot não usado
+    fig1.delaxes(_)
+    
+    plt.tight_layout()
+
+    fig1.savefig(caminho, dpi=300, bbox_inches='tight', facecolor='white')
+    if mostrar:
+        plt.show()
+    plt.close(fig1)
+
+def gerar_figura_boxplot(contexto, caminho, mostrar=False):
+    """Figura 2: boxplot com análise de dispersão e outliers"""
+    carregar_bibliotecas_graficas()
+    medidas = contexto['medidas']
+    analises = contexto['analises']
+    dados_valor_total = contexto['dados']
+    desvio_padrao_vendas = medidas['desvio_padrao']
+    cv_vendas = medidas['cv']
+    Q1 = medidas['Q1']
+    Q3 = medidas['Q3']
+    IQR = medidas['IQR']
+    analise_variabilidade = analises['variabilidade']
+    analise_outliers = analises['outliers']
+
+    fig2, ((ax2_graph, ax2_desc), (ax2_analise, _)) = plt.subplots(2, 2, figsize=(16, 10))
+    fig2.suptitle('VISUALIZAÇÃO 2: DISPERSÃO DOS VALORES - BOXPLOT', 
+                 fontsize=16, fontweight='bold', y=0.98)
+    
+    # Gráfico Boxplot
+    box = ax2_graph.boxplot([dados_valor_total], patch_artist=True,
+                           boxprops=dict(facecolor='lightcoral', alpha=0.7),
+                           medianprops=dict(color='black', linewidth=2),
+                           whiskerprops=dict(color='gray', linewidth=1.5),
+                           capprops=dict(color='gray', linewidth=1.5),
+                           flierprops=dict(marker='o', markersize=8, 
+                                           markerfacecolor='red', alpha=0.6))
+    
+    ax2_graph.set_title('📦 BOXPLOT - DISPERSÃO', fontsize=14, fontweight='bold', pad=10)
+    ax2_graph.set_ylabel('Valor (R$)', fontsize=11)
+    ax2_graph.set_xticklabels(['Valores dos Pedidos'])
+    ax2_graph.grid(True, alpha=0.3)
+    
+    # Adicionar estatísticas no boxplot
+    ax2_graph.text(0.05, 0.95, f'Q1: {formatar_reais(Q1)}',
+                  transform=ax2_graph.transAxes, fontsize=9, fontweight='bold',
+                  bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    ax2_graph.text(0.05, 0.88, f'Q3: {formatar_reais(Q3)}',
+                  transform=ax2_graph.transAxes, fontsize=9, fontweight='bold',
+                  bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    
+    # Descrição do Boxplot
+    ax2_desc.axis('off')
+    desc_text2 = """
             📋 GRÁFICO 2: BOXPLOT
             
             🎯 O QUE ESTE GRÁFICO MOSTRA:
@@ -424,15 +593,15 @@ try:
             • Q3: 75% dos valores são menores
             • IQR = Q3 - Q1 (dispersão central)
             """
-            
-            ax2_desc.text(0, 1, desc_text2, transform=ax2_desc.transAxes, fontsize=10,
-                         verticalalignment='top', fontfamily='monospace',
-                         bbox=dict(boxstyle='round', facecolor='#FFF0F0', alpha=0.9, edgecolor='red'))
-            
-            # ANÁLISE DETALHADA DE DISPERSÃO E OUTLIERS
-            ax2_analise.axis('off')
-            
-            analise_text2 = f"""
+    
+    ax2_desc.text(0, 1, desc_text2, transform=ax2_desc.transAxes, fontsize=10,
+                 verticalalignment='top', fontfamily='monospace',
+                 bbox=dict(boxstyle='round', facecolor='#FFF0F0', alpha=0.9, edgecolor='red'))
+    
+    # ANÁLISE DETALHADA DE DISPERSÃO E OUTLIERS
+    ax2_analise.axis('off')
+    
+    analise_text2 = f"""
             🔍 ANÁLISE: DISPERSÃO E OUTLIERS
             
             📊 MEDIDAS DE DISPERSÃO:
@@ -459,66 +628,69 @@ try:
             {"🚨 ALERTA: Alta variabilidade pode indicar múltiplos perfis de cliente!" 
              if cv_vendas > 50 else "✅ Variabilidade dentro dos limites esperados."}
             """
-            
-            # Cor para análise de variabilidade (a mais crítica)
-            cor_critica = analise_variabilidade['cor'] if cv_vendas > 30 else analise_outliers['cor']
-            cor_fundo2 = {
-                'green': '#E8F6F3',
-                'orange': '#FFF3E0',
-                'red': '#FFEBEE',
-                'darkred': '#FCE4EC'
-            }.get(cor_critica, '#F5F5F5')
-            
-            ax2_analise.text(0, 1, analise_text2, transform=ax2_analise.transAxes, fontsize=9.5,
-                           verticalalignment='top', fontfamily='monospace',
-                           bbox=dict(boxstyle='round', facecolor=cor_fundo2, alpha=0.9, 
-                                   edgecolor=cor_critica))
-            
-            # Remover o quarto subplot não usado
-            fig2.delaxes(_)
-            
-            plt.tight_layout()
-            
-            # Salvar a figura 2
-            nome_arquivo2 = '02_boxplot_com_analise.png'
-            caminho_completo2 = os.path.join(diretorio_atual, nome_arquivo2)
-            fig2.savefig(caminho_completo2, dpi=300, bbox_inches='tight', facecolor='white')
-            arquivos_salvos.append(nome_arquivo2)
-            print(f"✅ Figura 2 salva como: {nome_arquivo2}")
-            plt.show()
-            plt.close(fig2)
-            
-            # ============================================================================
-            # 3. TERCEIRA FIGURA: TENDÊNCIA CENTRAL COMPARATIVA
-            # ============================================================================
-            fig3, ((ax3_graph, ax3_desc), (ax3_analise, _)) = plt.subplots(2, 2, figsize=(16, 10))
-            fig3.suptitle('VISUALIZAÇÃO 3: TENDÊNCIA CENTRAL - COMPARAÇÃO DETALHADA', 
-                         fontsize=16, fontweight='bold', y=0.98)
-            
-            # Gráfico de Barras
-            medidas = ['MÉDIA', 'MEDIANA', 'MODA']
-            valores = [media_vendas, mediana_vendas, moda_valor]
-            cores = ['#FF6B6B', '#4ECDC4', '#45B7D1']
-            
-            bars = ax3_graph.bar(medidas, valores, color=cores, edgecolor='black', 
-                               linewidth=1.5, alpha=0.8)
-            
-            ax3_graph.set_title('📈 MEDIDAS DE TENDÊNCIA CENTRAL', 
-                              fontsize=14, fontweight='bold', pad=10)
-            ax3_graph.set_ylabel('Valor (R$)', fontsize=11)
-            
-            # Adicionar valores nas barras
-            for bar, valor, medida in zip(bars, valores, medidas):
-                height = bar.get_height()
-                ax3_graph.text(bar.get_x() + bar.get_width()/2., height + 0.01*max(valores),
-                             f'{formatar_reais(valor)}',
-                             ha='center', va='bottom', fontsize=11, fontweight='bold')
-            
-            ax3_graph.grid(True, alpha=0.3, axis='y')
-            
-            # Descrição das Medidas
-            ax3_desc.axis('off')
-            desc_text3 = """
+    
+    # Cor para análise de variabilidade (a mais crítica)
+    cor_critica = analise_variabilidade['cor'] if cv_vendas > 30 else analise_outliers['cor']
+    cor_fundo2 = {
+        'green': '#E8F6F3',
+        'orange': '#FFF3E0',
+        'red': '#FFEBEE',
+        'darkred': '#FCE4EC'
+    }.get(cor_critica, '#F5F5F5')
+    
+    ax2_analise.text(0, 1, analise_text2, transform=ax2_analise.transAxes, fontsize=9.5,
+                   verticalalignment='top', fontfamily='monospace',
+                   bbox=dict(boxstyle='round', facecolor=cor_fundo2, alpha=0.9, 
+                           edgecolor=cor_critica))
+    
+    # Remover o quarto subplot não usado
+    fig2.delaxes(_)
+    
+    plt.tight_layout()
+
+    fig2.savefig(caminho, dpi=300, bbox_inches='tight', facecolor='white')
+    if mostrar:
+        plt.show()
+    plt.close(fig2)
+
+def gerar_figura_tendencia_central(contexto, caminho, mostrar=False):
+    """Figura 3: comparação das medidas de tendência central"""
+    carregar_bibliotecas_graficas()
+    medidas = contexto['medidas']
+    analises = contexto['analises']
+    media_vendas = medidas['media']
+    mediana_vendas = medidas['mediana']
+    moda_valor = medidas['moda']
+    analise_media_mediana = analises['media_mediana']
+
+    fig3, ((ax3_graph, ax3_desc), (ax3_analise, _)) = plt.subplots(2, 2, figsize=(16, 10))
+    fig3.suptitle('VISUALIZAÇÃO 3: TENDÊNCIA CENTRAL - COMPARAÇÃO DETALHADA', 
+                 fontsize=16, fontweight='bold', y=0.98)
+    
+    # Gráfico de Barras
+    medidas = ['MÉDIA', 'MEDIANA', 'MODA']
+    valores = [media_vendas, mediana_vendas, moda_valor]
+    cores = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+    
+    bars = ax3_graph.bar(medidas, valores, color=cores, edgecolor='black', 
+                       linewidth=1.5, alpha=0.8)
+    
+    ax3_graph.set_title('📈 MEDIDAS DE TENDÊNCIA CENTRAL', 
+                      fontsize=14, fontweight='bold', pad=10)
+    ax3_graph.set_ylabel('Valor (R$)', fontsize=11)
+    
+    # Adicionar valores nas barras
+    for bar, valor, medida in zip(bars, valores, medidas):
+        height = bar.get_height()
+        ax3_graph.text(bar.get_x() + bar.get_width()/2., height + 0.01*max(valores),
+                     f'{formatar_reais(valor)}',
+                     ha='center', va='bottom', fontsize=11, fontweight='bold')
+    
+    ax3_graph.grid(True, alpha=0.3, axis='y')
+    
+    # Descrição das Medidas
+    ax3_desc.axis('off')
+    desc_text3 = """
             📋 GRÁFICO 3: TENDÊNCIA CENTRAL
             
             🎯 O QUE ESTE GRÁFICO MOSTRA:
@@ -540,19 +712,19 @@ try:
             • Valor que mais se repete
             • Mostra padrão mais frequente
             """
-            
-            ax3_desc.text(0, 1, desc_text3, transform=ax3_desc.transAxes, fontsize=10,
-                         verticalalignment='top', fontfamily='monospace',
-                         bbox=dict(boxstyle='round', facecolor='#F0FFF4', alpha=0.9, edgecolor='green'))
-            
-            # ANÁLISE COMPARATIVA DETALHADA
-            ax3_analise.axis('off')
-            
-            # Calcular relações entre as medidas
-            dif_media_mediana = ((media_vendas - mediana_vendas) / mediana_vendas) * 100
-            dif_media_moda = ((media_vendas - moda_valor) / moda_valor) * 100 if moda_valor > 0 else 0
-            
-            analise_text3 = f"""
+    
+    ax3_desc.text(0, 1, desc_text3, transform=ax3_desc.transAxes, fontsize=10,
+                 verticalalignment='top', fontfamily='monospace',
+                 bbox=dict(boxstyle='round', facecolor='#F0FFF4', alpha=0.9, edgecolor='green'))
+    
+    # ANÁLISE COMPARATIVA DETALHADA
+    ax3_analise.axis('off')
+    
+    # Calcular relações entre as medidas
+    dif_media_mediana = ((media_vendas - mediana_vendas) / mediana_vendas) * 100
+    dif_media_moda = ((media_vendas - moda_valor) / moda_valor) * 100 if moda_valor > 0 else 0
+    
+    analise_text3 = f"""
             🔍 ANÁLISE COMPARATIVA DETALHADA
             
             📊 RELAÇÕES ENTRE AS MEDIDAS:
@@ -581,90 +753,93 @@ try:
              else "⚠️ Use a MEDIANA como referência mais confiável" 
              if dif_media_mediana < 30 else "🚨 Use a MEDIANA, a média está muito distorcida!"}
             """
-            
-            # Determinar cor baseada na maior diferença
-            maior_dif = max(abs(dif_media_mediana), abs(dif_media_moda))
-            if maior_dif < 15:
-                cor_analise = 'green'
-                cor_fundo3 = '#E8F6F3'
-            elif maior_dif < 30:
-                cor_analise = 'orange'
-                cor_fundo3 = '#FFF3E0'
-            else:
-                cor_analise = 'red'
-                cor_fundo3 = '#FFEBEE'
-            
-            ax3_analise.text(0, 1, analise_text3, transform=ax3_analise.transAxes, fontsize=9.5,
-                           verticalalignment='top', fontfamily='monospace',
-                           bbox=dict(boxstyle='round', facecolor=cor_fundo3, alpha=0.9, 
-                                   edgecolor=cor_analise))
-            
-            # Remover o quarto subplot não usado
-            fig3.delaxes(_)
-            
-            plt.tight_layout()
-            
-            # Salvar a figura 3
-            nome_arquivo3 = '03_tendencia_central_com_analise.png'
-            caminho_completo3 = os.path.join(diretorio_atual, nome_arquivo3)
-            fig3.savefig(caminho_completo3, dpi=300, bbox_inches='tight', facecolor='white')
-            arquivos_salvos.append(nome_arquivo3)
-            print(f"✅ Figura 3 salva como: {nome_arquivo3}")
-            plt.show()
-            plt.close(fig3)
-            
-            # ============================================================================
-            # 4. QUARTA FIGURA: FORMA DA DISTRIBUIÇÃO
-            # ============================================================================
-            fig4, ((ax4_graph, ax4_desc), (ax4_analise, _)) = plt.subplots(2, 2, figsize=(16, 10))
-            fig4.suptitle('VISUALIZAÇÃO 4: FORMA DA DISTRIBUIÇÃO - ASSIMETRIA E CURTOSE', 
-                         fontsize=16, fontweight='bold', y=0.98)
-            
-            # Gráfico de Pizza
-            if -0.5 <= assimetria <= 0.5:
-                simetria_class = 'SIMÉTRICA'
-                simetria_cor = '#2ECC71'
-                simetria_icon = '⚖️'
-            elif assimetria > 0.5:
-                simetria_class = 'POSITIVA'
-                simetria_cor = '#E74C3C'
-                simetria_icon = '↗️'
-            else:
-                simetria_class = 'NEGATIVA'
-                simetria_cor = '#3498DB'
-                simetria_icon = '↙️'
-            
-            if curtose > 0:
-                curtose_class = 'LEPTOCÚRTICA'
-                curtose_cor = '#F39C12'
-                curtose_icon = '📈'
-            elif curtose < 0:
-                curtose_class = 'PLATICÚRTICA'
-                curtose_cor = '#9B59B6'
-                curtose_icon = '📉'
-            else:
-                curtose_class = 'MESOCÚRTICA'
-                curtose_cor = '#1ABC9C'
-                curtose_icon = '📊'
-            
-            labels = [f'ASSIMETRIA\n{simetria_icon}', f'CURTOSE\n{curtose_icon}']
-            sizes = [abs(assimetria) + 1, abs(curtose) + 1]
-            colors = [simetria_cor, curtose_cor]
-            
-            wedges, texts, autotexts = ax4_graph.pie(sizes, labels=labels, colors=colors,
-                                                    autopct='%1.1f%%', startangle=90,
-                                                    textprops=dict(fontsize=10, fontweight='bold'))
-            
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-            
-            ax4_graph.set_title('🥧 FORMA DA DISTRIBUIÇÃO', 
-                              fontsize=14, fontweight='bold', pad=10)
-            
-            # Descrição da Forma
-            ax4_desc.axis('off')
-            desc_text4 = """
+    
+    # Determinar cor baseada na maior diferença
+    maior_dif = max(abs(dif_media_mediana), abs(dif_media_moda))
+    if maior_dif < 15:
+        cor_analise = 'green'
+        cor_fundo3 = '#E8F6F3'
+    elif maior_dif < 30:
+        cor_analise = 'orange'
+        cor_fundo3 = '#FFF3E0'
+    else:
+        cor_analise = 'red'
+        cor_fundo3 = '#FFEBEE'
+    
+    ax3_analise.text(0, 1, analise_text3, transform=ax3_analise.transAxes, fontsize=9.5,
+                   verticalalignment='top', fontfamily='monospace',
+                   bbox=dict(boxstyle='round', facecolor=cor_fundo3, alpha=0.9, 
+                           edgecolor=cor_analise))
+    
+    # Remover o quarto subplot não usado
+    fig3.delaxes(_)
+    
+    plt.tight_layout()
+
+    fig3.savefig(caminho, dpi=300, bbox_inches='tight', facecolor='white')
+    if mostrar:
+        plt.show()
+    plt.close(fig3)
+
+def gerar_figura_forma_distribuicao(contexto, caminho, mostrar=False):
+    """Figura 4: forma da distribuição (assimetria e curtose)"""
+    carregar_bibliotecas_graficas()
+    medidas = contexto['medidas']
+    analises = contexto['analises']
+    assimetria = medidas['assimetria']
+    curtose = medidas['curtose']
+    analise_assimetria = analises['assimetria']
+    analise_curtose = analises['curtose']
+
+    fig4, ((ax4_graph, ax4_desc), (ax4_analise, _)) = plt.subplots(2, 2, figsize=(16, 10))
+    fig4.suptitle('VISUALIZAÇÃO 4: FORMA DA DISTRIBUIÇÃO - ASSIMETRIA E CURTOSE', 
+                 fontsize=16, fontweight='bold', y=0.98)
+    
+    # Gráfico de Pizza
+    if -0.5 <= assimetria <= 0.5:
+        simetria_class = 'SIMÉTRICA'
+        simetria_cor = '#2ECC71'
+        simetria_icon = '⚖️'
+    elif assimetria > 0.5:
+        simetria_class = 'POSITIVA'
+        simetria_cor = '#E74C3C'
+        simetria_icon = '↗️'
+    else:
+        simetria_class = 'NEGATIVA'
+        simetria_cor = '#3498DB'
+        simetria_icon = '↙️'
+    
+    if curtose > 0:
+        curtose_class = 'LEPTOCÚRTICA'
+        curtose_cor = '#F39C12'
+        curtose_icon = '📈'
+    elif curtose < 0:
+        curtose_class = 'PLATICÚRTICA'
+        curtose_cor = '#9B59B6'
+        curtose_icon = '📉'
+    else:
+        curtose_class = 'MESOCÚRTICA'
+        curtose_cor = '#1ABC9C'
+        curtose_icon = '📊'
+    
+    labels = [f'ASSIMETRIA\n{simetria_icon}', f'CURTOSE\n{curtose_icon}']
+    sizes = [abs(assimetria) + 1, abs(curtose) + 1]
+    colors = [simetria_cor, curtose_cor]
+    
+    wedges, texts, autotexts = ax4_graph.pie(sizes, labels=labels, colors=colors,
+                                            autopct='%1.1f%%', startangle=90,
+                                            textprops=dict(fontsize=10, fontweight='bold'))
+    
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+    
+    ax4_graph.set_title('🥧 FORMA DA DISTRIBUIÇÃO', 
+                      fontsize=14, fontweight='bold', pad=10)
+    
+    # Descrição da Forma
+    ax4_desc.axis('off')
+    desc_text4 = """
             📋 GRÁFICO 4: FORMA DA DISTRIBUIÇÃO
             
             🎯 O QUE ESTE GRÁFICO MOSTRA:
@@ -683,19 +858,19 @@ try:
             • Platicúrtica: pico baixo
             • Mesocúrtica: normal
             """
-            
-            ax4_desc.text(0, 1, desc_text4, transform=ax4_desc.transAxes, fontsize=10,
-                         verticalalignment='top', fontfamily='monospace',
-                         bbox=dict(boxstyle='round', facecolor='#FDF0FF', alpha=0.9, edgecolor='purple'))
-            
-            # ANÁLISE DETALHADA DA FORMA
-            ax4_analise.axis('off')
-            
-            # Determinar impacto combinado
-            impacto_assimetria = "significativo" if abs(assimetria) > 0.5 else "moderado"
-            impacto_curtose = "importante" if abs(curtose) > 0.5 else "limitado"
-            
-            analise_text4 = f"""
+    
+    ax4_desc.text(0, 1, desc_text4, transform=ax4_desc.transAxes, fontsize=10,
+                 verticalalignment='top', fontfamily='monospace',
+                 bbox=dict(boxstyle='round', facecolor='#FDF0FF', alpha=0.9, edgecolor='purple'))
+    
+    # ANÁLISE DETALHADA DA FORMA
+    ax4_analise.axis('off')
+    
+    # Determinar impacto combinado
+    impacto_assimetria = "significativo" if abs(assimetria) > 0.5 else "moderado"
+    impacto_curtose = "importante" if abs(curtose) > 0.5 else "limitado"
+    
+    analise_text4 = f"""
             🔍 ANÁLISE DETALHADA DA FORMA
             
             📊 VALORES CALCULADOS:
@@ -734,124 +909,128 @@ try:
             {"✅ Forma adequada para análise estatística padrão" 
              if abs(assimetria) < 0.5 and abs(curtose) < 0.5 else "⚠️ Forma requer cuidados na análise"}
             """
-            
-            # Cor baseada na assimetria (geralmente mais impactante)
-            cor_analise4 = analise_assimetria['cor']
-            cor_fundo4 = {
-                'green': '#E8F6F3',
-                'orange': '#FFF3E0',
-                'red': '#FFEBEE'
-            }.get(cor_analise4, '#F5F5F5')
-            
-            ax4_analise.text(0, 1, analise_text4, transform=ax4_analise.transAxes, fontsize=9.5,
-                           verticalalignment='top', fontfamily='monospace',
-                           bbox=dict(boxstyle='round', facecolor=cor_fundo4, alpha=0.9, 
-                                   edgecolor=cor_analise4))
-            
-            # Remover o quarto subplot não usado
-            fig4.delaxes(_)
-            
-            plt.tight_layout()
-            
-            # Salvar a figura 4
-            nome_arquivo4 = '04_forma_distribuicao_com_analise.png'
-            caminho_completo4 = os.path.join(diretorio_atual, nome_arquivo4)
-            fig4.savefig(caminho_completo4, dpi=300, bbox_inches='tight', facecolor='white')
-            arquivos_salvos.append(nome_arquivo4)
-            print(f"✅ Figura 4 salva como: {nome_arquivo4}")
-            plt.show()
-            plt.close(fig4)
-            
-            # ============================================================================
-            # 5. QUINTA FIGURA: RESUMO ESTATÍSTICO COMPLETO
-            # ============================================================================
-            fig5, (ax5_table, ax5_analise) = plt.subplots(1, 2, figsize=(18, 10))
-            fig5.suptitle('VISUALIZAÇÃO 5: RESUMO ESTATÍSTICO COMPLETO COM ANÁLISE', 
-                         fontsize=16, fontweight='bold', y=0.98)
-            
-            # Tabela de Resumo
-            ax5_table.axis('tight')
-            ax5_table.axis('off')
-            
-            # Criar dados para a tabela com status coloridos
-            estatisticas = [
-                ["📊 DADOS GERAIS", "", ""],
-                ["Nº de Pedidos", f"{len(dados_valor_total):,}".replace(',', '.'), "📋"],
-                ["", "", ""],
-                ["🎯 TENDÊNCIA CENTRAL", "", ""],
-                ["Média", formatar_reais(media_vendas), analise_media_mediana['status'][:1]],
-                ["Mediana", formatar_reais(mediana_vendas), analise_media_mediana['status'][:1]],
-                ["Moda", formatar_reais(moda_valor), "📊"],
-                ["", "", ""],
-                ["📈 DISPERSÃO", "", ""],
-                ["Desvio Padrão", formatar_reais(desvio_padrao_vendas), "📏"],
-                ["Coef. Variação", f"{cv_vendas:.1f}%", analise_variabilidade['status'][:1]],
-                ["", "", ""],
-                ["🔍 FORMA", "", ""],
-                ["Assimetria", f"{assimetria:.3f}", analise_assimetria['status'][:1]],
-                ["Curtose", f"{curtose:.3f}", analise_curtose['status'][:1]],
-                ["", "", ""],
-                ["💰 VALORES EXTREMOS", "", ""],
-                ["Mínimo", formatar_reais(dados_valor_total.min()), "📉"],
-                ["Máximo", formatar_reais(dados_valor_total.max()), "📈"],
-                ["Amplitude", formatar_reais(dados_valor_total.max()-dados_valor_total.min()), analise_faixa['status'][:1]],
-                ["", "", ""],
-                ["⚠️ OUTLIERS", "", ""],
-                ["Detectados", f"{n_outliers}", analise_outliers['status'][:1]],
-                ["Percentual", f"{(n_outliers/len(dados_valor_total)*100):.1f}%", analise_outliers['status'][:1]]
-            ]
-            
-            # Criar tabela
-            tabela = ax5_table.table(cellText=estatisticas, 
-                                    cellLoc='left', 
-                                    colWidths=[0.25, 0.20, 0.05],
-                                    loc='center',
-                                    cellColours=[['#F8F9F9', '#FFFFFF', '#F0F0F0']] * len(estatisticas))
-            
-            tabela.auto_set_font_size(False)
-            tabela.set_fontsize(10)
-            tabela.scale(1, 1.8)
-            
-            # Colorir células baseado nas análises
-            for i, (label, valor, status) in enumerate(estatisticas):
-                if "Média" in label or "Mediana" in label:
-                    tabela[(i, 2)].set_facecolor(analise_media_mediana['cor'])
-                elif "Coef. Variação" in label:
-                    tabela[(i, 2)].set_facecolor(analise_variabilidade['cor'])
-                elif "Assimetria" in label:
-                    tabela[(i, 2)].set_facecolor(analise_assimetria['cor'])
-                elif "Curtose" in label:
-                    tabela[(i, 2)].set_facecolor(analise_curtose['cor'])
-                elif "Amplitude" in label:
-                    tabela[(i, 2)].set_facecolor(analise_faixa['cor'])
-                elif "Detectados" in label or "Percentual" in label:
-                    tabela[(i, 2)].set_facecolor(analise_outliers['cor'])
-                elif any(x in label for x in ["DADOS", "TENDÊNCIA", "DISPERSÃO", "FORMA", "VALORES", "OUTLIERS"]):
-                    tabela[(i, 0)].set_facecolor('#34495E')
-                    tabela[(i, 0)].set_text_props(color='white', weight='bold', fontsize=11)
-                    tabela[(i, 1)].set_facecolor('#34495E')
-                    tabela[(i, 2)].set_facecolor('#34495E')
-            
-            ax5_table.set_title('📋 RESUMO ESTATÍSTICO NUMÉRICO', 
-                              fontsize=14, fontweight='bold', pad=20, y=1.02)
-            
-            # ANÁLISE FINAL CONSOLIDADA
-            ax5_analise.axis('off')
-            
-            # Determinar avaliação geral
-            problemas = []
-            if analise_media_mediana['cor'] in ['orange', 'red', 'darkred']:
-                problemas.append("Relação média-mediana")
-            if analise_variabilidade['cor'] in ['orange', 'red', 'darkred']:
-                problemas.append("Variabilidade")
-            if analise_assimetria['cor'] in ['orange', 'red', 'darkred']:
-                problemas.append("Assimetria")
-            if analise_outliers['cor'] in ['orange', 'red', 'darkred']:
-                problemas.append("Outliers")
-            
-            avaliacao_geral = "EXCELENTE" if len(problemas) == 0 else "BOA" if len(problemas) <= 1 else "REGULAR" if len(problemas) <= 2 else "CRÍTICA"
-            
-            analise_text5 = f"""
+    
+    # Cor baseada na assimetria (geralmente mais impactante)
+    cor_analise4 = analise_assimetria['cor']
+    cor_fundo4 = {
+        'green': '#E8F6F3',
+        'orange': '#FFF3E0',
+        'red': '#FFEBEE'
+    }.get(cor_analise4, '#F5F5F5')
+    
+    ax4_analise.text(0, 1, analise_text4, transform=ax4_analise.transAxes, fontsize=9.5,
+                   verticalalignment='top', fontfamily='monospace',
+                   bbox=dict(boxstyle='round', facecolor=cor_fundo4, alpha=0.9, 
+                           edgecolor=cor_analise4))
+    
+    # Remover o quarto subplot não usado
+    fig4.delaxes(_)
+    
+    plt.tight_layout()
+
+    fig4.savefig(caminho, dpi=300, bbox_inches='tight', facecolor='white')
+    if mostrar:
+        plt.show()
+    plt.close(fig4)
+
+def gerar_figura_resumo_completo(contexto, caminho, mostrar=False):
+    """Figura 5: tabela-resumo e análise final consolidada"""
+    carregar_bibliotecas_graficas()
+    medidas = contexto['medidas']
+    analises = contexto['analises']
+    dados_valor_total = contexto['dados']
+    media_vendas = medidas['media']
+    mediana_vendas = medidas['mediana']
+    moda_valor = medidas['moda']
+    desvio_padrao_vendas = medidas['desvio_padrao']
+    cv_vendas = medidas['cv']
+    assimetria = medidas['assimetria']
+    curtose = medidas['curtose']
+    n_outliers = medidas['n_outliers']
+    analise_media_mediana = analises['media_mediana']
+    analise_variabilidade = analises['variabilidade']
+    analise_assimetria = analises['assimetria']
+    analise_curtose = analises['curtose']
+    analise_outliers = analises['outliers']
+    analise_faixa = analises['faixa']
+
+    fig5, (ax5_table, ax5_analise) = plt.subplots(1, 2, figsize=(18, 10))
+    fig5.suptitle('VISUALIZAÇÃO 5: RESUMO ESTATÍSTICO COMPLETO COM ANÁLISE', 
+                 fontsize=16, fontweight='bold', y=0.98)
+    
+    # Tabela de Resumo
+    ax5_table.axis('tight')
+    ax5_table.axis('off')
+    
+    # Criar dados para a tabela com status coloridos
+    estatisticas = [
+        ["📊 DADOS GERAIS", "", ""],
+        ["Nº de Pedidos", f"{len(dados_valor_total):,}".replace(',', '.'), "📋"],
+        ["", "", ""],
+        ["🎯 TENDÊNCIA CENTRAL", "", ""],
+        ["Média", formatar_reais(media_vendas), analise_media_mediana['status'][:1]],
+        ["Mediana", formatar_reais(mediana_vendas), analise_media_mediana['status'][:1]],
+        ["Moda", formatar_reais(moda_valor), "📊"],
+        ["", "", ""],
+        ["📈 DISPERSÃO", "", ""],
+        ["Desvio Padrão", formatar_reais(desvio_padrao_vendas), "📏"],
+        ["Coef. Variação", f"{cv_vendas:.1f}%", analise_variabilidade['status'][:1]],
+        ["", "", ""],
+        ["🔍 FORMA", "", ""],
+        ["Assimetria", f"{assimetria:.3f}", analise_assimetria['status'][:1]],
+        ["Curtose", f"{curtose:.3f}", analise_curtose['status'][:1]],
+        ["", "", ""],
+        ["💰 VALORES EXTREMOS", "", ""],
+        ["Mínimo", formatar_reais(dados_valor_total.min()), "📉"],
+        ["Máximo", formatar_reais(dados_valor_total.max()), "📈"],
+        ["Amplitude", formatar_reais(dados_valor_total.max()-dados_valor_total.min()), analise_faixa['status'][:1]],
+        ["", "", ""],
+        ["⚠️ OUTLIERS", "", ""],
+        ["Detectados", f"{n_outliers}", analise_outliers['status'][:1]],
+        ["Percentual", f"{(n_outliers/len(dados_valor_total)*100):.1f}%", analise_outliers['status'][:1]]
+    ]
+    
+    # Criar tabela
+    tabela = ax5_table.table(cellText=estatisticas, 
+                            cellLoc='left', 
+                            colWidths=[0.25, 0.20, 0.05],
+                            loc='center',
+                            cellColours=[['#F8F9F9', '#FFFFFF', '#F0F0F0']] * len(estatisticas))
+    
+    tabela.auto_set_font_size(False)
+    tabela.set_fontsize(10)
+    tabela.scale(1, 1.8)
+    
+    # Colorir células baseado nas análises
+    for i, (label, valor, status) in enumerate(estatisticas):
+        if "Média" in label or "Mediana" in label:
+            tabela[(i, 2)].set_facecolor(analise_media_mediana['cor'])
+        elif "Coef. Variação" in label:
+            tabela[(i, 2)].set_facecolor(analise_variabilidade['cor'])
+        elif "Assimetria" in label:
+            tabela[(i, 2)].set_facecolor(analise_assimetria['cor'])
+        elif "Curtose" in label:
+            tabela[(i, 2)].set_facecolor(analise_curtose['cor'])
+        elif "Amplitude" in label:
+            tabela[(i, 2)].set_facecolor(analise_faixa['cor'])
+        elif "Detectados" in label or "Percentual" in label:
+            tabela[(i, 2)].set_facecolor(analise_outliers['cor'])
+        elif any(x in label for x in ["DADOS", "TENDÊNCIA", "DISPERSÃO", "FORMA", "VALORES", "OUTLIERS"]):
+            tabela[(i, 0)].set_facecolor('#34495E')
+            tabela[(i, 0)].set_text_props(color='white', weight='bold', fontsize=11)
+            tabela[(i, 1)].set_facecolor('#34495E')
+            tabela[(i, 2)].set_facecolor('#34495E')
+    
+    ax5_table.set_title('📋 RESUMO ESTATÍSTICO NUMÉRICO', 
+                      fontsize=14, fontweight='bold', pad=20, y=1.02)
+    
+    # ANÁLISE FINAL CONSOLIDADA
+    ax5_analise.axis('off')
+    
+    # Determinar avaliação geral
+    problemas, avaliacao_geral = avaliar_geral(analises)
+    
+    analise_text5 = f"""
             🔍 ANÁLISE FINAL CONSOLIDADA
             
             📊 AVALIAÇÃO GERAL: {avaliacao_geral}
@@ -899,115 +1078,369 @@ try:
             {"✅ Dados adequados para análise e decisão" if avaliacao_geral in ["EXCELENTE", "BOA"] 
              else "⚠️ Dados requerem atenção especial"}
             """
-            
-            # Cor baseada na avaliação geral
-            if avaliacao_geral == "EXCELENTE":
-                cor_geral = 'green'
-                cor_fundo5 = '#E8F6F3'
-            elif avaliacao_geral == "BOA":
-                cor_geral = 'lightgreen'
-                cor_fundo5 = '#F1F8E9'
-            elif avaliacao_geral == "REGULAR":
-                cor_geral = 'orange'
-                cor_fundo5 = '#FFF3E0'
-            else:
-                cor_geral = 'red'
-                cor_fundo5 = '#FFEBEE'
-            
-            ax5_analise.text(0, 1, analise_text5, transform=ax5_analise.transAxes, fontsize=10,
-                           verticalalignment='top', fontfamily='monospace',
-                           bbox=dict(boxstyle='round', facecolor=cor_fundo5, alpha=0.9, 
-                                   edgecolor=cor_geral, linewidth=2))
-            
-            plt.tight_layout()
-            
-            # Salvar a figura 5
-            nome_arquivo5 = '05_resumo_completo_com_analise.png'
-            caminho_completo5 = os.path.join(diretorio_atual, nome_arquivo5)
-            fig5.savefig(caminho_completo5, dpi=300, bbox_inches='tight', facecolor='white')
-            arquivos_salvos.append(nome_arquivo5)
-            print(f"✅ Figura 5 salva como: {nome_arquivo5}")
-            plt.show()
-            plt.close(fig5)
-            
-            # ============================================================================
-            # RESUMO FINAL NO CONSOLE COM ANÁLISE DETALHADA
-            # ============================================================================
-            print("\n" + "="*100)
-            print(" " * 35 + "📊 RELATÓRIO ANALÍTICO DETALHADO")
-            print("="*100)
-            
-            print(f"\n📁 ARQUIVOS GERADOS:")
-            for i, arquivo in enumerate(arquivos_salvos, 1):
-                print(f"   {i:2d}. {arquivo}")
-            
-            print(f"\n🔍 ANÁLISE DETALHADA DOS RESULTADOS:")
-            print("-" * 50)
-            
-            print(f"\n1. RELAÇÃO MÉDIA-MEDIANA:")
-            print(f"   • Média: {formatar_reais(media_vendas)}")
-            print(f"   • Mediana: {formatar_reais(mediana_vendas)}")
-            dif_percent = abs((media_vendas - mediana_vendas) / mediana_vendas) * 100
-            print(f"   • Diferença: {dif_percent:.1f}%")
-            print(f"   • STATUS: {analise_media_mediana['status']}")
-            print(f"   • {analise_media_mediana['interpretacao']}")
-            if dif_percent > 30:
-                print(f"   🚨 ALERTA: A mediana dos valores é muito diferente da média!")
-                print(f"      Isso indica que valores extremos estão distorcendo a média.")
-                print(f"      Use a mediana ({formatar_reais(mediana_vendas)}) como referência mais confiável.")
-            
-            print(f"\n2. VARIABILIDADE DOS DADOS:")
-            print(f"   • Coeficiente de Variação: {cv_vendas:.1f}%")
-            print(f"   • STATUS: {analise_variabilidade['status']}")
-            print(f"   • {analise_variabilidade['interpretacao']}")
-            if cv_vendas > 50:
-                print(f"   ⚠️  ATENÇÃO: Variabilidade muito alta!")
-                print(f"      Considere segmentar a análise por faixa de valor.")
-            
-            print(f"\n3. FORMA DA DISTRIBUIÇÃO:")
-            print(f"   • Assimetria: {assimetria:.3f} ({analise_assimetria['status']})")
-            print(f"   • Curtose: {curtose:.3f} ({analise_curtose['status']})")
-            print(f"   • {analise_assimetria['interpretacao']}")
-            if abs(assimetria) > 1:
-                print(f"   🔍 OBSERVAÇÃO: Assimetria forte detectada.")
-                print(f"      Distribuição inclinada para valores {'altos' if assimetria > 0 else 'baixos'}.")
-            
-            print(f"\n4. OUTLIERS E VALORES ATÍPICOS:")
-            print(f"   • Outliers detectados: {n_outliers}")
-            print(f"   • Percentual: {(n_outliers/len(dados_valor_total)*100):.1f}%")
-            print(f"   • STATUS: {analise_outliers['status']}")
-            print(f"   • {analise_outliers['interpretacao']}")
-            if n_outliers > 0:
-                print(f"   📊 SUGESTÃO: Analisar separadamente os {n_outliers} valores atípicos.")
-            
-            print(f"\n5. FAIXA DE VALORES:")
-            print(f"   • Mínimo: {formatar_reais(dados_valor_total.min())}")
-            print(f"   • Máximo: {formatar_reais(dados_valor_total.max())}")
-            print(f"   • Amplitude: {formatar_reais(dados_valor_total.max()-dados_valor_total.min())}")
-            print(f"   • STATUS: {analise_faixa['status']}")
-            
-            print(f"\n🎯 AVALIAÇÃO FINAL: {avaliacao_geral}")
-            if len(problemas) > 0:
-                print(f"   • Pontos de atenção: {', '.join(problemas)}")
-            else:
-                print(f"   ✅ Todos os indicadores dentro do esperado")
-            
-            print(f"\n💡 RECOMENDAÇÕES PRINCIPAIS:")
-            print(f"   1. {analise_media_mediana['recomendacao']}")
-            print(f"   2. {analise_variabilidade['recomendacao']}")
-            if n_outliers > 0:
-                print(f"   3. {analise_outliers['recomendacao']}")
-            
-            print("\n" + "="*100)
-            print(f"✅ ANÁLISE COMPLETA - {len(arquivos_salvos)} IMAGENS SALVAS")
-            print(f"   📁 Diretório: {diretorio_atual}")
-            print("="*100)
-
-except FileNotFoundError:
-    print("❌ Erro: Arquivo 'orders.csv' não encontrado")
-    print("   Caminho especificado: ../aula9/orders.csv")
-    print("   Verifique se o arquivo existe no diretório correto")
-except Exception as e:
-    print(f"❌ Erro inesperado: {str(e)}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+    
+    # Cor baseada na avaliação geral
+    if avaliacao_geral == "EXCELENTE":
+        cor_geral = 'green'
+        cor_fundo5 = '#E8F6F3'
+    elif avaliacao_geral == "BOA":
+        cor_geral = 'lightgreen'
+        cor_fundo5 = '#F1F8E9'
+    elif avaliacao_geral == "REGULAR":
+        cor_geral = 'orange'
+        cor_fundo5 = '#FFF3E0'
+    else:
+        cor_geral = 'red'
+        cor_fundo5 = '#FFEBEE'
+    
+    ax5_analise.text(0, 1, analise_text5, transform=ax5_analise.transAxes, fontsize=10,
+                   verticalalignment='top', fontfamily='monospace',
+                   bbox=dict(boxstyle='round', facecolor=cor_fundo5, alpha=0.9, 
+                           edgecolor=cor_geral, linewidth=2))
+    
+    plt.tight_layout()
+
+    fig5.savefig(caminho, dpi=300, bbox_inches='tight', facecolor='white')
+    if mostrar:
+        plt.show()
+    plt.close(fig5)
+
+# Nome do arquivo e função de cada figura, na ordem do relatório
+FIGURAS = [
+    ('01_histograma_com_analise.png', gerar_figura_histograma),
+    ('02_boxplot_com_analise.png', gerar_figura_boxplot),
+    ('03_tendencia_central_com_analise.png', gerar_figura_tendencia_central),
+    ('04_forma_distribuicao_com_analise.png', gerar_figura_forma_distribuicao),
+    ('05_resumo_completo_com_analise.png', gerar_figura_resumo_completo),
+]
+
+# Contexto recebido por cada processo do pool (enviado uma vez por processo)
+_contexto_processo = None
+
+def _inicializar_processo(contexto=None):
+    global _contexto_processo
+    _contexto_processo = contexto
+    # Processos sem tela: renderizar sempre com o backend Agg
+    carregar_bibliotecas_graficas().switch_backend('Agg')
+
+def _gerar_figura_no_processo(indice, caminho, contexto=None):
+    FIGURAS[indice][1](_contexto_processo if contexto is None else contexto, caminho)
+    return caminho
+
+def gerar_figuras(contexto, diretorio, paralelo=True, processos=None, executor=None, prefixo=''):
+    """
+    Gera as cinco figuras do relatório e retorna os nomes dos arquivos salvos.
+
+    Args:
+        contexto (dict): Retorno de preparar_contexto().
+        diretorio (str): Pasta onde os PNGs serão salvos.
+        paralelo (bool): Se True, renderiza as figuras em processos separados.
+            Se False, gera uma por vez e exibe cada uma na tela.
+        processos (int, optional): Quantidade de processos (padrão: uma por
+            figura, limitado ao número de núcleos).
+        executor (ProcessPoolExecutor, optional): Pool já aberto, reaproveitado
+            entre relatórios (o contexto vai junto com cada figura).
+        prefixo (str): Prefixo dos nomes dos arquivos (ex.: 'Quantity_').
+    """
+    arquivos_salvos = []
+    nomes = [prefixo + nome_arquivo for nome_arquivo, _ in FIGURAS]
+
+    if not paralelo:
+        for numero, (nome_arquivo, (_, gerar_figura)) in enumerate(zip(nomes, FIGURAS), 1):
+            gerar_figura(contexto, os.path.join(diretorio, nome_arquivo), mostrar=True)
+            arquivos_salvos.append(nome_arquivo)
+            print(f"✅ Figura {numero} salva como: {nome_arquivo}")
+        return arquivos_salvos
+
+    caminhos = [os.path.join(diretorio, nome_arquivo) for nome_arquivo in nomes]
+    if executor is None:
+        processos = processos or min(len(FIGURAS), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=processos, initializer=_inicializar_processo,
+                                 initargs=(contexto,)) as executor_local:
+            futuros = [executor_local.submit(_gerar_figura_no_processo, indice, caminho)
+                       for indice, caminho in enumerate(caminhos)]
+            return _aguardar_figuras(nomes, futuros)
+
+    futuros = [executor.submit(_gerar_figura_no_processo, indice, caminho, contexto)
+               for indice, caminho in enumerate(caminhos)]
+    return _aguardar_figuras(nomes, futuros)
+
+def _aguardar_figuras(nomes, futuros):
+    arquivos_salvos = []
+    for numero, (nome_arquivo, futuro) in enumerate(zip(nomes, futuros), 1):
+        futuro.result()
+        arquivos_salvos.append(nome_arquivo)
+        print(f"✅ Figura {numero} salva como: {nome_arquivo}")
+    return arquivos_salvos
+
+# ============================================================================
+# RESUMO FINAL NO CONSOLE COM ANÁLISE DETALHADA
+# ============================================================================
+
+def imprimir_relatorio(contexto, arquivos_salvos, diretorio_atual):
+    """Imprime no console o relatório analítico com as interpretações"""
+    medidas = contexto['medidas']
+    analises = contexto['analises']
+    media_vendas = medidas['media']
+    mediana_vendas = medidas['mediana']
+    cv_vendas = medidas['cv']
+    assimetria = medidas['assimetria']
+    curtose = medidas['curtose']
+    n_outliers = medidas['n_outliers']
+    analise_media_mediana = analises['media_mediana']
+    analise_variabilidade = analises['variabilidade']
+    analise_assimetria = analises['assimetria']
+    analise_curtose = analises['curtose']
+    analise_outliers = analises['outliers']
+    analise_faixa = analises['faixa']
+    problemas, avaliacao_geral = avaliar_geral(analises)
+
+    print("\n" + "="*100)
+    print(" " * 35 + "📊 RELATÓRIO ANALÍTICO DETALHADO")
+    print("="*100)
+    
+    if arquivos_salvos:
+        print(f"\n📁 ARQUIVOS GERADOS:")
+        for i, arquivo in enumerate(arquivos_salvos, 1):
+            print(f"   {i:2d}. {arquivo}")
+    
+    print(f"\n🔍 ANÁLISE DETALHADA DOS RESULTADOS:")
+    print("-" * 50)
+    
+    print(f"\n1. RELAÇÃO MÉDIA-MEDIANA:")
+    print(f"   • Média: {formatar_reais(media_vendas)}")
+    print(f"   • Mediana: {formatar_reais(mediana_vendas)}")
+    dif_percent = abs((media_vendas - mediana_vendas) / mediana_vendas) * 100
+    print(f"   • Diferença: {dif_percent:.1f}%")
+    print(f"   • STATUS: {analise_media_mediana['status']}")
+    print(f"   • {analise_media_mediana['interpretacao']}")
+    if dif_percent > 30:
+        print(f"   🚨 ALERTA: A mediana dos valores é muito diferente da média!")
+        print(f"      Isso indica que valores extremos estão distorcendo a média.")
+        print(f"      Use a mediana ({formatar_reais(mediana_vendas)}) como referência mais confiável.")
+    
+    print(f"\n2. VARIABILIDADE DOS DADOS:")
+    print(f"   • Coeficiente de Variação: {cv_vendas:.1f}%")
+    print(f"   • STATUS: {analise_variabilidade['status']}")
+    print(f"   • {analise_variabilidade['interpretacao']}")
+    if cv_vendas > 50:
+        print(f"   ⚠️  ATENÇÃO: Variabilidade muito alta!")
+        print(f"      Considere segmentar a análise por faixa de valor.")
+    
+    print(f"\n3. FORMA DA DISTRIBUIÇÃO:")
+    print(f"   • Assimetria: {assimetria:.3f} ({analise_assimetria['status']})")
+    print(f"   • Curtose: {curtose:.3f} ({analise_curtose['status']})")
+    print(f"   • {analise_assimetria['interpretacao']}")
+    if abs(assimetria) > 1:
+        print(f"   🔍 OBSERVAÇÃO: Assimetria forte detectada.")
+        print(f"      Distribuição inclinada para valores {'altos' if assimetria > 0 else 'baixos'}.")
+    
+    print(f"\n4. OUTLIERS E VALORES ATÍPICOS:")
+    print(f"   • Outliers detectados: {n_outliers}")
+    print(f"   • Percentual: {(n_outliers/medidas['n']*100):.1f}%")
+    print(f"   • STATUS: {analise_outliers['status']}")
+    print(f"   • {analise_outliers['interpretacao']}")
+    if n_outliers > 0:
+        print(f"   📊 SUGESTÃO: Analisar separadamente os {n_outliers} valores atípicos.")
+    
+    print(f"\n5. FAIXA DE VALORES:")
+    print(f"   • Mínimo: {formatar_reais(medidas['minimo'])}")
+    print(f"   • Máximo: {formatar_reais(medidas['maximo'])}")
+    print(f"   • Amplitude: {formatar_reais(medidas['maximo']-medidas['minimo'])}")
+    print(f"   • STATUS: {analise_faixa['status']}")
+    
+    print(f"\n🎯 AVALIAÇÃO FINAL: {avaliacao_geral}")
+    if len(problemas) > 0:
+        print(f"   • Pontos de atenção: {', '.join(problemas)}")
+    else:
+        print(f"   ✅ Todos os indicadores dentro do esperado")
+    
+    print(f"\n💡 RECOMENDAÇÕES PRINCIPAIS:")
+    print(f"   1. {analise_media_mediana['recomendacao']}")
+    print(f"   2. {analise_variabilidade['recomendacao']}")
+    if n_outliers > 0:
+        print(f"   3. {analise_outliers['recomendacao']}")
+    
+    print("\n" + "="*100)
+    if arquivos_salvos:
+        print(f"✅ ANÁLISE COMPLETA - {len(arquivos_salvos)} IMAGENS SALVAS")
+        print(f"   📁 Diretório: {diretorio_atual}")
+    else:
+        print(f"✅ ANÁLISE COMPLETA (somente texto, nenhuma imagem gerada)")
+    print("="*100)
+
+
+# ============================================================================
+# MOTOR DE RELATÓRIOS (USO COMO MÓDULO)
+# ============================================================================
+# Exemplo:
+#     from Projetocsv import MotorRelatorio
+#     with MotorRelatorio(diretorio='saida') as motor:
+#         motor.gerar('../aula9/orders.csv', 'TotalAmount')
+#         motor.gerar('../aula9/orders.csv', 'ShippingCost')
+#         motor.gerar(outro_df, 'TotalAmount', prefixo='loja2_')
+
+def carregar_dados(fonte, coluna='TotalAmount'):
+    """
+    Lê a coluna de interesse de um CSV, DataFrame ou Series.
+
+    Returns:
+        tuple: (Series sem valores ausentes, caminho do CSV ou None)
+
+    Raises:
+        KeyError: Se a coluna não existir (a mensagem lista as disponíveis).
+    """
+    if isinstance(fonte, pd.Series):
+        return fonte.dropna(), None
+
+    if isinstance(fonte, pd.DataFrame):
+        if coluna not in fonte.columns:
+            raise KeyError(f"Coluna '{coluna}' não encontrada. Colunas disponíveis: {list(fonte.columns)}")
+        return fonte[coluna].dropna(), None
+
+    # Lê só a coluna usada no relatório (do cache colunar, se existir) e
+    # calcula as estatísticas em float64, mesmo que ela seja guardada em float32
+    dados = carregar_tabela(fonte, colunas=[coluna])[coluna].astype(np.float64)
+    return dados.dropna(), fonte
+
+def _carregar_dados_validos(fonte, coluna):
+    dados_valor_total, caminho_csv = carregar_dados(fonte, coluna)
+    if dados_valor_total.empty:
+        raise ValueError(f"Nenhum dado disponível na coluna '{coluna}'")
+    return dados_valor_total, caminho_csv
+
+def calcular_contexto(fonte, coluna='TotalAmount', com_dados=True):
+    """
+    Carrega os dados e calcula medidas e análises uma única vez.
+
+    Para CSVs, as medidas são reaproveitadas do cache enquanto o arquivo
+    não mudar.
+
+    Args:
+        com_dados (bool): Se False (relatório só em texto), o CSV só é lido
+            quando o cache não tiver as medidas e contexto['dados'] fica None.
+
+    Raises:
+        KeyError: Coluna inexistente.
+        ValueError: Coluna sem nenhum valor.
+    """
+    if not com_dados and isinstance(fonte, (str, os.PathLike)):
+        medidas_projeto = obter_medidas_em_cache(
+            fonte, f'projeto:{coluna}',
+            lambda: calcular_medidas_projeto(_carregar_dados_validos(fonte, coluna)[0]))
+        return preparar_contexto(None, medidas_projeto)
+
+    dados_valor_total, caminho_csv = _carregar_dados_validos(fonte, coluna)
+    if caminho_csv is not None:
+        medidas_projeto = obter_medidas_em_cache(caminho_csv, f'projeto:{coluna}',
+                                                 lambda: calcular_medidas_projeto(dados_valor_total))
+    else:
+        medidas_projeto = calcular_medidas_projeto(dados_valor_total)
+    return preparar_contexto(dados_valor_total, medidas_projeto)
+
+class MotorRelatorio:
+    """
+    Gera relatórios de várias colunas e arquivos no mesmo processo.
+
+    As bibliotecas de gráficos são importadas uma vez só e, no modo paralelo,
+    o mesmo pool de processos é reaproveitado por todos os relatórios.
+    """
+
+    def __init__(self, diretorio=None, paralelo=True, processos=None):
+        self.diretorio = diretorio or os.getcwd()
+        self.paralelo = paralelo
+        self.processos = processos or min(len(FIGURAS), os.cpu_count() or 1)
+        self._executor = None
+        os.makedirs(self.diretorio, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.fechar()
+
+    def fechar(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _obter_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.processos,
+                                                 initializer=_inicializar_processo)
+        return self._executor
+
+    def gerar(self, fonte, coluna='TotalAmount', prefixo=None, imprimir=True, figuras=True):
+        """
+        Gera as figuras (e, se imprimir=True, o relatório no console).
+
+        Args:
+            fonte (str | pd.DataFrame | pd.Series): CSV ou dados já carregados.
+            coluna (str): Coluna numérica analisada.
+            prefixo (str, optional): Prefixo dos arquivos. Padrão: nenhum para
+                'TotalAmount' e '<coluna>_' para as demais.
+            figuras (bool): Se False, só calcula as medidas (sem importar
+                matplotlib/seaborn nem abrir processos).
+
+        Returns:
+            tuple: (contexto, lista de arquivos salvos)
+        """
+        if prefixo is None:
+            prefixo = '' if coluna == 'TotalAmount' else f'{coluna}_'
+
+        contexto = calcular_contexto(fonte, coluna, com_dados=figuras)
+        arquivos_salvos = []
+        if figuras:
+            executor = self._obter_executor() if self.paralelo else None
+            arquivos_salvos = gerar_figuras(contexto, self.diretorio, paralelo=self.paralelo,
+                                            executor=executor, prefixo=prefixo)
+        if imprimir:
+            imprimir_relatorio(contexto, arquivos_salvos, self.diretorio)
+        return contexto, arquivos_salvos
+
+def gerar_relatorio(fonte, coluna='TotalAmount', diretorio=None, paralelo=True, processos=None,
+                    prefixo=None, imprimir=True, figuras=True):
+    """Atalho para gerar um único relatório (veja MotorRelatorio.gerar)."""
+    with MotorRelatorio(diretorio, paralelo=paralelo, processos=processos) as motor:
+        return motor.gerar(fonte, coluna, prefixo=prefixo, imprimir=imprimir, figuras=figuras)
+
+def main():
+    parser = argparse.ArgumentParser(description="Relatório estatístico dos valores dos pedidos")
+    parser.add_argument('--csv', default="../aula9/orders.csv",
+                        help="arquivo CSV de entrada (padrão: ../aula9/orders.csv)")
+    parser.add_argument('--coluna', nargs='+', default=['TotalAmount'],
+                        help="uma ou mais colunas numéricas a analisar (padrão: TotalAmount)")
+    parser.add_argument('--sequencial', action='store_true',
+                        help="gera as figuras uma por vez e exibe cada uma na tela")
+    parser.add_argument('--processos', type=int, default=None,
+                        help="quantidade de processos para gerar as figuras em paralelo")
+    parser.add_argument('--somente-texto', action='store_true',
+                        help="imprime só o relatório no console, sem gerar figuras")
+    args = parser.parse_args()
+
+    # Obter diretório atual para salvar as imagens
+    diretorio_atual = os.getcwd()
+    if not args.somente_texto:
+        print(f"📁 Diretório atual: {diretorio_atual}")
+        print(f"💾 As imagens serão salvas neste diretório")
+
+    try:
+        with MotorRelatorio(diretorio_atual, paralelo=not args.sequencial,
+                            processos=args.processos) as motor:
+            for coluna in args.coluna:
+                try:
+                    motor.gerar(args.csv, coluna, figuras=not args.somente_texto)
+                except (KeyError, ValueError) as erro:
+                    print(f"Erro: {erro.args[0]}")
+
+    except FileNotFoundError:
+        print(f"❌ Erro: Arquivo '{os.path.basename(args.csv)}' não encontrado")
+        print(f"   Caminho especificado: {args.csv}")
+        print("   Verifique se o arquivo existe no diretório correto")
+    except Exception as e:
+        print(f"❌ Erro inesperado: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
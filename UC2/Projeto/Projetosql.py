@@ -1,165 +1,226 @@
-import mysql.connector
+import argparse
+import os
+import sys
 
-def obter_dados_do_banco(query):
-    try:
-        conexao = mysql.connector.connect(
-            host="127.0.0.1",
-            user="root",
-            password="",
-            database="amazon"
-        )
-        cursor = conexao.cursor()
-        cursor.execute(query)
-        resultados = cursor.fetchall()
-        
-        # Obtém os nomes das colunas
-        colunas = [desc[0] for desc in cursor.description]
-        return resultados, colunas
-    except mysql.connector.Error as erro:
-        print(f"Erro ao conectar ao MySQL: {erro}")
-        return None, None
-    finally:
-        if 'conexao' in locals() and conexao.is_connected():
-            cursor.close()
-            conexao.close()
+# Pool de conexões compartilhado (UC2/aula7/banco.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aula7'))
+from banco import ErroBanco, TAMANHO_LOTE, obter_pool, fechar_pools
+from banco_local import usar_banco_local
+from cache_consultas import CacheConsultas
+from consultas_sql import ler_valores, obter_registro
+from exportacao import FORMATOS_EXPORTACAO, exportar_consulta, exportar_linhas
 
 def mostrar_menu():
+    # As opções vêm do Projeto/consultas.txt (veja consultas_sql.py)
+    registro = obter_registro()
     print("\n" + "="*60)
     print("SISTEMA DE CONSULTAS AO BANCO DE DADOS")
     print("="*60)
     print("\nEscolha uma consulta para executar:")
-    print("1. Pedidos com valor superior a 100")
-    print("2. Clientes de Nova York")
-    print("3. Pedidos com valor superior a 1000")
-    print("4. Total de pedidos por cliente (a partir de 2000)")
-    print("5. Total de pedidos por cliente com detalhes (a partir de 2000)")
-    print("6. Sair")
+    for consulta in registro:
+        padroes = ", ".join(f"{nome}={valor}" for nome, valor in consulta.parametros.items())
+        print(f"{consulta.numero}. {consulta.descricao}" + (f" [{padroes}]" if padroes else ""))
+    print(f"{len(registro) + 1}. Sair")
     print("-"*60)
 
-def obter_query_escolhida(opcao):
-    queries = {
-        1: """select orders.OrderID,
-orders.OrderDate,
-products.ProductName,
-orders.TotalAmount
-from orders
-join products on
-products.ProductID = orders.ProductID
-where orders.TotalAmount > 100
-order by TotalAmount""",
-        
-        2: """select customers.CustomerName,
-orders.OrderDate,
-products.Category,
-products.ProductName,
-customers.city
-from products
-join orders on
-products.ProductID = orders.ProductID
-join customers on
-orders.CustomerID = customers.CustomerID
-where customers.city = 'New York'""",
-        
-        3: """select customers.CustomerName,
-orders.OrderDate,
-products.ProductName,
-orders.PaymentMethod,
-orders.TotalAmount
-from products
-join orders on
-products.ProductID = orders.ProductID
-join customers on
-orders.CustomerID = customers.CustomerID
-where orders.TotalAmount > 1000""",
-        
-        4: """SELECT 
-    customers.CustomerName,
-    customers.City,
-    customers.State,
-    customers.Country,
-    Sum(orders.TotalAmount) AS TotalPedidos
-FROM customers
-JOIN orders ON orders.CustomerID = customers.CustomerID
-WHERE YEAR(orders.OrderDate) >= 2000
-GROUP BY 
-    customers.CustomerID,
-    customers.CustomerName,
-    customers.City,
-    customers.State,
-    customers.Country
-ORDER BY TotalPedidos DESC""",
-        
-        5: """SELECT 
-    customers.CustomerName,
-    customers.City,
-    customers.State,
-    customers.Country,
-    Sum(orders.TotalAmount) AS TotalPedidos
-FROM customers
-JOIN orders ON orders.CustomerID = customers.CustomerID
-WHERE YEAR(orders.OrderDate) >= 2000
-GROUP BY 
-    customers.CustomerID,
-    customers.CustomerName,
-    customers.City,
-    customers.State,
-    customers.Country
-ORDER BY TotalPedidos DESC"""
-    }
-    
-    return queries.get(opcao)
-
-def mostrar_resultados(resultados, colunas):
-    if resultados and colunas:
-        print(f"\n{'='*80}")
-        print(f"RESULTADOS DA CONSULTA ({len(resultados)} registros encontrados)")
-        print('='*80)
-        
-        # Mostra os nomes das colunas
-        print(" | ".join(colunas))
-        print("-"*80)
-        
-        # Mostra os dados
-        for linha in resultados:
-            # Formata cada valor para melhor visualização
-            linha_formatada = []
-            for valor in linha:
-                if valor is None:
-                    linha_formatada.append("NULL")
-                else:
-                    linha_formatada.append(str(valor))
-            print(" | ".join(linha_formatada))
-    elif resultados is None:
+def obter_query_escolhida(opcao, valores=None):
+    """
+    Retorna (sql, valores dos parâmetros) da consulta escolhida, com os
+    marcadores do banco em uso. Parâmetros que não vieram em "valores" são
+    perguntados; Enter mantém o valor padrão.
+    """
+    try:
+        consulta = obter_registro().obter(opcao)
+    except KeyError:
+        return None, None
+
+    escolhidos = {}
+    for nome, padrao in consulta.parametros.items():
+        if nome in (valores or {}):
+            try:
+                escolhidos[nome] = consulta.converter(nome, valores[nome])
+                continue
+            except ValueError as erro:
+                print(f"  {erro}")
+        while True:
+            resposta = input(f"  {nome} [{padrao}]: ").strip()
+            if not resposta:
+                break
+            try:
+                escolhidos[nome] = consulta.converter(nome, resposta)
+                break
+            except ValueError as erro:
+                print(f"  {erro}")
+    # O texto do comando não muda com os valores: o comando preparado é reaproveitado
+    return consulta.para_execucao(obter_pool('amazon').marcador, escolhidos)
+
+def formatar_linha(linha):
+    # Formata cada valor para melhor visualização
+    return " | ".join("NULL" if valor is None else str(valor) for valor in linha)
+
+def escrever_linhas(colunas, linhas, saida):
+    """Escreve cabeçalho e linhas conforme chegam; retorna quantas foram escritas."""
+    total = 0
+    for linha in linhas:
+        if total == 0:
+            print(f"\n{'='*80}", file=saida)
+            print("RESULTADOS DA CONSULTA", file=saida)
+            print('='*80, file=saida)
+            print(" | ".join(colunas), file=saida)
+            print("-"*80, file=saida)
+        print(formatar_linha(linha), file=saida)
+        total += 1
+    if total:
+        print("-"*80, file=saida)
+        print(f"{total} registros encontrados", file=saida)
+    return total
+
+def _guardando_no_cache(linhas, guardadas, limite):
+    # Repassa as linhas e guarda uma cópia enquanto couber no cache
+    for linha in linhas:
+        if len(guardadas) <= limite:
+            guardadas.append(linha)
+        yield linha
+
+def mostrar_resultados_em_fluxo(query, saida=None, tamanho_lote=TAMANHO_LOTE, cache=None, parametros=None):
+    """
+    Executa a consulta e escreve cada linha assim que ela chega do banco,
+    sem guardar o resultado inteiro na memória.
+
+    Args:
+        query (str): Consulta SQL.
+        saida (file, optional): Arquivo aberto para escrita (padrão: terminal).
+        tamanho_lote (int): Linhas buscadas por vez no banco.
+        cache (CacheConsultas, optional): Se a mesma consulta (após
+            normalizar o SQL) já estiver no cache, nem vai ao banco; senão o
+            resultado é guardado, desde que caiba em cache.max_linhas.
+        parametros (tuple, optional): Valores dos marcadores da consulta.
+
+    Returns:
+        int | None: Quantidade de registros, ou None se a consulta falhou.
+    """
+    saida = saida or sys.stdout
+
+    if cache is not None:
+        em_cache = cache.obter(query, parametros, banco=obter_pool('amazon').identidade)
+        if em_cache is not None:
+            resultados, colunas = em_cache
+            print("(resultado reaproveitado do cache)")
+            total = escrever_linhas(colunas, resultados, saida)
+            if not total:
+                print("\nNenhum resultado encontrado.")
+            return total
+
+    try:
+        with obter_pool('amazon').consultar_em_fluxo(query, parametros, tamanho_lote=tamanho_lote,
+                                                    preparada=True) as (colunas, linhas):
+            if cache is not None:
+                guardadas = []
+                linhas = _guardando_no_cache(linhas, guardadas, cache.max_linhas)
+            total = escrever_linhas(colunas, linhas, saida)
+    except ErroBanco as erro:
+        print(f"Erro no banco de dados: {erro}")
         print("\nNão foi possível executar a consulta.")
-    else:
+        return None
+
+    if cache is not None:
+        cache.guardar(query, guardadas, colunas, parametros, banco=obter_pool('amazon').identidade)
+    if not total:
         print("\nNenhum resultado encontrado.")
+    return total
+
+def exportar_resultados(query, destino, tamanho_lote=TAMANHO_LOTE, cache=None, parametros=None):
+    """
+    Grava o resultado da consulta em CSV ou Parquet (pela extensão do destino),
+    em lotes, com os tipos das colunas informados pelo banco.
+
+    Returns:
+        dict | None: Resumo da exportação, ou None se a consulta falhou.
+    """
+    em_cache = (cache.obter(query, parametros, banco=obter_pool('amazon').identidade)
+                if cache is not None else None)
+    try:
+        if em_cache is not None:
+            resultados, colunas = em_cache
+            print("(resultado reaproveitado do cache)")
+            info = exportar_linhas(colunas, resultados, destino, tamanho_lote=tamanho_lote)
+        else:
+            info = exportar_consulta(obter_pool('amazon'), query, destino, parametros=parametros,
+                                     tamanho_lote=tamanho_lote, preparada=True)
+    except ErroBanco as erro:
+        print(f"Erro no banco de dados: {erro}")
+        print("\nNão foi possível executar a consulta.")
+        return None
+
+    print(f"{info['linhas']} registros exportados para {info['arquivo']}")
+    print(f"Tempo: {info['segundos']:.2f} s ({info['linhas_por_segundo']:,.0f} linhas/s)")
+    return info
 
 def main():
+    parser = argparse.ArgumentParser(description="Consultas ao banco amazon")
+    parser.add_argument('--banco', choices=('mysql', 'local'), default='mysql',
+                        help="mysql (padrão) ou local: SQLite gerado a partir dos CSVs do UC2")
+    parser.add_argument('--param', action='append', default=[], metavar='NOME=VALOR',
+                        help="valor de um parâmetro das consultas (ex.: --param cidade=Miami); "
+                             "os que faltarem são perguntados")
+    parser.add_argument('--saida', default=None,
+                        help="arquivo onde os resultados são gravados (padrão: terminal)")
+    parser.add_argument('--exportar', choices=FORMATOS_EXPORTACAO, default=None,
+                        help="grava cada consulta em consulta<N>.csv ou .parquet em vez de mostrar")
+    parser.add_argument('--pasta-exportacao', default='.',
+                        help="pasta dos arquivos exportados (padrão: pasta atual)")
+    parser.add_argument('--ttl', type=float, default=300,
+                        help="segundos que um resultado fica no cache (padrão: 300)")
+    parser.add_argument('--cache-disco', default=None,
+                        help="arquivo para manter o cache entre execuções")
+    parser.add_argument('--sem-cache', action='store_true',
+                        help="sempre consulta o banco")
+    args = parser.parse_args()
+    try:
+        valores = ler_valores(args.param)
+    except ValueError as erro:
+        parser.error(str(erro))
+
+    if args.banco == 'local':
+        info = usar_banco_local()
+        print(f"Usando o banco local {info['arquivo']}")
+
+    cache = None if args.sem_cache else CacheConsultas(ttl=args.ttl, caminho_disco=args.cache_disco)
+
+    sair = len(obter_registro()) + 1
+
     while True:
         mostrar_menu()
         
         try:
-            escolha = int(input("\nDigite sua opção (1-6): "))
+            escolha = int(input(f"\nDigite sua opção (1-{sair}): "))
             
-            if escolha == 6:
+            if escolha == sair:
                 print("\nSaindo do sistema...")
                 break
                 
-            if escolha < 1 or escolha > 5:
-                print("\nOpção inválida! Por favor, escolha uma opção entre 1 e 6.")
+            if escolha < 1 or escolha > sair:
+                print(f"\nOpção inválida! Por favor, escolha uma opção entre 1 e {sair}.")
                 continue
                 
-            # Obtém a query escolhida
-            query = obter_query_escolhida(escolha)
+            # Obtém a query escolhida e os valores dos parâmetros
+            query, parametros = obter_query_escolhida(escolha, valores)
             
             if query:
                 print(f"\nExecutando consulta {escolha}...")
                 
-                # Executa a consulta
-                resultados, colunas = obter_dados_do_banco(query)
-                
-                # Mostra os resultados
-                mostrar_resultados(resultados, colunas)
+                # Executa a consulta e mostra as linhas conforme chegam
+                if args.exportar:
+                    destino = os.path.join(args.pasta_exportacao, f"consulta{escolha}.{args.exportar}")
+                    exportar_resultados(query, destino, cache=cache, parametros=parametros)
+                elif args.saida:
+                    with open(args.saida, 'a', encoding='utf-8') as arquivo:
+                        total = mostrar_resultados_em_fluxo(query, saida=arquivo, cache=cache,
+                                                            parametros=parametros)
+                    if total:
+                        print(f"{total} registros gravados em {args.saida}")
+                else:
+                    mostrar_resultados_em_fluxo(query, cache=cache, parametros=parametros)
             else:
                 print("\nErro: Query não encontrada para a opção selecionada.")
                 
@@ -168,5 +229,7 @@ def main():
         except Exception as e:
             print(f"\nOcorreu um erro: {e}")
 
+    fechar_pools()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
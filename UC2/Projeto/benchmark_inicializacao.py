@@ -0,0 +1,111 @@
+# Benchmark de inicialização a frio dos relatórios em modo texto
+# Uso: python benchmark_inicializacao.py [--repeticoes N] [--limite 1.0] [--historico arquivo.csv]
+#
+# Cada script roda em um processo novo com "python -X importtime ... --somente-texto".
+# O tempo total e os módulos mais lentos de importar são mostrados; se algum
+# script passar do limite (padrão: 1 segundo) o benchmark termina com código 1,
+# o que permite usá-lo para detectar regressões.
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+PASTA_UC2 = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# (nome, pasta, script) - cada script roda a partir da própria pasta,
+# pois os caminhos dos CSVs são relativos
+SCRIPTS = [
+    ('Projetocsv', 'Projeto', 'Projetocsv.py'),
+    ('aula9.03', 'aula9', 'aula9.03.py'),
+    ('aula9.04', 'aula9', 'aula9.04.py'),
+]
+
+def ler_importtime(saida_erro):
+    """
+    Lê a saída de -X importtime.
+
+    Returns:
+        dict: {módulo: tempo próprio em segundos}
+    """
+    tempos = {}
+    for linha in saida_erro.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        proprio, _, nome = linha[len('import time:'):].split('|', 2)
+        tempos[nome.strip()] = int(proprio) / 1_000_000
+    return tempos
+
+def medir_script(pasta, script):
+    """
+    Executa o script em um processo novo e retorna (segundos, tempos de importação).
+    """
+    comando = [sys.executable, '-X', 'importtime', script, '--somente-texto']
+    inicio = time.perf_counter()
+    processo = subprocess.run(comando, cwd=os.path.join(PASTA_UC2, pasta),
+                              capture_output=True, text=True)
+    segundos = time.perf_counter() - inicio
+    if processo.returncode != 0:
+        raise RuntimeError(f"{script} terminou com código {processo.returncode}:\n{processo.stderr[-2000:]}")
+    return segundos, ler_importtime(processo.stderr)
+
+def principais_modulos(tempos, quantidade=5):
+    """Agrupa os tempos pelo pacote raiz (ex.: 'pandas') e retorna os maiores."""
+    por_pacote = {}
+    for nome, segundos in tempos.items():
+        raiz = nome.split('.')[0]
+        por_pacote[raiz] = por_pacote.get(raiz, 0) + segundos
+    return sorted(por_pacote.items(), key=lambda item: item[1], reverse=True)[:quantidade]
+
+def gravar_historico(caminho, resultados):
+    """Acrescenta uma linha por script ao CSV de histórico."""
+    novo = not os.path.exists(caminho)
+    with open(caminho, 'a', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        if novo:
+            escritor.writerow(['data', 'script', 'segundos', 'importacoes', 'python'])
+        data = datetime.now().isoformat(timespec='seconds')
+        versao = sys.version.split()[0]
+        for nome, segundos, tempos in resultados:
+            escritor.writerow([data, nome, f"{segundos:.3f}", f"{sum(tempos.values()):.3f}", versao])
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de inicialização dos relatórios em modo texto")
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help="execuções por script; vale a mais rápida (padrão: 3)")
+    parser.add_argument('--limite', type=float, default=1.0,
+                        help="tempo máximo aceitável em segundos (padrão: 1.0)")
+    parser.add_argument('--historico', default=None,
+                        help="CSV onde os resultados são acrescentados a cada execução")
+    args = parser.parse_args()
+
+    print(f"Inicialização a frio (--somente-texto), melhor de {args.repeticoes} execuções")
+    print("-" * 60)
+
+    resultados = []
+    for nome, pasta, script in SCRIPTS:
+        medicoes = [medir_script(pasta, script) for _ in range(args.repeticoes)]
+        segundos, tempos = min(medicoes, key=lambda medicao: medicao[0])
+        resultados.append((nome, segundos, tempos))
+
+        situacao = "OK" if segundos <= args.limite else "ACIMA DO LIMITE"
+        print(f"{nome:<12} {segundos * 1000:8.1f} ms  "
+              f"(importações: {sum(tempos.values()) * 1000:.1f} ms)  {situacao}")
+        for pacote, segundos_pacote in principais_modulos(tempos):
+            print(f"    {pacote:<20} {segundos_pacote * 1000:8.1f} ms")
+
+    if args.historico:
+        gravar_historico(args.historico, resultados)
+        print(f"\nResultados acrescentados em {args.historico}")
+
+    print("-" * 60)
+    lentos = [nome for nome, segundos, _ in resultados if segundos > args.limite]
+    if lentos:
+        print(f"Regressão: {', '.join(lentos)} acima de {args.limite:.1f} s")
+        sys.exit(1)
+    print(f"Todos os scripts abaixo de {args.limite:.1f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+# Execução das consultas sem o menu (ex.: atualização diária dos resultados)
+# Uso: python executar_consultas.py 1 2 3 4 5
+#      python executar_consultas.py 2 3 --param cidade=Miami --param valor_minimo=500
+#      python executar_consultas.py consultas.txt outras_consultas.txt --formato parquet
+#
+# Cada argumento é o número (ou nome) de uma consulta do menu, que vem do
+# Projeto/consultas.txt, ou outro arquivo de consultas. As consultas rodam ao
+# mesmo tempo em threads, cada uma com uma conexão do pool, e cada resultado
+# vai para o próprio arquivo na pasta de saída. No fim é mostrado o tempo de
+# cada consulta e o total; se alguma falhar, o script termina com código 1.
+#
+# Com --analisar nada é exportado: para cada consulta é mostrado o plano de
+# execução (EXPLAIN), os filtros que impedem o uso de índice, os índices
+# sugeridos e o tempo antes/depois das sugestões (veja plano_consultas.py).
+# Uso: python executar_consultas.py 1 2 3 4 5 --analisar [--criar-indices] [--historico plano.csv]
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aula7'))
+from banco import ErroBanco, TAMANHO_LOTE, TAMANHO_POOL, configurar_banco, obter_pool, fechar_pools
+from banco_local import usar_banco_local
+from consultas_sql import RegistroConsultas, ler_valores, obter_registro
+from exportacao import FORMATOS_EXPORTACAO, exportar_consulta
+from plano_consultas import analisar_consulta, criar_indices, medir_consulta
+
+def montar_tarefas(entradas, valores=None, marcador='%s'):
+    """
+    Transforma os argumentos em uma lista de (nome, sql, parâmetros).
+
+    Args:
+        entradas (list): Números/nomes de consultas do menu ou arquivos.
+        valores (dict, optional): Valores dos parâmetros (os que faltarem
+            ficam com o padrão declarado no arquivo).
+        marcador (str): Marcador de parâmetro do banco (pool.marcador).
+
+    Raises:
+        KeyError: Consulta inexistente no menu ou parâmetro sem valor.
+        ValueError: Arquivo sem consultas, com trechos inválidos ou valor de
+            parâmetro do tipo errado.
+    """
+    tarefas = []
+    for entrada in entradas:
+        if not os.path.isfile(entrada):
+            consulta = obter_registro().obter(entrada)
+            tarefas.append((f"consulta{consulta.numero}", *consulta.para_execucao(marcador, valores)))
+            continue
+
+        registro = RegistroConsultas(entrada)
+        if not len(registro):
+            raise ValueError(f"Nenhuma consulta encontrada em {entrada}")
+        prefixo = os.path.splitext(os.path.basename(entrada))[0]
+        for consulta in registro:
+            tarefas.append((f"{prefixo}_{consulta.nome_arquivo}", *consulta.para_execucao(marcador, valores)))
+    return tarefas
+
+def executar_tarefa(nome, query, parametros, pasta, formato, tamanho_lote):
+    """Executa uma consulta e grava o resultado; retorna (nome, info ou a exceção)."""
+    destino = os.path.join(pasta, f"{nome}.{formato}")
+    try:
+        return nome, exportar_consulta(obter_pool('amazon'), query, destino, parametros=parametros,
+                                      tamanho_lote=tamanho_lote, preparada=True)
+    except Exception as erro:
+        # Qualquer falha (banco, pasta sem permissão, pyarrow ausente...) fica
+        # só nesta consulta; as outras continuam e aparecem no resumo
+        return nome, erro
+
+def analisar_tarefa(pool, nome, query, parametros, repeticoes, aplicar_indices):
+    """
+    Mostra plano, alertas e sugestões da consulta e mede antes/depois.
+
+    O "depois" usa a consulta reescrita e, com aplicar_indices, os índices
+    sugeridos já criados no banco.
+
+    Returns:
+        dict: Linha do histórico.
+    """
+    print(f"\n{'='*80}")
+    print(f"{nome}")
+    print('='*80)
+
+    antes, linhas_antes = medir_consulta(pool, query, repeticoes, parametros)
+    analise = analisar_consulta(pool, query, parametros)
+
+    print("Plano:")
+    for passo in analise['plano']:
+        marca = "  <-- varredura completa" if passo['varredura'] else ""
+        print(f"    {passo['tabela'] or '-':<12} {passo['acesso']:<8} {passo['detalhe']}{marca}")
+    for alerta in analise['alertas']:
+        print(f"  ! {alerta}")
+    for comando in analise['indices']:
+        print(f"  Índice sugerido: {comando}")
+    if not analise['alertas']:
+        print("  Nenhum problema encontrado")
+
+    if aplicar_indices and analise['indices']:
+        criar_indices(pool, analise['indices'])
+        print(f"  {len(analise['indices'])} índice(s) criado(s)")
+
+    depois, linhas_depois = antes, linhas_antes
+    if analise['sql_sugerida'] or (aplicar_indices and analise['indices']):
+        depois, linhas_depois = medir_consulta(pool, analise['sql_sugerida'] or query, repeticoes, parametros)
+        if linhas_depois != linhas_antes:
+            print(f"  ! A consulta sugerida retornou {linhas_depois} linhas em vez de {linhas_antes}")
+
+    print(f"Tempo: antes {antes * 1000:.1f} ms, depois {depois * 1000:.1f} ms "
+          f"({linhas_antes} linhas, melhor de {repeticoes})")
+    return {
+        'consulta': nome,
+        'antes_ms': f"{antes * 1000:.2f}",
+        'depois_ms': f"{depois * 1000:.2f}",
+        'linhas_antes': linhas_antes,
+        'linhas_depois': linhas_depois,
+        'reescrita': 'sim' if analise['sql_sugerida'] else 'nao',
+        'indices_criados': ' ; '.join(analise['indices']) if aplicar_indices else '',
+    }
+
+def gravar_historico(caminho, resultados):
+    """Acrescenta uma linha por consulta ao CSV de histórico."""
+    novo = not os.path.exists(caminho)
+    campos = ['data'] + list(resultados[0])
+    with open(caminho, 'a', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=campos)
+        if novo:
+            escritor.writeheader()
+        data = datetime.now().isoformat(timespec='seconds')
+        for resultado in resultados:
+            escritor.writerow({'data': data, **resultado})
+
+def analisar(tarefas, args):
+    # As consultas são medidas uma de cada vez, para uma não atrapalhar a outra
+    pool = obter_pool('amazon')
+    resultados = []
+    falhas = 0
+    for nome, query, parametros in tarefas:
+        try:
+            resultados.append(analisar_tarefa(pool, nome, query, parametros, args.repeticoes, args.criar_indices))
+        except ErroBanco as erro:
+            falhas += 1
+            print(f"{nome}: ERRO: {erro}")
+    fechar_pools()
+
+    if args.historico and resultados:
+        gravar_historico(args.historico, resultados)
+        print(f"\nResultados acrescentados em {args.historico}")
+    if falhas:
+        print(f"{falhas} consulta(s) falharam")
+        sys.exit(1)
+
+def main():
+    parser = argparse.ArgumentParser(description="Executa consultas ao banco amazon sem interação")
+    parser.add_argument('consultas', nargs='+',
+                        help="números ou nomes das consultas do menu e/ou arquivos de consultas")
+    parser.add_argument('--banco', choices=('mysql', 'local'), default='mysql',
+                        help="mysql (padrão) ou local: SQLite gerado a partir dos CSVs do UC2")
+    parser.add_argument('--param', action='append', default=[], metavar='NOME=VALOR',
+                        help="valor de um parâmetro, para todas as consultas que o usam "
+                             "(ex.: --param cidade=Miami)")
+    parser.add_argument('--pasta', default='resultados',
+                        help="pasta dos arquivos gerados (padrão: resultados)")
+    parser.add_argument('--formato', choices=FORMATOS_EXPORTACAO, default='csv')
+    parser.add_argument('--paralelas', type=int, default=TAMANHO_POOL,
+                        help=f"consultas ao mesmo tempo (padrão: {TAMANHO_POOL})")
+    parser.add_argument('--tamanho-lote', type=int, default=TAMANHO_LOTE,
+                        help=f"linhas buscadas por vez no banco (padrão: {TAMANHO_LOTE})")
+    parser.add_argument('--analisar', action='store_true',
+                        help="mostra plano de execução, índices sugeridos e tempos em vez de exportar")
+    parser.add_argument('--criar-indices', action='store_true',
+                        help="com --analisar, cria no banco os índices sugeridos antes de medir o depois")
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help="com --analisar, execuções por medição; vale a mais rápida (padrão: 3)")
+    parser.add_argument('--historico', default=None,
+                        help="com --analisar, CSV onde os tempos são acrescentados")
+    args = parser.parse_args()
+    if args.repeticoes < 1:
+        parser.error("--repeticoes deve ser pelo menos 1")
+
+    if args.banco == 'local':
+        usar_banco_local()
+
+    try:
+        tarefas = montar_tarefas(args.consultas, ler_valores(args.param), obter_pool('amazon').marcador)
+    except (KeyError, ValueError) as erro:
+        parser.error(erro.args[0])
+
+    nomes = [nome for nome, _, _ in tarefas]
+    repetidos = {nome for nome in nomes if nomes.count(nome) > 1}
+    if repetidos:
+        parser.error(f"Consultas repetidas (gravariam no mesmo arquivo): {', '.join(sorted(repetidos))}")
+
+    if args.analisar:
+        analisar(tarefas, args)
+        return
+
+    os.makedirs(args.pasta, exist_ok=True)
+    # Uma conexão por thread
+    configurar_banco('amazon', tamanho=args.paralelas)
+
+    print(f"Executando {len(tarefas)} consultas ({args.paralelas} ao mesmo tempo)")
+    print("-" * 80)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.paralelas) as executor:
+        futuros = [executor.submit(executar_tarefa, nome, query, parametros, args.pasta, args.formato,
+                                   args.tamanho_lote)
+                   for nome, query, parametros in tarefas]
+        resultados = [futuro.result() for futuro in futuros]
+    total = time.perf_counter() - inicio
+    fechar_pools()
+
+    falhas = 0
+    soma = 0.0
+    for nome, info in resultados:
+        if isinstance(info, Exception):
+            falhas += 1
+            print(f"{nome:<32} ERRO: {info}")
+            continue
+        soma += info['segundos']
+        print(f"{nome:<32} {info['linhas']:>9} linhas  {info['segundos']:7.2f} s  "
+              f"{info['linhas_por_segundo']:>12,.0f} linhas/s")
+
+    print("-" * 80)
+    print(f"Tempo total: {total:.2f} s (soma das consultas: {soma:.2f} s)")
+    print(f"Arquivos em {os.path.abspath(args.pasta)}")
+    if falhas:
+        print(f"{falhas} consulta(s) falharam")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 import pandas as pd
 import mysql.connector
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aula7'))
+from banco import ErroBanco, obter_pool
 
 # 1. Conectar ao banco de dados
 conexao = mysql.connector.connect(
@@ -32,24 +36,13 @@ conexao.close()
 ######################
 
 def obter_dados_do_banco(query):
+    # A conexão vem do pool compartilhado (UC2/aula7/banco.py) e é reaproveitada
     try:
-        conexao = mysql.connector.connect(
-            host="127.0.0.1",
-            user="root",
-            password="",
-            database="vendas_online"
-        )
-        cursor = conexao.cursor()
-        cursor.execute(query)
-        resultados = cursor.fetchall()
+        resultados, _ = obter_pool('vendas_online').executar(query)
         return resultados
-    except mysql.connector.Error as erro:
+    except ErroBanco as erro:
         print(f"Erro ao conectar ao MySQL: {erro}")
         return None
-    finally:
-        if 'conexao' in locals() and conexao.is_connected():
-            cursor.close()
-            conexao.close()
 
 # Usando a função
 query_produtos = "SELECT * FROM produtos WHERE preco > 100"
@@ -2,6 +2,8 @@
 # Assumimos aqui que 'statistic.py' está no mesmo diretório.
 import pandas as pd
 from statistic import calcular_medidas_descritivas, gerar_painel_boxplot
+from cache_medidas import obter_medidas_em_cache
+from colunar import carregar_tabela
 
 # 1. Definir o caminho do arquivo
 # Ajuste o caminho para onde o seu arquivo está
@@ -9,7 +11,7 @@ caminho_csv = "../aula7/orders.csv"
 
 # 2. Carregar os dados
 try:
-    df = pd.read_csv(caminho_csv)
+    df = carregar_tabela(caminho_csv)
     
     # Converter a coluna TotalAmount de string para float
     # Primeiro remover possíveis caracteres não numéricos e converter ponto para separador decimal
@@ -23,7 +25,11 @@ try:
     precos_array = df['TotalAmount'].values.astype(float)
     
     # 4. Chamar a função de cálculo do seu módulo
-    medidas_calculadas = calcular_medidas_descritivas(precos_array)
+    # (o resultado fica em cache ao lado do CSV e só é recalculado se o arquivo mudar)
+    medidas_calculadas = obter_medidas_em_cache(
+        caminho_csv, 'medidas_descritivas:TotalAmount',
+        lambda: calcular_medidas_descritivas(precos_array)
+    )
     
     # 5. Chamar a função de visualização do seu módulo
     if medidas_calculadas:
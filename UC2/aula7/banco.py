@@ -0,0 +1,405 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# ==============================================================================
+# POOL DE CONEXÕES COM O BANCO DE DADOS
+# ==============================================================================
+#
+# Abrir uma conexão MySQL (TCP + autenticação) costuma demorar mais do que a
+# própria consulta. O pool abre as conexões sob demanda, até o tamanho máximo,
+# e as reaproveita entre as consultas. Antes de entregar uma conexão parada há
+# algum tempo, ele confere se ela ainda responde (SELECT 1) e a troca se não.
+#
+# Exemplo:
+#     from banco import obter_pool
+#     resultados, colunas = obter_pool('amazon').executar("SELECT * FROM orders")
+#
+# Para testar sem MySQL, registre um banco SQLite com o mesmo nome:
+#     configurar_banco('amazon', FabricaSQLite('amazon.db'))
+
+CONFIG_MYSQL = {
+    'host': '127.0.0.1',
+    'user': 'root',
+    'password': '',
+}
+
+# Tamanho padrão dos pools (pode ser trocado pela variável UC2_TAMANHO_POOL)
+TAMANHO_POOL = int(os.environ.get('UC2_TAMANHO_POOL', 5))
+
+# Linhas buscadas por vez (fetchmany) nas consultas em fluxo
+TAMANHO_LOTE = 1000
+
+
+class ErroBanco(Exception):
+    """Erro do banco (MySQL ou SQLite) ou do pool, com a mensagem original."""
+
+
+class FabricaMySQL:
+    """Abre conexões MySQL; o mysql.connector só é importado na primeira conexão."""
+
+    # Marcador de parâmetro do driver (cursor.execute(sql, valores))
+    marcador = '%s'
+
+    def __init__(self, database, **config):
+        self.config = {**CONFIG_MYSQL, **config, 'database': database}
+
+    @property
+    def identidade(self):
+        """Identifica o banco (ex.: para separar entradas de cache)."""
+        return ('mysql', self.config['host'], self.config.get('port', 3306), self.config['database'])
+
+    @property
+    def erros(self):
+        try:
+            import mysql.connector
+        except ImportError:
+            return ()
+        return (mysql.connector.Error,)
+
+    def __call__(self):
+        import mysql.connector
+        return mysql.connector.connect(**self.config)
+
+
+class FabricaSQLite:
+    """Abre conexões SQLite (arquivo ou ':memory:'), usáveis em qualquer thread."""
+
+    erros = (sqlite3.Error,)
+    marcador = '?'
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+
+    @property
+    def identidade(self):
+        """Identifica o banco (ex.: para separar entradas de cache)."""
+        return ('sqlite', self.caminho if self.caminho == ':memory:' else os.path.abspath(self.caminho))
+
+    def __call__(self):
+        return sqlite3.connect(self.caminho, check_same_thread=False)
+
+
+class PoolConexoes:
+    """
+    Pool de conexões DB-API seguro para várias threads.
+
+    Args:
+        fabrica (callable): Cria uma conexão nova (ex.: FabricaMySQL('amazon')).
+            O atributo opcional "erros" lista as exceções do driver.
+        tamanho (int): Máximo de conexões abertas ao mesmo tempo.
+        intervalo_verificacao (float): Conexões paradas por mais que isso (em
+            segundos) são testadas antes de serem entregues.
+        espera_maxima (float): Tempo máximo esperando uma conexão livre.
+    """
+
+    def __init__(self, fabrica, tamanho=TAMANHO_POOL, intervalo_verificacao=30.0, espera_maxima=30.0):
+        if tamanho < 1:
+            raise ValueError("O pool precisa de pelo menos 1 conexão")
+        self.fabrica = fabrica
+        self.tamanho = tamanho
+        self.intervalo_verificacao = intervalo_verificacao
+        self.espera_maxima = espera_maxima
+        self._livres = []  # (conexão, instante em que foi devolvida)
+        self._abertas = 0
+        self._condicao = threading.Condition()
+        self._fechado = False
+        # Comandos preparados de cada conexão: id(conexão) -> {sql: cursor}
+        self._preparadas = {}
+        self.estatisticas = {'criadas': 0, 'reaproveitadas': 0, 'descartadas': 0,
+                             'preparadas': 0, 'preparadas_reaproveitadas': 0}
+
+    @property
+    def erros(self):
+        return tuple(getattr(self.fabrica, 'erros', ())) + (sqlite3.Error,)
+
+    @property
+    def marcador(self):
+        """Marcador de parâmetro do driver: '?' (sqlite3) ou '%s' (MySQL)."""
+        return getattr(self.fabrica, 'marcador', '%s')
+
+    @property
+    def identidade(self):
+        """Identidade do banco da fábrica (fábricas sem "identidade" usam o próprio repr)."""
+        return getattr(self.fabrica, 'identidade', repr(self.fabrica))
+
+    def _criar(self):
+        try:
+            conexao = self.fabrica()
+        except Exception as erro:
+            with self._condicao:
+                self._abertas -= 1
+                self._condicao.notify()
+            raise ErroBanco(str(erro)) from erro
+        self._contar('criadas')
+        return conexao
+
+    def _contar(self, evento):
+        with self._condicao:
+            self.estatisticas[evento] += 1
+
+    def _esta_saudavel(self, conexao):
+        try:
+            cursor = conexao.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _fechar(self, conexao):
+        # Fecha sem liberar a vaga no pool (quem chama decide o que fazer com ela)
+        self._contar('descartadas')
+        self._fechar_preparadas(conexao)
+        try:
+            conexao.close()
+        except Exception:
+            pass
+
+    def _descartar(self, conexao):
+        self._fechar(conexao)
+        with self._condicao:
+            self._abertas -= 1
+            self._condicao.notify()
+
+    def _cursor_preparado(self, conexao, query):
+        """
+        Cursor com a consulta já preparada nesta conexão.
+
+        No MySQL o comando é preparado no servidor na primeira execução
+        (cursor(prepared=True)) e as seguintes só enviam os parâmetros. O
+        sqlite3 já guarda os comandos compilados de cada conexão, então basta
+        reaproveitar o cursor.
+        """
+        preparadas = self._preparadas.setdefault(id(conexao), {})
+        cursor = preparadas.get(query)
+        if cursor is not None:
+            self._contar('preparadas_reaproveitadas')
+            return cursor
+        try:
+            cursor = conexao.cursor(prepared=True)
+        except TypeError:
+            cursor = conexao.cursor()
+        preparadas[query] = cursor
+        self._contar('preparadas')
+        return cursor
+
+    def _fechar_preparadas(self, conexao):
+        for cursor in self._preparadas.pop(id(conexao), {}).values():
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+    def retirar(self):
+        """Entrega uma conexão livre (ou nova). Devolva com devolver()."""
+        limite = time.monotonic() + self.espera_maxima
+        with self._condicao:
+            while not self._livres and self._abertas >= self.tamanho:
+                restante = limite - time.monotonic()
+                if restante <= 0 or not self._condicao.wait(restante):
+                    raise ErroBanco(f"Nenhuma conexão livre no pool após {self.espera_maxima:.0f} s")
+            if self._livres:
+                conexao, devolvida_em = self._livres.pop()
+            else:
+                self._abertas += 1
+                conexao = None
+
+        if conexao is None:
+            return self._criar()
+
+        if time.monotonic() - devolvida_em > self.intervalo_verificacao and not self._esta_saudavel(conexao):
+            # Conexão caiu enquanto estava parada (ex.: wait_timeout do MySQL).
+            # A nova ocupa a mesma vaga, sem devolvê-la a quem está esperando
+            self._fechar(conexao)
+            return self._criar()
+
+        self._contar('reaproveitadas')
+        return conexao
+
+    def devolver(self, conexao, descartar=False):
+        """Devolve a conexão ao pool, encerrando qualquer transação aberta."""
+        if not descartar:
+            try:
+                conexao.rollback()
+            except Exception:
+                descartar = True
+        if descartar or self._fechado:
+            self._descartar(conexao)
+            return
+        with self._condicao:
+            self._livres.append((conexao, time.monotonic()))
+            self._condicao.notify()
+
+    @contextmanager
+    def conexao(self):
+        """Empresta uma conexão dentro de um bloco with."""
+        conexao = self.retirar()
+        try:
+            yield conexao
+        except BaseException as erro:
+            # Depois de um erro do driver a conexão pode ter ficado inutilizável
+            quebrada = isinstance(erro, self.erros) and not self._esta_saudavel(conexao)
+            self.devolver(conexao, descartar=quebrada)
+            raise
+        else:
+            self.devolver(conexao)
+
+    def executar(self, query, parametros=None, preparada=False):
+        """
+        Executa a consulta em uma conexão do pool.
+
+        Com preparada=True o comando fica preparado na conexão e é
+        reaproveitado nas próximas execuções (veja _cursor_preparado).
+
+        Returns:
+            tuple: (lista de linhas, lista com os nomes das colunas)
+
+        Raises:
+            ErroBanco: Falha ao conectar ou ao executar a consulta.
+        """
+        try:
+            with self.conexao() as conexao:
+                cursor = self._cursor_preparado(conexao, query) if preparada else conexao.cursor()
+                try:
+                    cursor.execute(query, parametros or ())
+                    resultados = cursor.fetchall()
+                    colunas = [desc[0] for desc in cursor.description or ()]
+                finally:
+                    if not preparada:
+                        cursor.close()
+                return resultados, colunas
+        except self.erros as erro:
+            raise ErroBanco(str(erro)) from erro
+
+    @contextmanager
+    def consultar_em_fluxo(self, query, parametros=None, tamanho_lote=TAMANHO_LOTE, com_descricao=False,
+                           preparada=False):
+        """
+        Executa a consulta sem trazer o resultado inteiro para a memória.
+
+        O cursor é sem buffer (no MySQL as linhas ficam no servidor até serem
+        lidas) e as linhas chegam em lotes de fetchmany, então a memória usada
+        não depende do tamanho do resultado.
+
+        Exemplo:
+            with pool.consultar_em_fluxo(query) as (colunas, linhas):
+                for linha in linhas:
+                    ...
+
+        Com com_descricao=True, em vez dos nomes vem o cursor.description
+        inteiro (nome, tipo, tamanho, precisão, escala...) de cada coluna.
+        preparada=True funciona como em executar().
+
+        Raises:
+            ErroBanco: Falha ao conectar, executar ou ler as linhas.
+        """
+        try:
+            with self.conexao() as conexao:
+                if preparada:
+                    cursor = self._cursor_preparado(conexao, query)
+                else:
+                    cursor = _abrir_cursor_sem_buffer(conexao)
+                try:
+                    cursor.execute(query, parametros or ())
+                    descricao = list(cursor.description or ())
+                    colunas = descricao if com_descricao else [desc[0] for desc in descricao]
+                    yield colunas, ler_em_lotes(cursor, tamanho_lote)
+                finally:
+                    _descartar_linhas_pendentes(conexao)
+                    if not preparada:
+                        cursor.close()
+        except self.erros as erro:
+            raise ErroBanco(str(erro)) from erro
+
+    def fechar(self):
+        """Fecha as conexões livres (as emprestadas fecham ao serem devolvidas)."""
+        with self._condicao:
+            self._fechado = True
+            livres, self._livres = self._livres, []
+            self._abertas -= len(livres)
+            self._condicao.notify_all()
+        for conexao, _ in livres:
+            self._fechar_preparadas(conexao)
+            try:
+                conexao.close()
+            except Exception:
+                pass
+
+
+def _abrir_cursor_sem_buffer(conexao):
+    try:
+        # mysql.connector: não copia o resultado inteiro para o cliente
+        return conexao.cursor(buffered=False)
+    except TypeError:
+        # sqlite3 e outros drivers já leem as linhas sob demanda
+        return conexao.cursor()
+
+
+def _descartar_linhas_pendentes(conexao):
+    # Se a leitura parou no meio, o MySQL exige consumir o resto antes de
+    # reutilizar a conexão
+    consumir = getattr(conexao, 'consume_results', None)
+    if consumir is not None:
+        try:
+            consumir()
+        except Exception:
+            # Conexão quebrada: o pool descarta ao tentar o rollback
+            pass
+
+
+def ler_em_lotes(cursor, tamanho_lote=TAMANHO_LOTE):
+    """Gera as linhas do cursor buscando tamanho_lote de cada vez."""
+    while True:
+        lote = cursor.fetchmany(tamanho_lote)
+        if not lote:
+            return
+        yield from lote
+
+
+# ==============================================================================
+# POOLS COMPARTILHADOS POR NOME DE BANCO
+# ==============================================================================
+
+_fabricas = {}
+_tamanhos = {}
+_pools = {}
+_trava_pools = threading.Lock()
+
+
+def configurar_banco(nome, fabrica=None, tamanho=None):
+    """
+    Define como conectar ao banco "nome" (padrão: MySQL local com o mesmo
+    nome de database). Um pool já aberto para ele é fechado.
+    """
+    with _trava_pools:
+        if fabrica is not None:
+            _fabricas[nome] = fabrica
+        if tamanho is not None:
+            _tamanhos[nome] = tamanho
+        pool = _pools.pop(nome, None)
+    if pool is not None:
+        pool.fechar()
+
+
+def obter_pool(nome='amazon'):
+    """Retorna o pool do banco, criando-o na primeira chamada."""
+    with _trava_pools:
+        if nome not in _pools:
+            fabrica = _fabricas.get(nome) or FabricaMySQL(nome)
+            _pools[nome] = PoolConexoes(fabrica, tamanho=_tamanhos.get(nome, TAMANHO_POOL))
+        return _pools[nome]
+
+
+def fechar_pools():
+    """Fecha todos os pools abertos (chamar ao sair do programa)."""
+    with _trava_pools:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.fechar()
@@ -0,0 +1,209 @@
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import time
+
+from banco import FabricaSQLite, configurar_banco
+from cache_medidas import impressao_digital
+
+# ==============================================================================
+# BANCO LOCAL (SQLITE) COM AS TABELAS DO AMAZON A PARTIR DOS CSVs
+# ==============================================================================
+#
+# orders.csv, customers.csv e products.csv do UC2 são carregados uma vez em um
+# arquivo SQLite com índices nas colunas de junção e de filtro. Enquanto os
+# CSVs não mudarem (mesma impressão digital, veja cache_medidas.py), o arquivo
+# é reaproveitado. As conexões ganham YEAR() e MONTH() como no MySQL, então as
+# consultas do menu rodam sem alteração, sem precisar do servidor.
+#
+# Exemplo:
+#     usar_banco_local()    # daqui em diante obter_pool('amazon') usa o SQLite
+#     resultados, colunas = obter_pool('amazon').executar(query)
+
+PASTA_UC2 = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+ARQUIVO_BANCO = os.path.join(PASTA_UC2, 'amazon_local.db')
+
+# tabela -> (CSV, [(coluna, tipo)]). Datas ficam como texto 'AAAA-MM-DD',
+# que ordena e compara como data.
+TABELAS = {
+    'orders': ('orders.csv', [
+        ('OrderID', 'TEXT'),
+        ('OrderDate', 'TEXT'),
+        ('CustomerID', 'TEXT'),
+        ('ProductID', 'TEXT'),
+        ('SellerID', 'TEXT'),
+        ('Quantity', 'INTEGER'),
+        ('Discount', 'REAL'),
+        ('Tax', 'REAL'),
+        ('ShippingCost', 'REAL'),
+        ('TotalAmount', 'REAL'),
+        ('PaymentMethod', 'TEXT'),
+        ('OrderStatus', 'TEXT'),
+    ]),
+    'customers': ('customers.csv', [
+        ('CustomerID', 'TEXT'),
+        ('CustomerName', 'TEXT'),
+        ('City', 'TEXT'),
+        ('State', 'TEXT'),
+        ('Country', 'TEXT'),
+    ]),
+    'products': ('products.csv', [
+        ('ProductID', 'TEXT'),
+        ('ProductName', 'TEXT'),
+        ('Category', 'TEXT'),
+        ('Brand', 'TEXT'),
+        ('UnitPrice', 'REAL'),
+    ]),
+}
+
+# Colunas de junção e de filtro das consultas do menu. Não há chave primária:
+# o customers.csv tem CustomerID repetidos e o banco deve refletir os CSVs.
+INDICES = [
+    ('orders', 'OrderID'),
+    ('orders', 'CustomerID'),
+    ('orders', 'ProductID'),
+    ('orders', 'OrderDate'),
+    ('orders', 'TotalAmount'),
+    ('customers', 'CustomerID'),
+    ('customers', 'City'),
+    ('products', 'ProductID'),
+]
+
+
+def _ano(data):
+    return int(data[:4]) if data else None
+
+
+def _mes(data):
+    return int(data[5:7]) if data else None
+
+
+class FabricaLocal(FabricaSQLite):
+    """Conexões ao banco local, com YEAR() e MONTH() como no MySQL."""
+
+    def __call__(self):
+        conexao = super().__call__()
+        conexao.create_function('YEAR', 1, _ano, deterministic=True)
+        conexao.create_function('MONTH', 1, _mes, deterministic=True)
+        return conexao
+
+
+def _origens(pasta_csv):
+    return {tabela: impressao_digital(os.path.join(pasta_csv, arquivo), calcular_hash=False)
+            for tabela, (arquivo, _) in TABELAS.items()}
+
+
+def banco_atualizado(caminho_banco=ARQUIVO_BANCO, pasta_csv=PASTA_UC2):
+    """True se o banco existe e foi gerado a partir dos CSVs atuais."""
+    if not os.path.exists(caminho_banco):
+        return False
+    try:
+        conexao = sqlite3.connect(caminho_banco)
+        try:
+            gravadas = dict(conexao.execute("SELECT tabela, digital FROM _origem").fetchall())
+        finally:
+            conexao.close()
+    except sqlite3.Error:
+        return False
+    atuais = _origens(pasta_csv)
+    return all(json.loads(gravadas.get(tabela, 'null')) == digital for tabela, digital in atuais.items())
+
+
+def _carregar_tabela(conexao, tabela, caminho_csv, colunas):
+    nomes = [nome for nome, _ in colunas]
+    definicao = ', '.join(f"{nome} {tipo}" for nome, tipo in colunas)
+    conexao.execute(f"CREATE TABLE {tabela} ({definicao})")
+
+    with open(caminho_csv, newline='', encoding='utf-8-sig') as arquivo:
+        leitor = csv.reader(arquivo)
+        cabecalho = next(leitor)
+        faltando = [nome for nome in nomes if nome not in cabecalho]
+        if faltando:
+            raise KeyError(f"Coluna '{faltando[0]}' não encontrada em {caminho_csv}. "
+                           f"Colunas disponíveis: {cabecalho}")
+        posicoes = [cabecalho.index(nome) for nome in nomes]
+        # Campo vazio ou faltando (linha cortada, como a última do orders.csv)
+        # vira NULL, como no pandas; números são convertidos pela afinidade
+        # da coluna
+        linhas = ([(linha[posicao] or None) if posicao < len(linha) else None for posicao in posicoes]
+                  for linha in leitor if linha)
+        marcadores = ', '.join('?' for _ in nomes)
+        conexao.executemany(f"INSERT INTO {tabela} ({', '.join(nomes)}) VALUES ({marcadores})", linhas)
+    return conexao.execute(f"SELECT COUNT(*) FROM {tabela}").fetchone()[0]
+
+
+def criar_banco_local(caminho_banco=ARQUIVO_BANCO, pasta_csv=PASTA_UC2, forcar=False):
+    """
+    Gera o banco SQLite a partir dos CSVs, se ainda não estiver atualizado.
+
+    Returns:
+        dict: Arquivo, se foi (re)criado, linhas por tabela e segundos gastos.
+
+    Raises:
+        FileNotFoundError: Se algum CSV não existir.
+        KeyError: Se faltar alguma coluna esperada em um CSV.
+    """
+    inicio = time.perf_counter()
+    if not forcar and banco_atualizado(caminho_banco, pasta_csv):
+        return {'arquivo': os.path.abspath(caminho_banco), 'criado': False, 'linhas': {},
+                'segundos': time.perf_counter() - inicio}
+
+    origens = _origens(pasta_csv)
+    # Monta em arquivo temporário e troca de uma vez, para nenhuma conexão
+    # ver o banco pela metade
+    temporario = caminho_banco + '.tmp'
+    if os.path.exists(temporario):
+        os.remove(temporario)
+    conexao = sqlite3.connect(temporario)
+    try:
+        linhas = {}
+        with conexao:
+            for tabela, (arquivo, colunas) in TABELAS.items():
+                linhas[tabela] = _carregar_tabela(conexao, tabela, os.path.join(pasta_csv, arquivo), colunas)
+            for tabela, coluna in INDICES:
+                conexao.execute(f"CREATE INDEX idx_{tabela}_{coluna.lower()} ON {tabela} ({coluna})")
+            conexao.execute("CREATE TABLE _origem (tabela TEXT PRIMARY KEY, digital TEXT)")
+            conexao.executemany("INSERT INTO _origem VALUES (?, ?)",
+                                [(tabela, json.dumps(digital)) for tabela, digital in origens.items()])
+        # Estatísticas para o otimizador escolher os índices
+        conexao.execute("ANALYZE")
+    finally:
+        conexao.close()
+    os.replace(temporario, caminho_banco)
+
+    return {'arquivo': os.path.abspath(caminho_banco), 'criado': True, 'linhas': linhas,
+            'segundos': time.perf_counter() - inicio}
+
+
+def usar_banco_local(nome='amazon', caminho_banco=ARQUIVO_BANCO, pasta_csv=PASTA_UC2):
+    """
+    Faz obter_pool(nome) usar o banco local, gerando-o se preciso.
+
+    Returns:
+        dict: O mesmo de criar_banco_local.
+    """
+    info = criar_banco_local(caminho_banco, pasta_csv)
+    configurar_banco(nome, FabricaLocal(caminho_banco))
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera o banco SQLite local a partir dos CSVs do UC2")
+    parser.add_argument('--banco', default=ARQUIVO_BANCO, help="arquivo do banco (padrão: UC2/amazon_local.db)")
+    parser.add_argument('--pasta-csv', default=PASTA_UC2, help="pasta com orders/customers/products.csv")
+    parser.add_argument('--forcar', action='store_true', help="gera de novo mesmo se estiver atualizado")
+    args = parser.parse_args()
+
+    info = criar_banco_local(args.banco, args.pasta_csv, forcar=args.forcar)
+    if not info['criado']:
+        print(f"{info['arquivo']} já está atualizado")
+        return
+    for tabela, total in info['linhas'].items():
+        print(f"{tabela}: {total} linhas")
+    print(f"{info['arquivo']} gerado em {info['segundos']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# Benchmark do acesso ao banco: conexão nova vs. pool, fetchall vs. fluxo e
+# com vs. sem cache, para cada consulta do menu (Projeto/consultas.txt)
+# Uso: python benchmark_banco.py [--repeticoes 20] [--consultas 1 3] [--banco local|mysql]
+#      python benchmark_banco.py --param cidade=Miami --saida benchmark.csv
+#
+# Por padrão usa o banco SQLite gerado a partir dos CSVs do UC2 (banco_local.py),
+# então roda sem servidor MySQL. Cada variante roda em um processo próprio,
+# para o pico de memória (RSS) de uma não contaminar o da outra. A primeira
+# execução de cada consulta não entra nas medidas (abre a conexão do pool e
+# preenche o cache).
+#
+# Variantes:
+#     fria_fetchall   conexão nova a cada consulta + fetchall (como o menu do
+#                     Projetosql.py fazia antes do pool)
+#     fria_fluxo      conexão nova a cada consulta + leitura em lotes
+#     pool_fetchall   conexão do pool + fetchall (PoolConexoes.executar)
+#     pool_fluxo      conexão do pool + leitura em lotes (consultar_em_fluxo)
+#     pool_cache      CacheConsultas.executar (depois da primeira, só acertos)
+import argparse
+import csv
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    # Windows: sem getrusage, o RSS não é informado
+    resource = None
+
+from banco import TAMANHO_LOTE, ler_em_lotes, obter_pool, fechar_pools
+from banco_local import usar_banco_local
+from cache_consultas import CacheConsultas
+from consultas_sql import ler_valores, obter_registro
+
+def _fria_fetchall(pool, sql, parametros, tamanho_lote):
+    conexao = pool.fabrica()
+    try:
+        cursor = conexao.cursor()
+        cursor.execute(sql, parametros)
+        return len(cursor.fetchall())
+    finally:
+        conexao.close()
+
+def _fria_fluxo(pool, sql, parametros, tamanho_lote):
+    conexao = pool.fabrica()
+    try:
+        cursor = conexao.cursor()
+        cursor.execute(sql, parametros)
+        return sum(1 for _ in ler_em_lotes(cursor, tamanho_lote))
+    finally:
+        conexao.close()
+
+def _pool_fetchall(pool, sql, parametros, tamanho_lote):
+    resultados, _ = pool.executar(sql, parametros)
+    return len(resultados)
+
+def _pool_fluxo(pool, sql, parametros, tamanho_lote):
+    with pool.consultar_em_fluxo(sql, parametros, tamanho_lote) as (_, linhas):
+        return sum(1 for _ in linhas)
+
+# Sem validade e sem limite de linhas, para todas as consultas ficarem no cache
+_cache = CacheConsultas(ttl=None, max_linhas=10_000_000)
+
+def _pool_cache(pool, sql, parametros, tamanho_lote):
+    resultados, _ = _cache.executar(pool, sql, parametros)
+    return len(resultados)
+
+VARIANTES = {
+    'fria_fetchall': _fria_fetchall,
+    'fria_fluxo': _fria_fluxo,
+    'pool_fetchall': _pool_fetchall,
+    'pool_fluxo': _pool_fluxo,
+    'pool_cache': _pool_cache,
+}
+
+def rss_pico_mb():
+    """Maior memória residente do processo até agora, em MB (None no Windows)."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB; macOS, em bytes
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+def percentis(tempos):
+    """(p50, p95) dos tempos; interpolação linear entre as medidas."""
+    cortes = statistics.quantiles(tempos, n=20, method='inclusive')
+    return cortes[9], cortes[18]
+
+def medir_variante(variante, tarefas, repeticoes, tamanho_lote):
+    """
+    Roda cada consulta repeticoes vezes com a variante, neste processo.
+
+    Returns:
+        dict: RSS antes e depois (MB) e, por consulta, linhas, p50/p95 (s)
+        e linhas por segundo (pela mediana).
+    """
+    funcao = VARIANTES[variante]
+    pool = obter_pool('amazon')
+    rss_inicial = rss_pico_mb()
+    consultas = []
+    for nome, sql, parametros in tarefas:
+        # Aquecimento: abre a conexão do pool e preenche o cache
+        linhas = funcao(pool, sql, parametros, tamanho_lote)
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            funcao(pool, sql, parametros, tamanho_lote)
+            tempos.append(time.perf_counter() - inicio)
+        p50, p95 = percentis(tempos)
+        consultas.append({
+            'consulta': nome,
+            'linhas': linhas,
+            'p50': p50,
+            'p95': p95,
+            'linhas_por_segundo': linhas / p50 if p50 > 0 else float('inf'),
+        })
+    fechar_pools()
+    return {'variante': variante, 'rss_inicial': rss_inicial, 'rss_pico': rss_pico_mb(),
+            'consultas': consultas}
+
+def montar_tarefas(numeros, valores, marcador):
+    registro = obter_registro()
+    consultas = [registro.obter(numero) for numero in numeros] if numeros else list(registro)
+    return [(f"consulta{consulta.numero}", *consulta.para_execucao(marcador, valores))
+            for consulta in consultas]
+
+def rodar_em_processo(variante, argumentos):
+    """Roda a variante em um processo novo e devolve o resultado (ou a mensagem de erro)."""
+    processo = subprocess.run([sys.executable, __file__, '--variante', variante, *argumentos],
+                              capture_output=True, text=True)
+    if processo.returncode != 0:
+        linhas = processo.stderr.strip().splitlines()
+        return linhas[-1] if linhas else f"código de saída {processo.returncode}"
+    return json.loads(processo.stdout)
+
+def _formatar_mb(valor):
+    return f"{valor:8.1f}" if valor is not None else "       -"
+
+def gravar_csv(caminho, resultados):
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(['variante', 'consulta', 'linhas', 'p50_ms', 'p95_ms', 'linhas_por_segundo',
+                           'rss_pico_mb'])
+        for resultado in resultados:
+            for consulta in resultado['consultas']:
+                escritor.writerow([resultado['variante'], consulta['consulta'], consulta['linhas'],
+                                   f"{consulta['p50'] * 1000:.3f}", f"{consulta['p95'] * 1000:.3f}",
+                                   f"{consulta['linhas_por_segundo']:.0f}",
+                                   '' if resultado['rss_pico'] is None else f"{resultado['rss_pico']:.1f}"])
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do acesso ao banco amazon")
+    parser.add_argument('--banco', choices=('local', 'mysql'), default='local',
+                        help="local (padrão): SQLite gerado a partir dos CSVs do UC2; ou mysql")
+    parser.add_argument('--consultas', nargs='+', default=[],
+                        help="números ou nomes das consultas do menu (padrão: todas)")
+    parser.add_argument('--param', action='append', default=[], metavar='NOME=VALOR',
+                        help="valor de um parâmetro das consultas (ex.: --param cidade=Miami)")
+    parser.add_argument('--repeticoes', type=int, default=20,
+                        help="execuções medidas de cada consulta por variante (padrão: 20)")
+    parser.add_argument('--tamanho-lote', type=int, default=TAMANHO_LOTE,
+                        help=f"linhas por fetchmany nas variantes em fluxo (padrão: {TAMANHO_LOTE})")
+    parser.add_argument('--variantes', nargs='+', choices=list(VARIANTES), default=list(VARIANTES))
+    parser.add_argument('--saida', default=None, help="CSV com uma linha por variante e consulta")
+    # Uso interno: roda só uma variante e imprime o resultado em JSON
+    parser.add_argument('--variante', choices=list(VARIANTES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.repeticoes < 2:
+        parser.error("--repeticoes precisa ser pelo menos 2 (para calcular o p95)")
+    if args.banco == 'local':
+        info = usar_banco_local()
+        if args.variante is None and info['criado']:
+            print(f"Banco local gerado em {info['segundos']:.2f} s: {info['arquivo']}")
+
+    try:
+        tarefas = montar_tarefas(args.consultas, ler_valores(args.param), obter_pool('amazon').marcador)
+    except (KeyError, ValueError) as erro:
+        parser.error(erro.args[0])
+
+    if args.variante:
+        print(json.dumps(medir_variante(args.variante, tarefas, args.repeticoes, args.tamanho_lote)))
+        return
+
+    argumentos = ['--banco', args.banco, '--repeticoes', str(args.repeticoes),
+                  '--tamanho-lote', str(args.tamanho_lote)]
+    if args.consultas:
+        argumentos += ['--consultas', *args.consultas]
+    for texto in args.param:
+        argumentos += ['--param', texto]
+
+    print(f"Benchmark com {len(tarefas)} consultas, {args.repeticoes} execuções cada (banco {args.banco})")
+    resultados = []
+    falhas = 0
+    for variante in args.variantes:
+        resultado = rodar_em_processo(variante, argumentos)
+        print("\n" + "=" * 80)
+        if isinstance(resultado, str):
+            falhas += 1
+            print(f"{variante}: ERRO: {resultado}")
+            continue
+        resultados.append(resultado)
+        print(f"{variante}  (RSS pico {_formatar_mb(resultado['rss_pico']).strip()} MB, "
+              f"{_formatar_mb(resultado['rss_inicial']).strip()} MB antes das consultas)")
+        print("-" * 80)
+        print(f"{'consulta':<14} {'linhas':>9} {'p50 (ms)':>10} {'p95 (ms)':>10} {'linhas/s':>14}")
+        for consulta in resultado['consultas']:
+            print(f"{consulta['consulta']:<14} {consulta['linhas']:>9} {consulta['p50'] * 1000:>10.2f} "
+                  f"{consulta['p95'] * 1000:>10.2f} {consulta['linhas_por_segundo']:>14,.0f}")
+
+    if resultados:
+        print("\n" + "=" * 80)
+        print(f"{'variante':<16} {'p50 total (ms)':>15} {'p95 total (ms)':>15} {'RSS pico (MB)':>14}")
+        print("-" * 80)
+        for resultado in resultados:
+            p50 = sum(consulta['p50'] for consulta in resultado['consultas'])
+            p95 = sum(consulta['p95'] for consulta in resultado['consultas'])
+            print(f"{resultado['variante']:<16} {p50 * 1000:>15.2f} {p95 * 1000:>15.2f} "
+                  f"{_formatar_mb(resultado['rss_pico']):>14}")
+
+    if args.saida and resultados:
+        gravar_csv(args.saida, resultados)
+        print(f"\nResultados gravados em {args.saida}")
+    if falhas:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Benchmark: quantis separados (median + 2x percentile) vs. uma única partição
+# Uso: python benchmark_quantis.py [quantidade_de_linhas]
+import sys
+import time
+import numpy as np
+import pandas as pd
+from statistic import calcular_estatisticas_de_ordem
+
+def cronometrar(funcao, repeticoes=5):
+    """Retorna o menor tempo (em segundos) entre as repetições."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+def main():
+    n_linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+    # Valores com cauda à direita, parecidos com TotalAmount
+    rng = np.random.default_rng(42)
+    dados = rng.lognormal(mean=6, sigma=0.8, size=n_linhas)
+    serie = pd.Series(dados)
+
+    def numpy_separado():
+        return np.median(dados), np.percentile(dados, 25), np.percentile(dados, 75), np.min(dados), np.max(dados)
+
+    def pandas_separado():
+        return serie.median(), serie.quantile(0.25), serie.quantile(0.75)
+
+    def particao_unica():
+        return calcular_estatisticas_de_ordem(dados)
+
+    # Confere que os resultados são os mesmos antes de medir
+    mediana, q1, q3, minimo, maximo = numpy_separado()
+    esperado = [minimo, q1, mediana, q3, maximo]
+    assert np.allclose(particao_unica(), esperado)
+
+    print(f"Benchmark de quantis com {n_linhas:,} linhas".replace(',', '.'))
+    print("-" * 60)
+    t_numpy = cronometrar(numpy_separado)
+    t_pandas = cronometrar(pandas_separado)
+    t_kernel = cronometrar(particao_unica)
+    print(f"np.median + 2x np.percentile + min/max: {t_numpy * 1000:8.1f} ms")
+    print(f"Series.median + 2x Series.quantile:     {t_pandas * 1000:8.1f} ms")
+    print(f"calcular_estatisticas_de_ordem:         {t_kernel * 1000:8.1f} ms")
+    print("-" * 60)
+    print(f"Ganho vs. NumPy:  {t_numpy / t_kernel:.2f}x")
+    print(f"Ganho vs. pandas: {t_pandas / t_kernel:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import os
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# ==============================================================================
+# CACHE DE RESULTADOS DE CONSULTAS SQL
+# ==============================================================================
+#
+# Guarda (linhas, colunas) de cada consulta pelo banco (PoolConexoes.identidade)
+# e pela forma normalizada do SQL:
+# espaços, quebras de linha, comentários, maiúsculas/minúsculas e o ";" final
+# não importam, então duas consultas escritas de jeitos diferentes (mas iguais)
+# usam a mesma entrada. Cada entrada vale por "ttl" segundos; quando o cache
+# enche, sai a usada há mais tempo (LRU). Opcionalmente o cache é gravado em
+# disco (pickle) e sobrevive entre execuções.
+#
+# Exemplo:
+#     cache = CacheConsultas(ttl=300, caminho_disco='consultas.cache')
+#     resultados, colunas = cache.executar(obter_pool('amazon'), query)
+#     cache.obter(query, banco=obter_pool('amazon').identidade)
+#     cache.invalidar_tabela('orders')   # depois de alterar a tabela orders
+
+_TEXTO_OU_COMENTARIO = re.compile(
+    r"('(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`)"  # literais e nomes entre crases
+    r"|(--[^\n]*|#[^\n]*|/\*.*?\*/)",                        # comentários
+    re.DOTALL,
+)
+_TABELAS = re.compile(r'\b(?:from|join|into|update|table)\s+`?(\w+)`?', re.IGNORECASE)
+_ALTERACAO = re.compile(r'^\s*(insert|update|delete|replace|truncate|alter|drop|create)\b', re.IGNORECASE)
+
+
+def normalizar_sql(sql):
+    """
+    Forma canônica do SQL usada como chave do cache.
+
+    Comentários são removidos, espaços são reduzidos a um só e tudo fora dos
+    literais entre aspas vai para minúsculas.
+    """
+    partes = []
+    fora_de_literal = []
+    posicao = 0
+    for trecho in _TEXTO_OU_COMENTARIO.finditer(sql):
+        fora_de_literal.append(sql[posicao:trecho.start()])
+        posicao = trecho.end()
+        if trecho.group(2):
+            # Comentário vira um espaço
+            fora_de_literal.append(' ')
+            continue
+        partes.append(re.sub(r'\s+', ' ', ''.join(fora_de_literal).lower()))
+        partes.append(trecho.group(1))  # literal fica exatamente como está
+        fora_de_literal = []
+    fora_de_literal.append(sql[posicao:])
+    partes.append(re.sub(r'\s+', ' ', ''.join(fora_de_literal).lower()))
+    return ''.join(partes).strip().rstrip(';').rstrip()
+
+
+def tabelas_da_consulta(sql):
+    """Nomes (em minúsculas) das tabelas citadas depois de FROM/JOIN/INTO/UPDATE."""
+    return {nome.lower() for nome in _TABELAS.findall(normalizar_sql(sql))}
+
+
+class CacheConsultas:
+    """
+    Cache LRU com validade (TTL) para resultados de consultas.
+
+    Args:
+        capacidade (int): Máximo de consultas guardadas.
+        ttl (float): Validade de cada resultado em segundos (None = sem limite).
+        caminho_disco (str, optional): Arquivo onde o cache é mantido entre
+            execuções.
+        max_linhas (int): Resultados maiores que isso não são guardados.
+    """
+
+    def __init__(self, capacidade=64, ttl=300.0, caminho_disco=None, max_linhas=100_000):
+        self.capacidade = capacidade
+        self.ttl = ttl
+        self.caminho_disco = caminho_disco
+        self.max_linhas = max_linhas
+        self._entradas = OrderedDict()  # chave -> (expira_em, tabelas, resultados, colunas)
+        self._trava = threading.RLock()
+        self.estatisticas = {'acertos': 0, 'falhas': 0, 'invalidadas': 0}
+        if caminho_disco:
+            self._carregar_disco()
+
+    @staticmethod
+    def chave(sql, parametros=None, banco=None):
+        # O mesmo SQL no MySQL e no SQLite local tem resultados diferentes
+        return (banco, normalizar_sql(sql), tuple(parametros) if parametros else ())
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def contem(self, sql, parametros=None, banco=None):
+        """True se houver resultado válido da consulta nesse banco (sem contar acerto/falha)."""
+        return self.obter(sql, parametros, contar=False, banco=banco) is not None
+
+    def obter(self, sql, parametros=None, contar=True, banco=None):
+        """
+        Args:
+            banco: Identidade do banco que executa a consulta
+                (PoolConexoes.identidade).
+
+        Returns:
+            tuple | None: (resultados, colunas) se houver resultado válido.
+        """
+        chave = self.chave(sql, parametros, banco)
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is not None and entrada[0] is not None and entrada[0] < time.time():
+                # Expirou
+                del self._entradas[chave]
+                entrada = None
+            if contar:
+                self.estatisticas['acertos' if entrada else 'falhas'] += 1
+            if entrada is None:
+                return None
+            self._entradas.move_to_end(chave)
+            return entrada[2], entrada[3]
+
+    def guardar(self, sql, resultados, colunas, parametros=None, banco=None):
+        """Guarda o resultado (se couber em max_linhas), descartando o mais antigo se preciso."""
+        if len(resultados) > self.max_linhas:
+            return False
+        expira_em = time.time() + self.ttl if self.ttl is not None else None
+        with self._trava:
+            chave = self.chave(sql, parametros, banco)
+            self._entradas[chave] = (expira_em, tabelas_da_consulta(sql), list(resultados), list(colunas))
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.capacidade:
+                self._entradas.popitem(last=False)
+            self._gravar_disco()
+        return True
+
+    def invalidar_tabela(self, tabela):
+        """Remove todos os resultados que dependem da tabela. Retorna quantos."""
+        tabela = tabela.lower()
+        with self._trava:
+            chaves = [chave for chave, entrada in self._entradas.items() if tabela in entrada[1]]
+            for chave in chaves:
+                del self._entradas[chave]
+            self.estatisticas['invalidadas'] += len(chaves)
+            if chaves:
+                self._gravar_disco()
+        return len(chaves)
+
+    def limpar(self):
+        with self._trava:
+            self._entradas.clear()
+            self._gravar_disco()
+
+    def executar(self, pool, sql, parametros=None):
+        """
+        Retorna o resultado do cache ou executa a consulta no pool e o guarda.
+
+        Comandos que alteram dados (INSERT, UPDATE, DELETE...) nunca são
+        guardados e invalidam as tabelas que tocam.
+        """
+        if _ALTERACAO.match(normalizar_sql(sql)):
+            resultado = pool.executar(sql, parametros)
+            for tabela in tabelas_da_consulta(sql):
+                self.invalidar_tabela(tabela)
+            return resultado
+
+        em_cache = self.obter(sql, parametros, banco=pool.identidade)
+        if em_cache is not None:
+            return em_cache
+        resultados, colunas = pool.executar(sql, parametros)
+        self.guardar(sql, resultados, colunas, parametros, banco=pool.identidade)
+        return resultados, colunas
+
+    def _carregar_disco(self):
+        try:
+            with open(self.caminho_disco, 'rb') as arquivo:
+                entradas = pickle.load(arquivo)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return
+        agora = time.time()
+        for chave, entrada in entradas.items():
+            if entrada[0] is None or entrada[0] >= agora:
+                self._entradas[chave] = entrada
+
+    def _gravar_disco(self):
+        if not self.caminho_disco:
+            return
+        # Grava em arquivo temporário e troca de uma vez (como o cache de medidas)
+        temporario = self.caminho_disco + '.tmp'
+        with open(temporario, 'wb') as arquivo:
+            pickle.dump(dict(self._entradas), arquivo)
+        os.replace(temporario, self.caminho_disco)
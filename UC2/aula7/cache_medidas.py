@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+# ==============================================================================
+# CACHE DE MEDIDAS EM DISCO (ARQUIVO AO LADO DO CSV)
+# ==============================================================================
+#
+# As medidas calculadas a partir de um CSV ficam gravadas em um arquivo
+# "<nome>.csv.medidas.json" ao lado do próprio CSV, junto com a impressão
+# digital do arquivo (caminho, tamanho, data de modificação e hash SHA-256).
+# Se o CSV mudar, o cache é descartado e as medidas são recalculadas.
+
+SUFIXO_CACHE = '.medidas.json'
+
+
+def calcular_hash_arquivo(caminho, tamanho_bloco=1024 * 1024):
+    """Calcula o SHA-256 do arquivo lendo em blocos de 1 MB."""
+    hash_sha256 = hashlib.sha256()
+    with open(caminho, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(tamanho_bloco), b''):
+            hash_sha256.update(bloco)
+    return hash_sha256.hexdigest()
+
+
+def impressao_digital(caminho, calcular_hash=True):
+    """
+    Retorna o dicionário que identifica o conteúdo atual do arquivo.
+    """
+    info = os.stat(caminho)
+    digital = {
+        'caminho': os.path.abspath(caminho),
+        'tamanho': info.st_size,
+        'mtime_ns': info.st_mtime_ns,
+    }
+    if calcular_hash:
+        digital['sha256'] = calcular_hash_arquivo(caminho)
+    return digital
+
+
+def _caminho_cache(caminho_csv):
+    return caminho_csv + SUFIXO_CACHE
+
+
+def _para_json(valor):
+    # Converte escalares e arrays do NumPy para tipos nativos do Python
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    raise TypeError(f"Tipo não suportado no cache: {type(valor).__name__}")
+
+
+def _ler_cache(caminho_cache):
+    try:
+        with open(caminho_cache, 'r', encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _gravar_cache(caminho_cache, conteudo):
+    # Grava em arquivo temporário e troca de uma vez, para nunca deixar um
+    # cache pela metade se o processo for interrompido
+    temporario = caminho_cache + '.tmp'
+    with open(temporario, 'w', encoding='utf-8') as arquivo:
+        json.dump(conteudo, arquivo, ensure_ascii=False, indent=2, default=_para_json)
+    os.replace(temporario, caminho_cache)
+
+
+def cache_valido(caminho_csv, cache):
+    """
+    Verifica se o cache ainda corresponde ao CSV.
+
+    Se caminho, tamanho e data de modificação forem iguais o cache é aceito sem
+    ler o CSV. Se só a data mudou (ex.: arquivo copiado ou "tocado"), o hash do
+    conteúdo decide.
+    """
+    if not cache or 'impressao_digital' not in cache:
+        return False
+
+    salvo = cache['impressao_digital']
+    atual = impressao_digital(caminho_csv, calcular_hash=False)
+    if salvo.get('caminho') != atual['caminho'] or salvo.get('tamanho') != atual['tamanho']:
+        return False
+    if salvo.get('mtime_ns') == atual['mtime_ns']:
+        return True
+    return salvo.get('sha256') == calcular_hash_arquivo(caminho_csv)
+
+
+def obter_medidas_em_cache(caminho_csv, chave, calcular):
+    """
+    Retorna as medidas gravadas para (caminho_csv, chave) ou as calcula.
+
+    Args:
+        caminho_csv (str): CSV de origem dos dados.
+        chave (str): Identifica o cálculo (ex.: 'medidas_descritivas:TotalAmount').
+        calcular (callable): Função sem argumentos que lê o CSV e devolve as
+            medidas. Só é chamada se o cache estiver ausente ou desatualizado.
+
+    Returns:
+        dict: As medidas (do cache ou recém-calculadas).
+    """
+    caminho_cache = _caminho_cache(caminho_csv)
+    cache = _ler_cache(caminho_cache)
+
+    if cache_valido(caminho_csv, cache):
+        # Se o hash confirmou o conteúdo, guarda a nova data de modificação
+        # para que a próxima verificação não precise ler o CSV
+        mtime_ns = os.stat(caminho_csv).st_mtime_ns
+        if cache['impressao_digital']['mtime_ns'] != mtime_ns:
+            cache['impressao_digital']['mtime_ns'] = mtime_ns
+            if chave in cache['resultados']:
+                _gravar_cache(caminho_cache, cache)
+
+        if chave in cache['resultados']:
+            return cache['resultados'][chave]
+    else:
+        cache = {'impressao_digital': impressao_digital(caminho_csv), 'resultados': {}}
+
+    medidas = calcular()
+    cache['resultados'][chave] = medidas
+    _gravar_cache(caminho_cache, cache)
+    return medidas
+
+
+def limpar_cache(caminho_csv):
+    """Remove o arquivo de cache do CSV, se existir."""
+    try:
+        os.remove(_caminho_cache(caminho_csv))
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,262 @@
+import argparse
+import json
+import os
+
+import pandas as pd
+
+from cache_medidas import cache_valido, impressao_digital
+
+# ==============================================================================
+# LEITURA COLUNAR DOS CSVs (CACHE EM FEATHER/PARQUET)
+# ==============================================================================
+#
+# Na primeira leitura o CSV é convertido, com os tipos abaixo, para um arquivo
+# colunar "<nome>.csv.feather" (ou ".parquet") ao lado dele. As leituras
+# seguintes mapeiam esse arquivo em memória e trazem só as colunas pedidas.
+# A impressão digital do CSV (cache_medidas.py) é gravada nos metadados do
+# próprio arquivo colunar: se o CSV mudar, o arquivo é gerado de novo.
+
+# pyarrow só é importado na primeira leitura (veja pyarrow_disponivel), para
+# não pesar no início dos scripts que nem chegam a ler os dados
+pa = feather = pq = None
+
+# Chave dos metadados do esquema Arrow com a impressão digital do CSV
+CHAVE_IMPRESSAO = b'colunar:impressao_digital'
+
+# Tipos por nome de coluna (valem para qualquer um dos CSVs do UC2)
+TIPOS_COLUNAS = {
+    # orders.csv
+    'OrderID': 'str',
+    'CustomerID': 'str',
+    'ProductID': 'category',
+    'SellerID': 'str',
+    'Quantity': 'int16',
+    'Discount': 'float32',
+    'Tax': 'float32',
+    'ShippingCost': 'float32',
+    'TotalAmount': 'float32',
+    'PaymentMethod': 'category',
+    'OrderStatus': 'category',
+    # customers.csv
+    'CustomerName': 'str',
+    'City': 'category',
+    'State': 'category',
+    'Country': 'category',
+    # products.csv
+    'ProductName': 'str',
+    'Category': 'category',
+    'Brand': 'category',
+    'UnitPrice': 'float32',
+    # vendas_pedidos.csv / vendas_clientes.csv / vendas_produtos.csv
+    'id_pedido': 'int32',
+    'id_cliente': 'int32',
+    'id_produto': 'int32',
+    'id_produtos': 'int32',
+    'valor_total': 'float32',
+    'quantidade': 'int16',
+    'nome': 'str',
+    'email': 'str',
+    'categoria': 'category',
+    'preco': 'float32',
+    'estoque': 'int32',
+}
+
+COLUNAS_DATA = ['OrderDate', 'data_pedido']
+
+FORMATOS = ('feather', 'parquet')
+
+# Arquivo lido pelos notebooks do Projeto (pl.scan_parquet("../Projeto/orders.parquet"))
+PARQUET_NOTEBOOKS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Projeto', 'orders.parquet')
+
+
+def pyarrow_disponivel():
+    """
+    Importa o pyarrow na primeira chamada.
+
+    Sem pyarrow não há cache colunar: os CSVs são lidos direto, já tipados.
+    """
+    global pa, feather, pq
+    if feather is None:
+        try:
+            import pyarrow as modulo_pyarrow
+            import pyarrow.feather as modulo_feather
+            import pyarrow.parquet as modulo_parquet
+        except ImportError:
+            return False
+        pa, feather, pq = modulo_pyarrow, modulo_feather, modulo_parquet
+    return True
+
+
+def colunas_do_csv(caminho_csv):
+    """Lê só o cabeçalho do CSV."""
+    return list(pd.read_csv(caminho_csv, nrows=0, encoding='utf-8-sig').columns)
+
+
+def _verificar_colunas(colunas, disponiveis):
+    faltando = [coluna for coluna in colunas if coluna not in disponiveis]
+    if faltando:
+        raise KeyError(f"Coluna '{faltando[0]}' não encontrada. Colunas disponíveis: {disponiveis}")
+
+
+def ler_csv_tipado(caminho_csv, colunas=None):
+    """
+    Lê o CSV já com os tipos de TIPOS_COLUNAS e as datas convertidas.
+
+    Args:
+        caminho_csv (str): Arquivo CSV (com ou sem BOM).
+        colunas (list, optional): Só estas colunas (padrão: todas).
+
+    Raises:
+        KeyError: Se alguma coluna pedida não existir.
+    """
+    disponiveis = colunas_do_csv(caminho_csv)
+    if colunas is not None:
+        _verificar_colunas(colunas, disponiveis)
+    usadas = disponiveis if colunas is None else colunas
+
+    return pd.read_csv(
+        caminho_csv,
+        usecols=colunas,
+        encoding='utf-8-sig',
+        dtype={coluna: TIPOS_COLUNAS[coluna] for coluna in usadas if coluna in TIPOS_COLUNAS},
+        parse_dates=[coluna for coluna in COLUNAS_DATA if coluna in usadas],
+    )
+
+
+def caminho_colunar(caminho_csv, formato='feather'):
+    return f"{caminho_csv}.{formato}"
+
+
+def converter_csv(caminho_csv, destino, formato='feather'):
+    """
+    Converte o CSV inteiro para Feather (sem compressão, para poder ser
+    mapeado em memória) ou Parquet.
+
+    Returns:
+        dict: Arquivo gerado, número de linhas e colunas.
+    """
+    if not pyarrow_disponivel():
+        raise ImportError("A conversão para Feather/Parquet precisa do pacote 'pyarrow'")
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato '{formato}' inválido. Use um de: {FORMATOS}")
+
+    # Impressão tirada antes da leitura: se o CSV mudar no meio, a próxima
+    # leitura percebe e converte de novo
+    digital = impressao_digital(caminho_csv)
+    df = ler_csv_tipado(caminho_csv)
+    tabela = pa.Table.from_pandas(df, preserve_index=False)
+    metadados = dict(tabela.schema.metadata or {})
+    metadados[CHAVE_IMPRESSAO] = json.dumps(digital).encode('utf-8')
+    tabela = tabela.replace_schema_metadata(metadados)
+
+    # Grava em arquivo temporário e troca de uma vez (como o cache de medidas)
+    temporario = destino + '.tmp'
+    if formato == 'feather':
+        feather.write_feather(tabela, temporario, compression='uncompressed')
+    else:
+        pq.write_table(tabela, temporario)
+    os.replace(temporario, destino)
+    return {'arquivo': os.path.abspath(destino), 'linhas': len(df), 'colunas': list(df.columns)}
+
+
+def esquema_colunar(destino, formato='feather'):
+    """Esquema Arrow do arquivo colunar (sem ler os dados), ou None se não existir."""
+    try:
+        if formato == 'feather':
+            with pa.memory_map(destino) as arquivo:
+                return pa.ipc.open_file(arquivo).schema
+        return pq.read_schema(destino)
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return None
+
+
+def colunar_atualizado(caminho_csv, esquema):
+    """
+    Verifica se o arquivo colunar foi gerado a partir do CSV atual.
+
+    Usa a mesma regra do cache de medidas (cache_valido): se só a data do
+    CSV mudou, o hash do conteúdo decide.
+    """
+    if esquema is None or CHAVE_IMPRESSAO not in (esquema.metadata or {}):
+        return False
+    salvo = json.loads(esquema.metadata[CHAVE_IMPRESSAO])
+    return cache_valido(caminho_csv, {'impressao_digital': salvo})
+
+
+def carregar_tabela(caminho_csv, colunas=None, formato='feather'):
+    """
+    Retorna o conteúdo tipado do CSV a partir do cache colunar.
+
+    Args:
+        caminho_csv (str): CSV de origem.
+        colunas (list, optional): Só estas colunas (padrão: todas).
+        formato (str): 'feather' (padrão) ou 'parquet'.
+
+    Returns:
+        pd.DataFrame: Com os tipos de TIPOS_COLUNAS e datas convertidas.
+
+    Raises:
+        FileNotFoundError: Se o CSV não existir.
+        KeyError: Se alguma coluna pedida não existir.
+    """
+    if not pyarrow_disponivel():
+        return ler_csv_tipado(caminho_csv, colunas)
+
+    destino = caminho_colunar(caminho_csv, formato)
+    esquema = esquema_colunar(destino, formato)
+    if not colunar_atualizado(caminho_csv, esquema):
+        converter_csv(caminho_csv, destino, formato)
+        esquema = esquema_colunar(destino, formato)
+    if colunas is not None:
+        _verificar_colunas(colunas, esquema.names)
+
+    if formato == 'feather':
+        tabela = feather.read_table(destino, columns=colunas, memory_map=True)
+    else:
+        tabela = pq.read_table(destino, columns=colunas, memory_map=True)
+    return tabela.to_pandas()
+
+
+def exportar_parquet_notebooks(caminho_csv, destino=PARQUET_NOTEBOOKS):
+    """
+    Gera o orders.parquet lido pelos notebooks do Projeto.
+
+    Os notebooks convertem OrderDate com .str.strptime, então a data é
+    gravada como texto 'AAAA-MM-DD'; as demais colunas seguem TIPOS_COLUNAS.
+    """
+    if not pyarrow_disponivel():
+        raise ImportError("A exportação para Parquet precisa do pacote 'pyarrow'")
+
+    df = carregar_tabela(caminho_csv)
+    for coluna in COLUNAS_DATA:
+        if coluna in df.columns:
+            df[coluna] = df[coluna].dt.strftime('%Y-%m-%d')
+    df.to_parquet(destino, index=False)
+    return os.path.abspath(destino)
+
+
+def main():
+    pasta_uc2 = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    padrao = [os.path.join(pasta_uc2, nome) for nome in (
+        'orders.csv', 'customers.csv', 'products.csv',
+        'vendas_pedidos.csv', 'vendas_clientes.csv', 'vendas_produtos.csv')]
+
+    parser = argparse.ArgumentParser(description="Converte os CSVs do UC2 para Feather/Parquet tipados")
+    parser.add_argument('csv', nargs='*', default=padrao,
+                        help="CSVs a converter (padrão: orders, customers, products e vendas_* do UC2)")
+    parser.add_argument('--formato', choices=FORMATOS, default='feather')
+    parser.add_argument('--notebooks', action='store_true',
+                        help="também gera Projeto/orders.parquet a partir do primeiro CSV")
+    args = parser.parse_args()
+
+    for caminho_csv in args.csv:
+        df = carregar_tabela(caminho_csv, formato=args.formato)
+        memoria = df.memory_usage(deep=True).sum() / 1024
+        print(f"{os.path.basename(caminho_csv)}: {len(df)} linhas, {memoria:.1f} KB em memória")
+
+    if args.notebooks:
+        print(f"Parquet dos notebooks: {exportar_parquet_notebooks(args.csv[0])}")
+
+
+if __name__ == "__main__":
+    main()
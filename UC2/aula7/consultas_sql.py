@@ -0,0 +1,281 @@
+import os
+import re
+import threading
+
+from cache_consultas import normalizar_sql, tabelas_da_consulta
+
+# ==============================================================================
+# REGISTRO DAS CONSULTAS DO ARQUIVO Projeto/consultas.txt
+# ==============================================================================
+#
+# Os arquivos separam as consultas com uma faixa de asteriscos e o nome. Os
+# comentários logo abaixo da faixa são a descrição mostrada no menu, e os
+# comentários "-- :nome = valor" declaram os parâmetros com o valor padrão:
+#
+#     ************ 'Primeira Query' ************
+#     -- Pedidos com valor superior a um mínimo
+#     -- :valor_minimo = 100
+#
+#     select ... where orders.TotalAmount > :valor_minimo
+#
+# Arquivos sem faixas são divididos pelo ";" no fim das consultas.
+#
+# Cada arquivo é lido uma vez; para acrescentar uma consulta ao menu basta
+# escrevê-la no Projeto/consultas.txt. Os parâmetros viram marcadores do
+# driver (? no SQLite, %s no MySQL) e os valores vão separados, então o texto
+# do comando é sempre o mesmo e o comando preparado na conexão
+# (PoolConexoes.executar(..., preparada=True)) é reaproveitado para qualquer
+# valor.
+#
+# Exemplo:
+#     pool = obter_pool('amazon')
+#     sql, valores = obter_registro().obter(1).para_execucao(pool.marcador, {'valor_minimo': 500})
+#     resultados, colunas = pool.executar(sql, valores, preparada=True)
+
+ARQUIVO_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Projeto', 'consultas.txt')
+
+_FAIXA = re.compile(r"^\s*\*{3,}\s*'([^']*)'\s*\*{3,}\s*$", re.MULTILINE)
+_INICIO_CONSULTA = re.compile(r'^\s*(select|with)\b', re.IGNORECASE)
+_VALOR_PADRAO = re.compile(r'^--\s*:(\w+)\s*=\s*(.*?)\s*$')
+# Literais e comentários são pulados; o grupo 2 é o nome do parâmetro
+_PARAMETRO = re.compile(
+    r"('(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"|--[^\n]*|/\*.*?\*/)|(?<![:\w]):([A-Za-z_]\w*)",
+    re.DOTALL)
+
+
+def converter_valor(texto):
+    """'100' -> 100, '2.5' -> 2.5, "'New York'" -> 'New York'."""
+    texto = texto.strip()
+    for tipo in (int, float):
+        try:
+            return tipo(texto)
+        except ValueError:
+            pass
+    if len(texto) >= 2 and texto[0] == texto[-1] and texto[0] in "'\"":
+        return texto[1:-1]
+    return texto
+
+
+def ler_valores(textos):
+    """
+    ['cidade=Miami', 'valor_minimo=500'] -> {'cidade': 'Miami', 'valor_minimo': '500'}
+
+    Os textos são convertidos para o tipo do valor padrão em para_execucao.
+
+    Raises:
+        ValueError: Item sem "=".
+    """
+    valores = {}
+    for texto in textos or ():
+        nome, separador, valor = texto.partition('=')
+        if not separador or not nome.strip():
+            raise ValueError(f"Parâmetro '{texto}' inválido; use nome=valor")
+        valores[nome.strip().lstrip(':')] = valor.strip()
+    return valores
+
+
+def _no_tipo_do_padrao(nome, valor, padrao):
+    # Texto digitado (menu ou linha de comando) para o tipo do valor padrão
+    if not isinstance(valor, str) or isinstance(padrao, bool) or not isinstance(padrao, (int, float)):
+        return valor
+    # Padrão inteiro também aceita decimal (valor_minimo=99.90)
+    for tipo in ((int, float) if isinstance(padrao, int) else (float,)):
+        try:
+            return tipo(valor)
+        except ValueError:
+            pass
+    raise ValueError(f"Parâmetro ':{nome}' deve ser um número, não '{valor}'")
+
+
+class Consulta:
+    """
+    Uma consulta do arquivo, já normalizada.
+
+    Attributes:
+        numero (int): Posição no registro (começa em 1; é a opção do menu).
+        nome (str): Nome da faixa (ex.: 'Primeira Query').
+        descricao (str): Comentário abaixo da faixa (ou o próprio nome).
+        sql (str): Texto da consulta, como está no arquivo (com :parâmetros).
+        parametros (dict): Valor padrão de cada parâmetro, na ordem declarada.
+        chave (str): SQL normalizado (o mesmo usado pelo cache de consultas).
+        tabelas (set): Tabelas lidas pela consulta.
+        arquivo (str): Arquivo de onde a consulta veio.
+    """
+
+    def __init__(self, numero, nome, descricao, sql, arquivo, parametros=None):
+        self.numero = numero
+        self.nome = nome
+        self.descricao = descricao or nome
+        self.sql = sql
+        self.parametros = dict(parametros or {})
+        self.chave = normalizar_sql(sql)
+        self.tabelas = tabelas_da_consulta(sql)
+        self.arquivo = arquivo
+        # Nomes na ordem em que aparecem (um parâmetro pode aparecer mais de uma vez)
+        self._usados = [trecho.group(2) for trecho in _PARAMETRO.finditer(sql) if trecho.group(2)]
+        self._compiladas = {}
+
+        sem_valor = [nome for nome in self.parametros if nome not in self._usados]
+        if sem_valor:
+            raise ValueError(f"Parâmetro ':{sem_valor[0]}' declarado em '{nome}' mas não usado no SQL")
+
+    def para_execucao(self, marcador='%s', valores=None):
+        """
+        SQL com os marcadores do driver e a tupla de valores na ordem certa.
+
+        Args:
+            marcador (str): '?' (sqlite3) ou '%s' (mysql.connector); veja
+                PoolConexoes.marcador.
+            valores (dict, optional): Valores que substituem os padrões (texto
+                é convertido para o tipo do padrão). Nomes que a consulta não
+                usa são ignorados.
+
+        Raises:
+            KeyError: Parâmetro sem valor padrão e sem valor informado.
+            ValueError: Texto que não pode ser convertido para o tipo do padrão.
+        """
+        if marcador not in self._compiladas:
+            self._compiladas[marcador] = _PARAMETRO.sub(
+                lambda trecho: trecho.group(1) or marcador, self.sql)
+        informados = {nome: _no_tipo_do_padrao(nome, valor, self.parametros.get(nome))
+                      for nome, valor in (valores or {}).items() if nome in self._usados}
+        valores = {**self.parametros, **informados}
+        faltando = [nome for nome in self._usados if nome not in valores]
+        if faltando:
+            raise KeyError(f"Parâmetro ':{faltando[0]}' da consulta '{self.nome}' sem valor")
+        return self._compiladas[marcador], tuple(valores[nome] for nome in self._usados)
+
+    def converter(self, nome, valor):
+        """
+        Converte o texto digitado para o tipo do valor padrão do parâmetro.
+
+        Raises:
+            ValueError: Texto que não é número, quando o padrão é número.
+        """
+        return _no_tipo_do_padrao(nome, valor, self.parametros.get(nome))
+
+    @property
+    def nome_arquivo(self):
+        """'Primeira Query' -> 'primeira_query' (para nomes de arquivos de saída)."""
+        return nome_de_arquivo(self.nome)
+
+    def __repr__(self):
+        return f"Consulta({self.numero}, {self.nome!r})"
+
+
+def nome_de_arquivo(texto):
+    """'Primeira Query' -> 'primeira_query' (para nomes de arquivos de saída)."""
+    return re.sub(r'\W+', '_', texto.lower()).strip('_')
+
+
+def _separar_descricao(trecho):
+    # Comentários antes da primeira linha de SQL viram a descrição, menos os
+    # "-- :nome = valor", que são os parâmetros
+    linhas = trecho.strip().splitlines()
+    descricao = []
+    parametros = {}
+    while linhas and (linhas[0].lstrip().startswith('--') or not linhas[0].strip()):
+        linha = linhas.pop(0).strip()
+        padrao = _VALOR_PADRAO.match(linha)
+        if padrao:
+            parametros[padrao.group(1)] = converter_valor(padrao.group(2))
+        elif linha[2:].strip():
+            descricao.append(linha[2:].strip())
+    sql = '\n'.join(linhas).strip().rstrip(';').strip()
+    return ' '.join(descricao), parametros, sql
+
+
+def ler_arquivo_consultas(caminho):
+    """
+    Lê as consultas de um arquivo de texto.
+
+    Returns:
+        list: [(nome, descrição, parâmetros, sql), ...] na ordem do arquivo.
+        Consultas sem faixa recebem o número da posição como nome.
+    """
+    with open(caminho, encoding='utf-8-sig') as arquivo:
+        texto = arquivo.read()
+
+    faixas = list(_FAIXA.finditer(texto))
+    if not faixas:
+        trechos = [_separar_descricao(trecho) for trecho in texto.split(';')]
+        trechos = [trecho for trecho in trechos if trecho[2]]
+        return [(str(numero), *trecho) for numero, trecho in enumerate(trechos, start=1)]
+
+    consultas = []
+    trecho = _separar_descricao(texto[:faixas[0].start()])
+    if trecho[2]:
+        consultas.append(('0', *trecho))
+    for indice, faixa in enumerate(faixas):
+        fim = faixas[indice + 1].start() if indice + 1 < len(faixas) else len(texto)
+        trecho = _separar_descricao(texto[faixa.end():fim])
+        if trecho[2]:
+            consultas.append((faixa.group(1), *trecho))
+    return consultas
+
+
+class RegistroConsultas:
+    """
+    Consultas lidas de um ou mais arquivos, numeradas na ordem em que aparecem.
+
+    Raises:
+        ValueError: Nome repetido ou trecho que não é uma consulta (SELECT/WITH).
+    """
+
+    def __init__(self, *caminhos):
+        self._consultas = []
+        self._por_nome = {}
+        for caminho in caminhos:
+            self.carregar(caminho)
+
+    def carregar(self, caminho):
+        """Acrescenta as consultas do arquivo; retorna quantas foram lidas."""
+        lidas = ler_arquivo_consultas(caminho)
+        for nome, descricao, parametros, sql in lidas:
+            if not _INICIO_CONSULTA.match(normalizar_sql(sql)):
+                raise ValueError(f"'{nome}' em {caminho} não é uma consulta (SELECT/WITH)")
+            consulta = Consulta(len(self._consultas) + 1, nome, descricao, sql, caminho, parametros)
+            for chave in {nome.lower(), consulta.nome_arquivo}:
+                if chave in self._por_nome:
+                    raise ValueError(f"Consulta '{nome}' repetida em {caminho}")
+                self._por_nome[chave] = consulta
+            self._consultas.append(consulta)
+        return len(lidas)
+
+    def __iter__(self):
+        return iter(self._consultas)
+
+    def __len__(self):
+        return len(self._consultas)
+
+    def obter(self, chave):
+        """
+        Procura pelo número (1, '1'), pelo nome ('Primeira Query') ou pelo
+        nome de arquivo ('primeira_query').
+
+        Raises:
+            KeyError: Consulta inexistente.
+        """
+        if isinstance(chave, int) or str(chave).isdigit():
+            numero = int(chave)
+            if 1 <= numero <= len(self._consultas):
+                return self._consultas[numero - 1]
+        else:
+            consulta = self._por_nome.get(chave.lower())
+            if consulta is not None:
+                return consulta
+        raise KeyError(f"Consulta '{chave}' não existe. Disponíveis: 1 a {len(self._consultas)} "
+                       f"ou {[consulta.nome for consulta in self._consultas]}")
+
+
+_registro = None
+_trava_registro = threading.Lock()
+
+
+def obter_registro():
+    """Registro do Projeto/consultas.txt, lido na primeira chamada."""
+    global _registro
+    with _trava_registro:
+        if _registro is None:
+            _registro = RegistroConsultas(ARQUIVO_PADRAO)
+        return _registro
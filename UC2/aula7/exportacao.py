@@ -0,0 +1,257 @@
+import csv
+import os
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import islice
+
+from banco import TAMANHO_LOTE
+
+# ==============================================================================
+# EXPORTAÇÃO DE RESULTADOS DE CONSULTAS PARA CSV/PARQUET
+# ==============================================================================
+#
+# As linhas vêm do banco em lotes (fetchmany) e cada lote é gravado de uma vez
+# (csv.writerows ou um row group do Parquet), então nem o resultado inteiro
+# fica na memória nem há um print por linha. Os tipos das colunas saem do
+# cursor.description; quando o driver não informa (sqlite3), são deduzidos
+# dos valores do primeiro lote.
+#
+# Os arquivos gerados podem ser lidos direto pelos scripts de estatística:
+#     carregar_tabela('consulta1.csv')        (colunar.py)
+#     pd.read_parquet('consulta1.parquet')
+#
+# Exemplo:
+#     info = exportar_consulta(obter_pool('amazon'), query, 'pedidos.parquet')
+#     print(f"{info['linhas']} linhas, {info['linhas_por_segundo']:.0f} linhas/s")
+
+# pyarrow só é importado ao exportar Parquet
+pa = pq = None
+
+FORMATOS_EXPORTACAO = ('csv', 'parquet')
+
+# Códigos de tipo do mysql.connector (mysql.connector.constants.FieldType).
+# DECIMAL vira float64, que é o tipo usado nos cálculos de estatística.
+TIPOS_MYSQL = {
+    0: 'float64',     # DECIMAL
+    246: 'float64',   # NEWDECIMAL
+    4: 'float64',     # FLOAT
+    5: 'float64',     # DOUBLE
+    1: 'int64',       # TINY
+    2: 'int64',       # SHORT
+    3: 'int64',       # LONG
+    8: 'int64',       # LONGLONG
+    9: 'int64',       # INT24
+    13: 'int64',      # YEAR
+    7: 'timestamp',   # TIMESTAMP
+    12: 'timestamp',  # DATETIME
+    10: 'date',       # DATE
+    14: 'date',       # NEWDATE
+    11: 'duracao',    # TIME
+    249: 'binario',   # TINY_BLOB
+    250: 'binario',   # MEDIUM_BLOB
+    251: 'binario',   # LONG_BLOB
+    252: 'binario',   # BLOB
+}
+
+# Para drivers sem código de tipo: tipo Python do primeiro valor não nulo
+# (bool antes de int, datetime antes de date, por causa da herança)
+TIPOS_PYTHON = [
+    (bool, 'bool'),
+    (int, 'int64'),
+    (float, 'float64'),
+    (Decimal, 'float64'),
+    (datetime, 'timestamp'),
+    (date, 'date'),
+    (timedelta, 'duracao'),
+    (bytes, 'binario'),
+]
+
+
+def _importar_pyarrow():
+    global pa, pq
+    if pa is None:
+        try:
+            import pyarrow as modulo_pa
+            import pyarrow.parquet as modulo_pq
+        except ImportError:
+            raise ImportError("A exportação para Parquet precisa do pacote 'pyarrow'") from None
+        pa, pq = modulo_pa, modulo_pq
+
+
+def formato_do_arquivo(destino):
+    """Formato pela extensão do arquivo ('.csv' ou '.parquet')."""
+    formato = os.path.splitext(destino)[1].lstrip('.').lower()
+    if formato not in FORMATOS_EXPORTACAO:
+        raise ValueError(f"Extensão de '{destino}' não reconhecida. Use um de: {FORMATOS_EXPORTACAO}")
+    return formato
+
+
+def _tipo_pelo_valor(valores):
+    for valor in valores:
+        if valor is None:
+            continue
+        for classe, tipo in TIPOS_PYTHON:
+            if isinstance(valor, classe):
+                return tipo
+        return 'str'
+    return 'str'
+
+
+def tipos_das_colunas(descricao, primeiro_lote):
+    """
+    Tipo de cada coluna ('int64', 'float64', 'date', 'timestamp', 'str'...).
+
+    Args:
+        descricao (list): cursor.description, ou só os nomes das colunas.
+        primeiro_lote (list): Linhas usadas quando o driver não informa o tipo.
+
+    Returns:
+        list: [(nome, tipo), ...]
+    """
+    tipos = []
+    for indice, coluna in enumerate(descricao):
+        if isinstance(coluna, str):
+            nome, codigo = coluna, None
+        else:
+            nome, codigo = coluna[0], coluna[1]
+        tipo = TIPOS_MYSQL.get(codigo) if isinstance(codigo, int) else None
+        if tipo is None:
+            tipo = _tipo_pelo_valor(linha[indice] for linha in primeiro_lote)
+        tipos.append((nome, tipo))
+    return tipos
+
+
+def _em_lotes(linhas, tamanho_lote):
+    linhas = iter(linhas)
+    while True:
+        lote = list(islice(linhas, tamanho_lote))
+        if not lote:
+            return
+        yield lote
+
+
+def _esquema_arrow(tipos):
+    tipos_arrow = {
+        'bool': pa.bool_(),
+        'int64': pa.int64(),
+        'float64': pa.float64(),
+        'date': pa.date32(),
+        'timestamp': pa.timestamp('us'),
+        'duracao': pa.duration('us'),
+        'binario': pa.binary(),
+        'str': pa.string(),
+    }
+    return pa.schema([(nome, tipos_arrow[tipo]) for nome, tipo in tipos])
+
+
+def _valores_da_coluna(valores, tipo):
+    if tipo == 'float64':
+        # Decimal não é convertido automaticamente para float64
+        return [None if valor is None else float(valor) for valor in valores]
+    if tipo == 'str':
+        return [valor if valor is None or isinstance(valor, str) else str(valor) for valor in valores]
+    return valores
+
+
+def _gravar_csv(temporario, tipos, lotes):
+    total = 0
+    with open(temporario, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow([nome for nome, _ in tipos])
+        for lote in lotes:
+            # None vira campo vazio; datas no formato ISO
+            escritor.writerows(lote)
+            total += len(lote)
+    return total
+
+
+def _gravar_parquet(temporario, tipos, lotes):
+    esquema = _esquema_arrow(tipos)
+    total = 0
+    with pq.ParquetWriter(temporario, esquema) as escritor:
+        for lote in lotes:
+            colunas = list(zip(*lote))
+            arrays = [pa.array(_valores_da_coluna(colunas[indice], tipo), type=esquema.field(indice).type)
+                      for indice, (_, tipo) in enumerate(tipos)]
+            # Cada lote vira um row group
+            escritor.write_table(pa.Table.from_arrays(arrays, schema=esquema))
+            total += len(lote)
+    return total
+
+
+def exportar_linhas(descricao, linhas, destino, formato=None, tamanho_lote=TAMANHO_LOTE):
+    """
+    Grava as linhas em CSV ou Parquet, um lote de cada vez.
+
+    Args:
+        descricao (list): cursor.description ou só os nomes das colunas.
+        linhas (iterable): Linhas do resultado (podem vir de um gerador).
+        destino (str): Arquivo a gerar (substituído se já existir).
+        formato (str, optional): 'csv' ou 'parquet' (padrão: pela extensão).
+        tamanho_lote (int): Linhas gravadas por vez.
+
+    Returns:
+        dict: Arquivo, linhas, colunas com os tipos, segundos e linhas por segundo.
+
+    Raises:
+        ValueError: Formato desconhecido.
+        ImportError: Parquet sem o pacote pyarrow.
+    """
+    formato = formato or formato_do_arquivo(destino)
+    if formato not in FORMATOS_EXPORTACAO:
+        raise ValueError(f"Formato '{formato}' inválido. Use um de: {FORMATOS_EXPORTACAO}")
+    if formato == 'parquet':
+        _importar_pyarrow()
+
+    inicio = time.perf_counter()
+    lotes = _em_lotes(linhas, tamanho_lote)
+    primeiro_lote = next(lotes, [])
+    tipos = tipos_das_colunas(descricao, primeiro_lote)
+
+    def todos_os_lotes():
+        if primeiro_lote:
+            yield primeiro_lote
+        yield from lotes
+
+    # Grava em arquivo temporário e troca de uma vez (como o cache de medidas)
+    temporario = destino + '.tmp'
+    try:
+        if formato == 'csv':
+            total = _gravar_csv(temporario, tipos, todos_os_lotes())
+        else:
+            total = _gravar_parquet(temporario, tipos, todos_os_lotes())
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+    os.replace(temporario, destino)
+
+    segundos = time.perf_counter() - inicio
+    return {
+        'arquivo': os.path.abspath(destino),
+        'linhas': total,
+        'colunas': tipos,
+        'segundos': segundos,
+        'linhas_por_segundo': total / segundos if segundos > 0 else float('inf'),
+    }
+
+
+def exportar_consulta(pool, query, destino, formato=None, parametros=None, tamanho_lote=TAMANHO_LOTE,
+                      preparada=False):
+    """
+    Executa a consulta em fluxo e grava o resultado direto no arquivo.
+
+    O tempo informado inclui a execução da consulta no banco. preparada=True
+    reaproveita o comando preparado na conexão (veja PoolConexoes.executar).
+
+    Raises:
+        ErroBanco: Falha ao conectar ou executar a consulta.
+    """
+    inicio = time.perf_counter()
+    with pool.consultar_em_fluxo(query, parametros, tamanho_lote, com_descricao=True,
+                                 preparada=preparada) as (descricao, linhas):
+        info = exportar_linhas(descricao, linhas, destino, formato, tamanho_lote)
+    info['segundos'] = time.perf_counter() - inicio
+    info['linhas_por_segundo'] = info['linhas'] / info['segundos'] if info['segundos'] > 0 else float('inf')
+    return info
@@ -0,0 +1,331 @@
+import re
+import time
+
+from banco import ErroBanco
+
+# ==============================================================================
+# PLANO DE EXECUÇÃO (EXPLAIN) E SUGESTÃO DE ÍNDICES
+# ==============================================================================
+#
+# Para cada consulta:
+#   1. pega o plano do banco (EXPLAIN no MySQL, EXPLAIN QUERY PLAN no SQLite)
+#      e marca as tabelas lidas inteiras (varredura completa);
+#   2. procura filtros com a coluna dentro de uma função, como
+#      YEAR(orders.OrderDate) >= 2000, que impedem o uso de índice, e
+#      sugere a forma equivalente que usa índice (OrderDate >= '2000-01-01');
+#   3. sugere índices nas colunas de filtro e de junção das tabelas
+#      varridas que ainda não têm índice;
+#   4. mede a consulta antes e depois das sugestões.
+#
+# Exemplo:
+#     analise = analisar_consulta(obter_pool('amazon'), sql)
+#     for alerta in analise['alertas']:
+#         print(alerta)
+
+# Funções de agregação podem aparecer em HAVING sem problema
+_AGREGACOES = {'sum', 'count', 'avg', 'min', 'max'}
+
+_COMENTARIO = re.compile(r'--[^\n]*|#[^\n]*|/\*.*?\*/', re.DOTALL)
+_FUNCAO_EM_COLUNA = re.compile(
+    r"\b(\w+)\s*\(\s*((?:\w+\.)?\w+)\s*\)\s*(>=|<=|<>|!=|=|>|<)\s*('[^']*'|\d+|\?|%s)", re.IGNORECASE)
+_TABELA_E_APELIDO = re.compile(
+    r'\b(?:from|join)\s+`?(\w+)`?'
+    r'(?:\s+(?:as\s+)?(?!(?:on|where|join|inner|left|right|cross|group|order|limit)\b)(\w+))?',
+    re.IGNORECASE)
+_JUNCAO = re.compile(r'\b(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)')
+_FILTRO = re.compile(r'\b(\w+)\.(\w+)\s*(?:>=|<=|<>|!=|=|>|<|\blike\b|\bin\b|\bbetween\b)', re.IGNORECASE)
+_CLAUSULA_WHERE = re.compile(r'\bwhere\b(.*?)(?=\bgroup\s+by\b|\border\s+by\b|\bhaving\b|\blimit\b|$)',
+                             re.IGNORECASE | re.DOTALL)
+_COLUNAS_BUSCA = re.compile(r'\((\w+)=\?')
+_PASSO_SQLITE = re.compile(r'^(SCAN|SEARCH)\s+(?:TABLE\s+)?(\w+)(?:\s+AS\s+(\w+))?(?:\s+USING\s+(.*))?$')
+
+
+# ==============================================================================
+# PLANO DE EXECUÇÃO
+# ==============================================================================
+
+def _e_sqlite(conexao):
+    return type(conexao).__module__.startswith('sqlite3')
+
+
+def _passo_mysql(linha):
+    acesso = str(linha.get('type') or '')
+    return {
+        'tabela': linha.get('table'),
+        'acesso': acesso,
+        'indice': linha.get('key'),
+        'linhas': linha.get('rows'),
+        'detalhe': str(linha.get('extra') or ''),
+        # ALL = tabela inteira; index = índice inteiro
+        'varredura': acesso in ('ALL', 'index'),
+        'indice_automatico': False,
+    }
+
+
+def _passo_sqlite(detalhe):
+    passo = {'tabela': None, 'acesso': '', 'indice': None, 'linhas': None, 'detalhe': detalhe,
+             'varredura': False, 'indice_automatico': False}
+    encontrado = _PASSO_SQLITE.match(detalhe)
+    if encontrado:
+        acesso, tabela, apelido, uso = encontrado.groups()
+        passo.update({
+            'tabela': apelido or tabela,
+            'acesso': acesso,
+            'indice': uso,
+            'varredura': acesso == 'SCAN',
+            # O SQLite cria um índice temporário a cada execução quando falta um
+            'indice_automatico': 'AUTOMATIC' in (uso or ''),
+        })
+    return passo
+
+
+def obter_plano(pool, sql, parametros=None):
+    """
+    Plano de execução da consulta, um passo por tabela.
+
+    Returns:
+        list: Dicionários com tabela, acesso, índice, linhas estimadas,
+        detalhe, varredura (bool) e indice_automatico (bool).
+
+    Raises:
+        ErroBanco: Falha ao conectar ou ao gerar o plano.
+    """
+    try:
+        with pool.conexao() as conexao:
+            cursor = conexao.cursor()
+            try:
+                if _e_sqlite(conexao):
+                    cursor.execute("EXPLAIN QUERY PLAN " + sql, parametros or ())
+                    return [_passo_sqlite(linha[3]) for linha in cursor.fetchall()]
+                cursor.execute("EXPLAIN " + sql, parametros or ())
+                colunas = [desc[0].lower() for desc in cursor.description]
+                return [_passo_mysql(dict(zip(colunas, linha))) for linha in cursor.fetchall()]
+            finally:
+                cursor.close()
+    except pool.erros as erro:
+        raise ErroBanco(str(erro)) from erro
+
+
+def indices_existentes(pool, tabela):
+    """Primeira coluna (em minúsculas) de cada índice da tabela."""
+    try:
+        with pool.conexao() as conexao:
+            cursor = conexao.cursor()
+            try:
+                if _e_sqlite(conexao):
+                    cursor.execute(f"PRAGMA index_list({tabela})")
+                    nomes = [linha[1] for linha in cursor.fetchall()]
+                    colunas = set()
+                    for nome in nomes:
+                        cursor.execute(f"PRAGMA index_info({nome})")
+                        colunas.update(linha[2].lower() for linha in cursor.fetchall() if linha[0] == 0)
+                    return colunas
+                cursor.execute(f"SHOW INDEX FROM {tabela}")
+                nomes_colunas = [desc[0].lower() for desc in cursor.description]
+                linhas = [dict(zip(nomes_colunas, linha)) for linha in cursor.fetchall()]
+                return {str(linha['column_name']).lower() for linha in linhas if linha['seq_in_index'] == 1}
+            finally:
+                cursor.close()
+    except pool.erros as erro:
+        raise ErroBanco(str(erro)) from erro
+
+
+# ==============================================================================
+# ANÁLISE DO TEXTO DA CONSULTA
+# ==============================================================================
+
+def _sem_comentarios(sql):
+    return _COMENTARIO.sub(' ', sql)
+
+
+def _reescrever_ano(coluna, operador, ano):
+    # YEAR(c) op N  ->  comparação direta com a data, que usa índice em c
+    ano = int(ano.strip("'"))
+    inicio, seguinte = f"'{ano}-01-01'", f"'{ano + 1}-01-01'"
+    formas = {
+        '>=': f"{coluna} >= {inicio}",
+        '>': f"{coluna} >= {seguinte}",
+        '<': f"{coluna} < {inicio}",
+        '<=': f"{coluna} < {seguinte}",
+        '=': f"{coluna} >= {inicio} AND {coluna} < {seguinte}",
+    }
+    return formas.get(operador)
+
+
+def predicados_com_funcao(sql):
+    """
+    Filtros com a coluna dentro de uma função (não usam índice).
+
+    Returns:
+        list: [(trecho, coluna, reescrita ou None), ...]
+    """
+    encontrados = []
+    for trecho in _FUNCAO_EM_COLUNA.finditer(_sem_comentarios(sql)):
+        funcao, coluna, operador, valor = trecho.groups()
+        if funcao.lower() in _AGREGACOES:
+            continue
+        reescrita = None
+        if funcao.lower() == 'year' and valor.strip("'").isdigit():
+            reescrita = _reescrever_ano(coluna, operador, valor)
+        encontrados.append((trecho.group(0), coluna, reescrita))
+    return encontrados
+
+
+def reescrever_sargavel(sql):
+    """SQL com os filtros YEAR(coluna) trocados por comparações de data."""
+    for trecho, _, reescrita in predicados_com_funcao(sql):
+        if reescrita:
+            sql = sql.replace(trecho, reescrita)
+    return sql
+
+
+def apelidos_das_tabelas(sql):
+    """{apelido ou nome: tabela} das tabelas em FROM/JOIN."""
+    apelidos = {}
+    for tabela, apelido in _TABELA_E_APELIDO.findall(_sem_comentarios(sql)):
+        apelidos[tabela.lower()] = tabela
+        if apelido:
+            apelidos[apelido.lower()] = tabela
+    return apelidos
+
+
+def colunas_candidatas(sql):
+    """
+    Colunas que se beneficiariam de índice, por tabela: as de filtro (WHERE,
+    fora de funções) e as de junção.
+
+    Returns:
+        dict: {tabela: {'filtro': [coluna, ...], 'juncao': [coluna, ...]}}
+    """
+    texto = _sem_comentarios(sql)
+    apelidos = apelidos_das_tabelas(texto)
+    candidatas = {}
+
+    def acrescentar(apelido, coluna, tipo):
+        tabela = apelidos.get(apelido.lower())
+        if tabela is None:
+            return
+        colunas = candidatas.setdefault(tabela, {'filtro': [], 'juncao': []})[tipo]
+        if coluna.lower() not in (existente.lower() for existente in colunas):
+            colunas.append(coluna)
+
+    where = _CLAUSULA_WHERE.search(texto)
+    if where:
+        for apelido, coluna in _FILTRO.findall(where.group(1)):
+            acrescentar(apelido, coluna, 'filtro')
+    for apelido_a, coluna_a, apelido_b, coluna_b in _JUNCAO.findall(texto):
+        acrescentar(apelido_a, coluna_a, 'juncao')
+        acrescentar(apelido_b, coluna_b, 'juncao')
+    return candidatas
+
+
+def _colunas_para_indice(passo, primeira_tabela, candidatas):
+    if passo['indice_automatico']:
+        # O próprio SQLite diz quais colunas o índice temporário usa: (CustomerID=?)
+        colunas = _COLUNAS_BUSCA.findall(passo['detalhe'])
+        if colunas:
+            return colunas
+        return candidatas['juncao']
+    if primeira_tabela:
+        # A tabela que começa a junção é lida pelo filtro do WHERE
+        return candidatas['filtro']
+    # Tabela interna da junção lida inteira a cada linha da anterior
+    return candidatas['filtro'] + candidatas['juncao']
+
+
+# ==============================================================================
+# ANÁLISE COMPLETA E MEDIÇÃO
+# ==============================================================================
+
+def analisar_consulta(pool, sql, parametros=None):
+    """
+    Plano, alertas e sugestões para a consulta.
+
+    A consulta pode ter marcadores de parâmetro (? ou %s); os valores vão em
+    parametros. Filtros como YEAR(coluna) >= ? são apontados, mas só os
+    com valor fixo são reescritos.
+
+    Returns:
+        dict: plano (lista de passos), alertas (textos), sql_sugerida (com os
+        filtros reescritos, ou None se não houver o que reescrever) e
+        indices (comandos CREATE INDEX sugeridos).
+
+    Raises:
+        ErroBanco: Falha ao conectar ou ao gerar o plano.
+    """
+    alertas = []
+    predicados = predicados_com_funcao(sql)
+    for trecho, coluna, reescrita in predicados:
+        if reescrita:
+            alertas.append(f'Filtro "{trecho}" não usa índice em {coluna}; use "{reescrita}"')
+        else:
+            alertas.append(f'Filtro "{trecho}" não usa índice em {coluna} (coluna dentro de função)')
+    sql_sugerida = reescrever_sargavel(sql)
+    if sql_sugerida == sql:
+        sql_sugerida = None
+
+    # As sugestões de índice valem para a consulta já reescrita
+    sql_final = sql_sugerida or sql
+    plano = obter_plano(pool, sql_final, parametros)
+    apelidos = apelidos_das_tabelas(sql_final)
+    candidatas = colunas_candidatas(sql_final)
+
+    indices = []
+    passos_com_tabela = [passo for passo in plano if passo['tabela']]
+    for passo in passos_com_tabela:
+        if not (passo['varredura'] or passo['indice_automatico']):
+            continue
+        tabela = apelidos.get(str(passo['tabela']).lower(), passo['tabela'])
+        if passo['varredura']:
+            alertas.append(f"Varredura completa da tabela {tabela} ({passo['detalhe'] or passo['acesso']})")
+        else:
+            alertas.append(f"Índice temporário criado a cada execução em {tabela} ({passo['detalhe']})")
+        existentes = indices_existentes(pool, tabela)
+        colunas = _colunas_para_indice(passo, passo is passos_com_tabela[0],
+                                       candidatas.get(tabela, {'filtro': [], 'juncao': []}))
+        for coluna in colunas:
+            if coluna.lower() in existentes:
+                continue
+            nome = f"idx_{tabela}_{coluna}".lower()
+            comando = f"CREATE INDEX {nome} ON {tabela} ({coluna})"
+            if comando not in indices:
+                indices.append(comando)
+
+    return {'plano': plano, 'alertas': alertas, 'sql_sugerida': sql_sugerida, 'indices': indices}
+
+
+def medir_consulta(pool, sql, repeticoes=3, parametros=None):
+    """
+    Executa a consulta lendo todas as linhas.
+
+    Returns:
+        tuple: (melhor tempo em segundos, quantidade de linhas)
+
+    Raises:
+        ValueError: Se repeticoes for menor que 1.
+    """
+    if repeticoes < 1:
+        raise ValueError(f"repeticoes deve ser pelo menos 1 (recebido: {repeticoes})")
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        with pool.consultar_em_fluxo(sql, parametros, preparada=True) as (_, linhas):
+            total = sum(1 for _ in linhas)
+        segundos = time.perf_counter() - inicio
+        melhor = segundos if melhor is None else min(melhor, segundos)
+    return melhor, total
+
+
+def criar_indices(pool, comandos):
+    """Executa os CREATE INDEX sugeridos (altera o banco)."""
+    try:
+        with pool.conexao() as conexao:
+            cursor = conexao.cursor()
+            try:
+                for comando in comandos:
+                    cursor.execute(comando)
+                conexao.commit()
+            finally:
+                cursor.close()
+    except pool.erros as erro:
+        raise ErroBanco(str(erro)) from erro
@@ -1,12 +1,41 @@
+import time
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 # ==============================================================================
-# 1. FUNÇÃO DE CÁLCULO
+# 1. FUNÇÕES DE CÁLCULO
 # ==============================================================================
 
+def calcular_estatisticas_de_ordem(dados_array, probabilidades=(0.0, 0.25, 0.5, 0.75, 1.0)):
+    """
+    Calcula vários quantis com um único np.partition.
+
+    Usa a mesma interpolação linear do np.percentile / Series.quantile, mas
+    particiona os dados uma vez só para todas as probabilidades pedidas, em vez
+    de uma ordenação/partição por chamada. 0.0 e 1.0 retornam mínimo e máximo.
+
+    Args:
+        dados_array (array-like): Os dados (sem NaN).
+        probabilidades (sequence): Probabilidades entre 0 e 1.
+
+    Returns:
+        np.ndarray: Um valor para cada probabilidade, na mesma ordem.
+    """
+    dados = np.asarray(dados_array, dtype=float).ravel()
+    probabilidades = np.asarray(probabilidades, dtype=float)
+    if dados.size == 0:
+        return np.full(probabilidades.shape, np.nan)
+
+    posicoes = probabilidades * (dados.size - 1)
+    abaixo = np.floor(posicoes).astype(np.intp)
+    acima = np.ceil(posicoes).astype(np.intp)
+
+    particionado = np.partition(dados, np.unique(np.concatenate([abaixo, acima])))
+    valor_abaixo = particionado[abaixo]
+    valor_acima = particionado[acima]
+    return valor_abaixo + (posicoes - abaixo) * (valor_acima - valor_abaixo)
+
+
 def calcular_medidas_descritivas(dados_array):
     """
     Calcula e retorna um dicionário com as principais medidas estatísticas
@@ -15,23 +44,19 @@ def calcular_medidas_descritivas(dados_array):
     if dados_array is None or len(dados_array) == 0:
         return None
 
+    # Mínimo, quartis e máximo em uma única partição dos dados
+    min_valor, Q1, mediana, Q3, max_valor = calcular_estatisticas_de_ordem(dados_array)
+
     # Medidas de Tendência Central
     media = np.mean(dados_array)
-    mediana = np.median(dados_array)
 
-    # Medidas de Posição (Quartis e IQR)
-    Q1 = np.percentile(dados_array, 25)
-    Q3 = np.percentile(dados_array, 75)
+    # Medidas de Posição (IQR)
     IQR = Q3 - Q1
 
     # Limites de Outliers
     limite_superior = Q3 + (1.5 * IQR)
     limite_inferior = Q1 - (1.5 * IQR)
 
-    # Valores Extremos
-    min_valor = np.min(dados_array)
-    max_valor = np.max(dados_array)
-
     return {
         'media': media,
         'mediana': mediana,
@@ -44,10 +69,279 @@ def calcular_medidas_descritivas(dados_array):
         'max_valor': max_valor,
     }
 
+
+def calcular_medidas_descritivas_por_grupo(valores, chaves):
+    """
+    Calcula as medidas de calcular_medidas_descritivas() para cada grupo de
+    uma vez, sem laço em Python sobre os grupos.
+
+    Os dados são ordenados uma única vez por (grupo, valor); cada quantil é
+    então lido direto das posições de início e fim de cada grupo.
+
+    Args:
+        valores (array-like): Coluna numérica (ex.: df['TotalAmount']).
+        chaves (array-like): Coluna de agrupamento (ex.: df['PaymentMethod']).
+
+    Returns:
+        pd.DataFrame: Uma linha por grupo, com a coluna 'n' e as mesmas
+        colunas do dicionário de calcular_medidas_descritivas().
+
+    Exemplo:
+        calcular_medidas_descritivas_por_grupo(df['TotalAmount'], df['PaymentMethod'])
+        calcular_medidas_descritivas_por_grupo(df['TotalAmount'], df['OrderDate'].str[:7])
+    """
+    valores = np.asarray(valores, dtype=float)
+    codigos, grupos = pd.factorize(np.asarray(chaves), sort=True)
+
+    # Ignora valores NaN e chaves ausentes
+    validos = ~np.isnan(valores) & (codigos >= 0)
+    valores = valores[validos]
+    codigos = codigos[validos]
+
+    # Ordena pelos valores e depois, de forma estável, pelo grupo. Com códigos
+    # em um tipo inteiro pequeno (até 65536 grupos) o NumPy usa radix sort.
+    ordem = np.argsort(valores)
+    codigos_ordenados = codigos[ordem].astype(np.min_scalar_type(max(len(grupos) - 1, 0)))
+    ordem = ordem[np.argsort(codigos_ordenados, kind='stable')]
+    ordenados = valores[ordem]
+
+    contagem = np.bincount(codigos, minlength=len(grupos))
+    presentes = contagem > 0
+    grupos = grupos[presentes]
+    soma = np.bincount(codigos, weights=valores, minlength=len(contagem))[presentes]
+    contagem = contagem[presentes]
+    inicio = np.cumsum(contagem) - contagem
+
+    def quantil(p):
+        posicao = inicio + p * (contagem - 1)
+        abaixo = np.floor(posicao).astype(np.intp)
+        acima = np.ceil(posicao).astype(np.intp)
+        return ordenados[abaixo] + (posicao - abaixo) * (ordenados[acima] - ordenados[abaixo])
+
+    Q1 = quantil(0.25)
+    Q3 = quantil(0.75)
+    IQR = Q3 - Q1
+
+    return pd.DataFrame({
+        'n': contagem,
+        'media': soma / contagem,
+        'mediana': quantil(0.5),
+        'Q1': Q1,
+        'Q3': Q3,
+        'IQR': IQR,
+        'limite_superior': Q3 + (1.5 * IQR),
+        'limite_inferior': Q1 - (1.5 * IQR),
+        'min_valor': ordenados[inicio],
+        'max_valor': ordenados[inicio + contagem - 1],
+    }, index=pd.Index(grupos, name=getattr(chaves, 'name', None)))
+
+# ==============================================================================
+# 2. CÁLCULO EM FLUXO (BLOCOS / CHUNKS)
+# ==============================================================================
+
+class EsbocoQuantis:
+    """
+    Esboço KLL para quantis aproximados com memória limitada.
+
+    Os valores entram no nível 0; quando um nível passa da sua capacidade ele
+    é ordenado e metade dos elementos (pares ou ímpares, sorteado) sobe para o
+    nível seguinte com peso dobrado. Dois esboços podem ser mesclados, o que
+    permite processar partes do arquivo separadamente e juntar no final.
+
+    Enquanto nenhum nível foi compactado o resultado é exato (igual ao
+    np.percentile).
+    """
+
+    def __init__(self, k=200, semente=None):
+        self.k = k
+        self.n = 0
+        self._niveis = [np.empty(0)]
+        self._rng = np.random.default_rng(semente)
+
+    def _capacidade(self, nivel):
+        # Níveis mais baixos (de menor peso) guardam menos itens
+        altura = len(self._niveis) - 1 - nivel
+        return max(2, int(np.ceil(self.k * (2 / 3) ** altura)))
+
+    def _comprimir(self):
+        nivel = 0
+        while nivel < len(self._niveis):
+            itens = self._niveis[nivel]
+            if len(itens) <= self._capacidade(nivel):
+                nivel += 1
+                continue
+
+            itens = np.sort(itens)
+            # Com quantidade ímpar, o maior item fica no nível atual
+            sobra = itens[-1:] if len(itens) % 2 else itens[:0]
+            pares = itens[:len(itens) - len(sobra)]
+            promovidos = pares[self._rng.integers(2)::2]
+
+            self._niveis[nivel] = sobra
+            if nivel + 1 == len(self._niveis):
+                self._niveis.append(np.empty(0))
+            self._niveis[nivel + 1] = np.concatenate([self._niveis[nivel + 1], promovidos])
+            # A capacidade dos níveis de baixo muda quando a altura cresce
+            nivel = 0
+
+    def atualizar(self, valores):
+        valores = np.asarray(valores, dtype=float).ravel()
+        if valores.size == 0:
+            return
+        self.n += valores.size
+        self._niveis[0] = np.concatenate([self._niveis[0], valores])
+        self._comprimir()
+
+    def mesclar(self, outro):
+        while len(self._niveis) < len(outro._niveis):
+            self._niveis.append(np.empty(0))
+        for nivel, itens in enumerate(outro._niveis):
+            self._niveis[nivel] = np.concatenate([self._niveis[nivel], itens])
+        self.n += outro.n
+        self._comprimir()
+
+    def quantis(self, probabilidades):
+        """
+        Retorna os quantis para as probabilidades pedidas (entre 0 e 1).
+        """
+        probabilidades = np.asarray(probabilidades, dtype=float)
+        if self.n == 0:
+            return np.full(probabilidades.shape, np.nan)
+
+        if len(self._niveis) == 1:
+            return np.percentile(self._niveis[0], probabilidades * 100)
+
+        valores = np.concatenate(self._niveis)
+        pesos = np.concatenate([np.full(len(itens), 2.0 ** nivel)
+                                for nivel, itens in enumerate(self._niveis)])
+        ordem = np.argsort(valores, kind='stable')
+        valores = valores[ordem]
+        acumulado = np.cumsum(pesos[ordem])
+
+        posicoes = np.searchsorted(acumulado, probabilidades * acumulado[-1], side='left')
+        return valores[np.clip(posicoes, 0, len(valores) - 1)]
+
+
+class AcumuladorMedidas:
+    """
+    Acumula as medidas de calcular_medidas_descritivas() bloco a bloco.
+
+    Média, mínimo e máximo são exatos; mediana e quartis vêm de um
+    EsbocoQuantis. A memória usada não depende da quantidade de linhas.
+
+    Exemplo:
+        acumulador = AcumuladorMedidas()
+        for bloco in pd.read_csv('orders.csv', usecols=['TotalAmount'], chunksize=1_000_000):
+            acumulador.atualizar(bloco['TotalAmount'])
+        medidas = acumulador.resultado()
+    """
+
+    def __init__(self, k=200, semente=None):
+        self.n = 0
+        self.soma = 0.0
+        self.min_valor = np.inf
+        self.max_valor = -np.inf
+        self.esboco = EsbocoQuantis(k=k, semente=semente)
+
+    def atualizar(self, bloco):
+        """
+        Adiciona um bloco de valores. Valores NaN são ignorados.
+        """
+        valores = np.asarray(bloco, dtype=float).ravel()
+        valores = valores[~np.isnan(valores)]
+        if valores.size == 0:
+            return
+
+        self.n += valores.size
+        self.soma += valores.sum()
+        self.min_valor = min(self.min_valor, valores.min())
+        self.max_valor = max(self.max_valor, valores.max())
+        self.esboco.atualizar(valores)
+
+    def mesclar(self, outro):
+        """
+        Junta outro acumulador a este (ex.: resultados de processos diferentes).
+        """
+        self.n += outro.n
+        self.soma += outro.soma
+        self.min_valor = min(self.min_valor, outro.min_valor)
+        self.max_valor = max(self.max_valor, outro.max_valor)
+        self.esboco.mesclar(outro.esboco)
+
+    def resultado(self):
+        """
+        Retorna o mesmo dicionário de calcular_medidas_descritivas().
+        """
+        if self.n == 0:
+            return None
+
+        Q1, mediana, Q3 = self.esboco.quantis([0.25, 0.5, 0.75])
+        IQR = Q3 - Q1
+
+        return {
+            'media': self.soma / self.n,
+            'mediana': mediana,
+            'Q1': Q1,
+            'Q3': Q3,
+            'IQR': IQR,
+            'limite_superior': Q3 + (1.5 * IQR),
+            'limite_inferior': Q1 - (1.5 * IQR),
+            'min_valor': self.min_valor,
+            'max_valor': self.max_valor,
+        }
+
+
+def calcular_medidas_descritivas_em_blocos(blocos, k=200):
+    """
+    Versão em fluxo de calcular_medidas_descritivas() para dados que não cabem
+    na memória.
+
+    Args:
+        blocos (iterable): Sequência de arrays/Series (ex.: colunas vindas de
+            pd.read_csv(..., chunksize=...)).
+        k (int): Precisão do esboço de quantis (maior = mais preciso).
+    """
+    acumulador = AcumuladorMedidas(k=k)
+    for bloco in blocos:
+        acumulador.atualizar(bloco)
+    return acumulador.resultado()
+
+
+def calcular_medidas_descritivas_csv(caminho_csv, coluna='TotalAmount', chunksize=1_000_000, k=200):
+    """
+    Lê o CSV em blocos e calcula as medidas da coluna em uma única passada.
+    """
+    blocos = pd.read_csv(caminho_csv, usecols=[coluna], chunksize=chunksize)
+    return calcular_medidas_descritivas_em_blocos(
+        (pd.to_numeric(bloco[coluna], errors='coerce') for bloco in blocos), k=k
+    )
+
 # ==============================================================================
-# 2. FUNÇÃO DE VISUALIZAÇÃO
+# 3. FUNÇÕES DE VISUALIZAÇÃO
 # ==============================================================================
 
+def formatar_resumo_medidas(medidas):
+    """
+    Monta o texto do painel de medidas a partir do dicionário de
+    calcular_medidas_descritivas().
+    """
+    return (
+        f"Medidas de Tendência Central:\n"
+        f"  Média: R$ {medidas['media']:.2f}\n"
+        f"  Mediana (Q2): R$ {medidas['mediana']:.2f}\n"
+        f"\n"
+        f"Medidas de Posição/Dispersão:\n"
+        f"  Q1: R$ {medidas['Q1']:.2f}\n"
+        f"  Q3: R$ {medidas['Q3']:.2f}\n"
+        f"  IQR: R$ {medidas['IQR']:.2f}\n"
+        f"\n"
+        f"Limites e Extremos:\n"
+        f"  Limite Superior (LS): R$ {medidas['limite_superior']:.2f}\n"
+        f"  Limite Inferior (LI): R$ {medidas['limite_inferior']:.2f}\n"
+        f"  Valor Máximo: R$ {medidas['max_valor']:.2f}\n"
+        f"  Valor Mínimo: R$ {medidas['min_valor']:.2f}\n"
+    )
+
 def gerar_painel_boxplot(dados_array, medidas, titulo_boxplot='Boxplot da Distribuição de Dados', caminho_salvar=None):
     """
     Gera e exibe um painel com um Boxplot e um resumo das medidas estatísticas.
@@ -62,6 +356,10 @@ def gerar_painel_boxplot(dados_array, medidas, titulo_boxplot='Boxplot da Distri
         print("Erro: Medidas estatísticas não fornecidas ou inválidas.")
         return
 
+    # Importados aqui para que o cálculo não pague o custo do pyplot/seaborn
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     fig, axes = plt.subplots(1, 2, figsize=(16, 8))
 
     # --- POSIÇÃO 1: BOXPLOT ---
@@ -74,22 +372,7 @@ def gerar_painel_boxplot(dados_array, medidas, titulo_boxplot='Boxplot da Distri
     axes[1].set_title('Medidas Estatísticas Calculadas')
 
     # Preparando o texto formatado (usando as chaves do dicionário 'medidas')
-    resumo = (
-        f"Medidas de Tendência Central:\n"
-        f"  Média: R$ {medidas['media']:.2f}\n"
-        f"  Mediana (Q2): R$ {medidas['mediana']:.2f}\n"
-        f"\n"
-        f"Medidas de Posição/Dispersão:\n"
-        f"  Q1: R$ {medidas['Q1']:.2f}\n"
-        f"  Q3: R$ {medidas['Q3']:.2f}\n"
-        f"  IQR: R$ {medidas['IQR']:.2f}\n"
-        f"\n"
-        f"Limites e Extremos:\n"
-        f"  Limite Superior (LS): R$ {medidas['limite_superior']:.2f}\n"
-        f"  Limite Inferior (LI): R$ {medidas['limite_inferior']:.2f}\n"
-        f"  Valor Máximo: R$ {medidas['max_valor']:.2f}\n"
-        f"  Valor Mínimo: R$ {medidas['min_valor']:.2f}\n"
-    )
+    resumo = formatar_resumo_medidas(medidas)
 
     # Adicionando o texto
     axes[1].text(0.1, 0.95, resumo,
@@ -104,4 +387,117 @@ def gerar_painel_boxplot(dados_array, medidas, titulo_boxplot='Boxplot da Distri
         plt.savefig(caminho_salvar)
         print(f"Painel salvo em: {caminho_salvar}")
     
-    plt.show()
\ No newline at end of file
+    plt.show()
+
+# ==============================================================================
+# 4. RENDERIZAÇÃO EM LOTE (SEM TELA)
+# ==============================================================================
+
+def estatisticas_para_boxplot(medidas, rotulo=''):
+    """
+    Converte o dicionário de medidas no formato aceito por Axes.bxp().
+
+    Os bigodes vão até os limites de outliers (ou até o mínimo/máximo, se
+    estiverem dentro deles). Como o dicionário não guarda os valores
+    individuais, só o mínimo e o máximo aparecem como outliers quando
+    ultrapassam os limites.
+    """
+    minimo = medidas['min_valor']
+    maximo = medidas['max_valor']
+    return {
+        'label': rotulo,
+        'med': medidas['mediana'],
+        'q1': medidas['Q1'],
+        'q3': medidas['Q3'],
+        'mean': medidas['media'],
+        'whislo': max(minimo, medidas['limite_inferior']),
+        'whishi': min(maximo, medidas['limite_superior']),
+        'fliers': [v for v in (minimo, maximo)
+                   if v < medidas['limite_inferior'] or v > medidas['limite_superior']],
+    }
+
+
+class RenderizadorPaineis:
+    """
+    Gera os painéis de gerar_painel_boxplot() direto em PNG, sem tela.
+
+    Usa o backend Agg sem passar pelo pyplot e reaproveita a mesma Figure e os
+    mesmos Axes em todos os painéis: a cada painel só o boxplot e os textos são
+    trocados. O boxplot é desenhado a partir do dicionário de medidas, sem
+    precisar dos dados brutos nem do seaborn.
+
+    Exemplo:
+        renderizador = RenderizadorPaineis()
+        for nome, medidas in medidas_por_arquivo.items():
+            renderizador.renderizar(medidas, f'{nome}.png', titulo_boxplot=nome)
+    """
+
+    def __init__(self, figsize=(16, 8), dpi=100):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.fig)
+        self.ax_boxplot, self.ax_medidas = self.fig.subplots(1, 2)
+        self.dpi = dpi
+
+        self.ax_medidas.axis('off')
+        self.ax_medidas.set_title('Medidas Estatísticas Calculadas')
+        self.texto_medidas = self.ax_medidas.text(
+            0.1, 0.95, '',
+            transform=self.ax_medidas.transAxes,
+            fontsize=12,
+            verticalalignment='top',
+            bbox=dict(boxstyle="round,pad=0.5", alpha=0.1, color='lightgray'))
+        self._artistas_boxplot = []
+
+    def renderizar(self, medidas, caminho_salvar, titulo_boxplot='Boxplot da Distribuição de Dados',
+                   rotulo_y='Valores'):
+        """
+        Desenha um painel e salva em caminho_salvar.
+
+        Returns:
+            float: Tempo gasto no painel, em segundos.
+        """
+        inicio = time.perf_counter()
+
+        # Remove só o boxplot anterior; eixos, títulos e caixa de texto ficam
+        for artista in self._artistas_boxplot:
+            artista.remove()
+        artistas = self.ax_boxplot.bxp([estatisticas_para_boxplot(medidas)],
+                                       showmeans=True, patch_artist=True)
+        self._artistas_boxplot = [a for lista in artistas.values() for a in lista]
+        self.ax_boxplot.relim()
+        self.ax_boxplot.autoscale_view()
+        self.ax_boxplot.set_title(titulo_boxplot)
+        self.ax_boxplot.set_ylabel(rotulo_y)
+
+        self.texto_medidas.set_text(formatar_resumo_medidas(medidas))
+
+        self.fig.tight_layout()
+        self.fig.savefig(caminho_salvar, dpi=self.dpi)
+        return time.perf_counter() - inicio
+
+
+def renderizar_paineis_em_lote(paineis, figsize=(16, 8), dpi=100):
+    """
+    Renderiza vários painéis em PNG reaproveitando uma única figura.
+
+    Args:
+        paineis (iterable): Tuplas (medidas, caminho_salvar, titulo_boxplot).
+        figsize (tuple): Tamanho da figura em polegadas.
+        dpi (int): Resolução dos PNGs.
+
+    Returns:
+        list: Tuplas (caminho_salvar, segundos) na ordem de renderização.
+    """
+    renderizador = RenderizadorPaineis(figsize=figsize, dpi=dpi)
+    tempos = []
+    for medidas, caminho_salvar, titulo_boxplot in paineis:
+        if medidas is None:
+            print(f"Aviso: painel {caminho_salvar} ignorado (medidas inválidas).")
+            continue
+        segundos = renderizador.renderizar(medidas, caminho_salvar, titulo_boxplot=titulo_boxplot)
+        tempos.append((caminho_salvar, segundos))
+        print(f"Painel salvo em: {caminho_salvar} ({segundos * 1000:.0f} ms)")
+    return tempos
@@ -1,13 +1,19 @@
 import math
+import os
+import sys
 import pandas as pd
 import numpy as np
 
+# Leitura tipada com cache colunar (UC2/aula7/colunar.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aula7'))
+from colunar import carregar_tabela
+
 
 # Carregar o DataFrame
-pedidos_df = pd.read_csv("../aula8/orders.csv")
+pedidos_df = carregar_tabela("../aula8/orders.csv")
 
 # Selecionar os dados de interesse
-dados_valor_total = pedidos_df['TotalAmount']
+dados_valor_total = pedidos_df['TotalAmount'].astype(np.float64)
 
 # Cálculo das medidas
 media_vendas = dados_valor_total.mean()
@@ -1,9 +1,15 @@
 import math
+import os
+import sys
 import pandas as pd
 import numpy as np
 
+# Leitura tipada com cache colunar (UC2/aula7/colunar.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aula7'))
+from colunar import carregar_tabela
+
 # Carregar o DataFrame
-pedidos_df = pd.read_csv("../aula8/orders.csv")
+pedidos_df = carregar_tabela("../aula8/orders.csv")
 
 # Verificar se a coluna existe
 if 'TotalAmount' not in pedidos_df.columns:
@@ -11,7 +17,7 @@ if 'TotalAmount' not in pedidos_df.columns:
     print(f"Colunas disponíveis: {list(pedidos_df.columns)}")
 else:
     # Selecionar os dados de interesse
-    dados_valor_total = pedidos_df['TotalAmount']
+    dados_valor_total = pedidos_df['TotalAmount'].astype(np.float64)
     
     # Verificar se há dados
     if dados_valor_total.empty:
@@ -0,0 +1,422 @@
+import argparse
+import datetime
+import json
+import os
+import sqlite3
+
+from diario_pedidos import ler_pedidos
+
+# ==============================================================================
+# PEDIDOS DO RESTAURANTE EM SQLITE (MODO WAL)
+# ==============================================================================
+#
+# Os pedidos ficam em duas tabelas, "pedidos" e "itens", com índices em
+# status, mesa e data. Assim "pedidos pendentes", "pedidos da mesa 5" e
+# "pedidos de hoje" são consultas pelo índice, sem percorrer todos os pedidos.
+# O modo WAL deixa as leituras rodarem enquanto um pedido é gravado, e cada
+# gravação é uma transação (o pedido e seus itens entram juntos ou não entram).
+#
+# Os totais do relatório também ficam no banco, em "resumo_status" (pedidos e
+# valor por status) e "receita_dia" (pedidos entregues e valor por dia). Os
+# gatilhos atualizam essas tabelas a cada pedido gravado, mudança de status ou
+# remoção, então o resumo custa o mesmo com 10 ou 100 mil pedidos.
+#
+# As consultas devolvem os pedidos no mesmo formato do antigo pedidos.json:
+#     {1001: {"mesa": 3, "itens": {6: 2}, "status": "pendente",
+#             "data_hora": "18/10/2026 20:15:00", "total": 16.0}}
+#
+# Para migrar, importar_json() lê um pedidos.json (com o diário, se houver) e
+# exportar_json() gera um de volta. Pedidos antigos sem "total" só ganham o
+# valor se a importação receber os preços do cardápio (o RestauranteApp passa):
+#     python banco_pedidos.py importar pedidos.json
+#     python banco_pedidos.py exportar copia.json
+
+ARQUIVO_BANCO = "pedidos.db"
+
+# Formato de data/hora mostrado na interface; no banco fica "AAAA-MM-DD HH:MM:SS",
+# que ordena e compara como data
+FORMATO_DATA_HORA = "%d/%m/%Y %H:%M:%S"
+FORMATO_BANCO = "%Y-%m-%d %H:%M:%S"
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pedidos (
+    numero INTEGER PRIMARY KEY,
+    mesa INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    data_hora TEXT NOT NULL,
+    hora_entrega TEXT,
+    total REAL
+);
+CREATE TABLE IF NOT EXISTS itens (
+    numero INTEGER NOT NULL REFERENCES pedidos (numero) ON DELETE CASCADE,
+    codigo INTEGER NOT NULL,
+    quantidade INTEGER NOT NULL,
+    PRIMARY KEY (numero, codigo)
+);
+CREATE INDEX IF NOT EXISTS idx_pedidos_status ON pedidos (status);
+CREATE INDEX IF NOT EXISTS idx_pedidos_mesa ON pedidos (mesa);
+CREATE INDEX IF NOT EXISTS idx_pedidos_data_hora ON pedidos (data_hora);
+"""
+
+# Acumulados por status e receita (pedidos entregues) por dia do pedido. Cada
+# gatilho desfaz a contribuição da linha antiga e soma a da nova.
+ESQUEMA_RESUMO = """
+CREATE TABLE IF NOT EXISTS resumo_status (
+    status TEXT PRIMARY KEY,
+    quantidade INTEGER NOT NULL,
+    total REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS receita_dia (
+    dia TEXT PRIMARY KEY,
+    quantidade INTEGER NOT NULL,
+    total REAL NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS resumo_ao_inserir AFTER INSERT ON pedidos BEGIN
+    INSERT INTO resumo_status VALUES (NEW.status, 1, COALESCE(NEW.total, 0))
+        ON CONFLICT (status) DO UPDATE SET quantidade = quantidade + 1, total = total + excluded.total;
+    INSERT INTO receita_dia SELECT date(NEW.data_hora), 1, COALESCE(NEW.total, 0) WHERE NEW.status = 'entregue'
+        ON CONFLICT (dia) DO UPDATE SET quantidade = quantidade + 1, total = total + excluded.total;
+END;
+CREATE TRIGGER IF NOT EXISTS resumo_ao_remover AFTER DELETE ON pedidos BEGIN
+    UPDATE resumo_status SET quantidade = quantidade - 1, total = total - COALESCE(OLD.total, 0)
+        WHERE status = OLD.status;
+    UPDATE receita_dia SET quantidade = quantidade - 1, total = total - COALESCE(OLD.total, 0)
+        WHERE dia = date(OLD.data_hora) AND OLD.status = 'entregue';
+END;
+CREATE TRIGGER IF NOT EXISTS resumo_ao_alterar AFTER UPDATE OF status, total, data_hora ON pedidos BEGIN
+    UPDATE resumo_status SET quantidade = quantidade - 1, total = total - COALESCE(OLD.total, 0)
+        WHERE status = OLD.status;
+    UPDATE receita_dia SET quantidade = quantidade - 1, total = total - COALESCE(OLD.total, 0)
+        WHERE dia = date(OLD.data_hora) AND OLD.status = 'entregue';
+    INSERT INTO resumo_status VALUES (NEW.status, 1, COALESCE(NEW.total, 0))
+        ON CONFLICT (status) DO UPDATE SET quantidade = quantidade + 1, total = total + excluded.total;
+    INSERT INTO receita_dia SELECT date(NEW.data_hora), 1, COALESCE(NEW.total, 0) WHERE NEW.status = 'entregue'
+        ON CONFLICT (dia) DO UPDATE SET quantidade = quantidade + 1, total = total + excluded.total;
+END;
+"""
+
+_COLUNAS = "numero, mesa, status, data_hora, hora_entrega, total"
+
+# Número do primeiro pedido (os seguintes vêm em sequência)
+PRIMEIRO_NUMERO = 1001
+
+# Pedidos listados por status no relatório (os mais recentes)
+LIMITE_RELATORIO = 20
+
+
+def _para_banco(texto):
+    if not texto:
+        return texto
+    return datetime.datetime.strptime(texto, FORMATO_DATA_HORA).strftime(FORMATO_BANCO)
+
+
+def _para_exibicao(texto):
+    if not texto:
+        return texto
+    return datetime.datetime.strptime(texto, FORMATO_BANCO).strftime(FORMATO_DATA_HORA)
+
+
+class PedidoAtual(dict):
+    """
+    Itens do pedido em montagem ({código: quantidade}) com o total acumulado.
+
+    O total é atualizado a cada item adicionado ou removido, sem percorrer
+    o pedido.
+
+    Args:
+        cardapio (dict): {código: {"nome", "preco", "categoria"}}.
+    """
+
+    def __init__(self, cardapio):
+        super().__init__()
+        self.cardapio = cardapio
+        self.total = 0.0
+
+    def subtotal(self, codigo):
+        return self.cardapio[codigo]["preco"] * self.get(codigo, 0)
+
+    def adicionar(self, codigo, quantidade=1):
+        """Soma a quantidade do item; retorna a nova quantidade."""
+        self[codigo] = self.get(codigo, 0) + quantidade
+        # Arredonda para os centavos não acumularem erro de ponto flutuante
+        self.total = round(self.total + self.cardapio[codigo]["preco"] * quantidade, 2)
+        return self[codigo]
+
+    def remover(self, codigo, quantidade=None):
+        """Tira a quantidade do item (ou o item inteiro); retorna o que sobrou."""
+        atual = self.get(codigo, 0)
+        quantidade = atual if quantidade is None else min(quantidade, atual)
+        self.total = round(self.total - self.cardapio[codigo]["preco"] * quantidade, 2)
+        if quantidade == atual:
+            self.pop(codigo, None)
+            return 0
+        self[codigo] = atual - quantidade
+        return self[codigo]
+
+    def clear(self):
+        super().clear()
+        self.total = 0.0
+
+
+class BancoPedidos:
+    """
+    Armazena os pedidos do RestauranteApp em um arquivo SQLite.
+
+    Args:
+        caminho (str): Arquivo do banco (criado se não existir; ':memory:'
+            para testes).
+    """
+
+    def __init__(self, caminho=ARQUIVO_BANCO):
+        self.caminho = caminho
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        # Com WAL, NORMAL só faz fsync nos checkpoints: uma queda de energia
+        # pode perder os últimos pedidos, mas nunca corromper o banco
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.execute("PRAGMA foreign_keys=ON")
+        self.conexao.executescript(ESQUEMA)
+        novo_resumo = not self.conexao.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'resumo_status'").fetchone()
+        self.conexao.executescript(ESQUEMA_RESUMO)
+        if novo_resumo:
+            # Banco criado antes dos acumulados: calcula uma vez a partir dos pedidos
+            self.recalcular_resumo()
+
+    # --------------------------------------------------------------------------
+    # Gravação
+    # --------------------------------------------------------------------------
+
+    def _gravar(self, numero, pedido):
+        # UPSERT em vez de INSERT OR REPLACE: a troca dispara o gatilho de
+        # alteração, que mantém os acumulados certos
+        self.conexao.execute(
+            f"INSERT INTO pedidos ({_COLUNAS}) VALUES (?, ?, ?, ?, ?, ?) "
+            f"ON CONFLICT (numero) DO UPDATE SET mesa = excluded.mesa, status = excluded.status, "
+            f"data_hora = excluded.data_hora, hora_entrega = excluded.hora_entrega, total = excluded.total",
+            (numero, pedido["mesa"], pedido["status"], _para_banco(pedido["data_hora"]),
+             _para_banco(pedido.get("hora_entrega")), pedido.get("total")))
+        self.conexao.execute("DELETE FROM itens WHERE numero = ?", (numero,))
+        self.conexao.executemany(
+            "INSERT INTO itens (numero, codigo, quantidade) VALUES (?, ?, ?)",
+            [(numero, int(codigo), quantidade) for codigo, quantidade in pedido["itens"].items()])
+
+    def salvar(self, numero, pedido):
+        """Grava o pedido com os itens (substitui se o número já existir)."""
+        with self.conexao:
+            self._gravar(numero, pedido)
+
+    def novo_pedido(self, pedido, primeiro=PRIMEIRO_NUMERO):
+        """
+        Grava um pedido novo com o próximo número livre e retorna o número.
+
+        O número é escolhido no próprio INSERT, que o SQLite executa com o
+        banco travado para escrita: dois programas gravando ao mesmo tempo
+        nunca recebem o mesmo número.
+        """
+        with self.conexao:
+            cursor = self.conexao.execute(
+                f"INSERT INTO pedidos ({_COLUNAS}) "
+                f"SELECT MAX(COALESCE(MAX(numero), 0), ?) + 1, ?, ?, ?, ?, ? FROM pedidos",
+                (primeiro - 1, pedido["mesa"], pedido["status"], _para_banco(pedido["data_hora"]),
+                 _para_banco(pedido.get("hora_entrega")), pedido.get("total")))
+            numero = cursor.lastrowid
+            self.conexao.executemany(
+                "INSERT INTO itens (numero, codigo, quantidade) VALUES (?, ?, ?)",
+                [(numero, int(codigo), quantidade) for codigo, quantidade in pedido["itens"].items()])
+        return numero
+
+    def atualizar_status(self, numero, status, hora_entrega=None):
+        """
+        Muda o status do pedido (e a hora da entrega, no formato da interface).
+
+        Raises:
+            KeyError: Pedido inexistente.
+        """
+        with self.conexao:
+            cursor = self.conexao.execute(
+                "UPDATE pedidos SET status = ?, hora_entrega = COALESCE(?, hora_entrega) WHERE numero = ?",
+                (status, _para_banco(hora_entrega), numero))
+        if cursor.rowcount == 0:
+            raise KeyError(f"Pedido #{numero} não encontrado")
+
+    def remover(self, numero):
+        """Remove o pedido e os itens. Retorna True se ele existia."""
+        with self.conexao:
+            cursor = self.conexao.execute("DELETE FROM pedidos WHERE numero = ?", (numero,))
+        return cursor.rowcount > 0
+
+    # --------------------------------------------------------------------------
+    # Consultas
+    # --------------------------------------------------------------------------
+
+    def _montar(self, linhas, com_itens=True):
+        pedidos = {}
+        for numero, mesa, status, data_hora, hora_entrega, total in linhas:
+            pedido = {"mesa": mesa, "itens": {}, "status": status, "data_hora": _para_exibicao(data_hora)}
+            if total is not None:
+                pedido["total"] = total
+            if hora_entrega:
+                pedido["hora_entrega"] = _para_exibicao(hora_entrega)
+            pedidos[numero] = pedido
+        if com_itens and pedidos:
+            # Uma consulta para os itens de todos os pedidos (em blocos, por
+            # causa do limite de parâmetros do SQLite)
+            numeros = list(pedidos)
+            for inicio in range(0, len(numeros), 500):
+                bloco = numeros[inicio:inicio + 500]
+                marcadores = ", ".join("?" for _ in bloco)
+                for numero, codigo, quantidade in self.conexao.execute(
+                        f"SELECT numero, codigo, quantidade FROM itens WHERE numero IN ({marcadores}) "
+                        f"ORDER BY numero, rowid", bloco):
+                    pedidos[numero]["itens"][codigo] = quantidade
+        return pedidos
+
+    def _consultar(self, onde="", parametros=(), com_itens=True):
+        linhas = self.conexao.execute(
+            f"SELECT {_COLUNAS} FROM pedidos {onde} ORDER BY numero", parametros).fetchall()
+        return self._montar(linhas, com_itens)
+
+    def obter(self, numero):
+        """Retorna o pedido ou None."""
+        return self._consultar("WHERE numero = ?", (numero,)).get(numero)
+
+    def por_status(self, *status, com_itens=True, limite=None):
+        """
+        {número: pedido} com um dos status, em ordem de número.
+
+        Com limite, só os "limite" pedidos mais recentes.
+        """
+        marcadores = ", ".join("?" for _ in status)
+        if limite is None:
+            return self._consultar(f"WHERE status IN ({marcadores})", status, com_itens)
+        return self._consultar(
+            f"WHERE numero IN (SELECT numero FROM pedidos WHERE status IN ({marcadores}) "
+            f"ORDER BY numero DESC LIMIT ?)", (*status, limite), com_itens)
+
+    def da_mesa(self, mesa, *status, com_itens=True):
+        """Pedidos da mesa (opcionalmente só com os status informados)."""
+        if not status:
+            return self._consultar("WHERE mesa = ?", (mesa,), com_itens)
+        marcadores = ", ".join("?" for _ in status)
+        return self._consultar(f"WHERE mesa = ? AND status IN ({marcadores})", (mesa, *status), com_itens)
+
+    def do_dia(self, dia=None, com_itens=True):
+        """Pedidos feitos no dia (datetime.date; padrão: hoje)."""
+        dia = dia or datetime.date.today()
+        seguinte = dia + datetime.timedelta(days=1)
+        return self._consultar("WHERE data_hora >= ? AND data_hora < ?",
+                               (dia.isoformat(), seguinte.isoformat()), com_itens)
+
+    def todos(self, com_itens=True):
+        return self._consultar(com_itens=com_itens)
+
+    def contar_por_status(self):
+        """{status: quantidade de pedidos} (lido dos acumulados)."""
+        return {status: quantidade for status, (quantidade, _) in self.resumo().items()}
+
+    def resumo(self):
+        """{status: (quantidade de pedidos, valor total)} (lido dos acumulados)."""
+        return {status: (quantidade, round(total, 2)) for status, quantidade, total in self.conexao.execute(
+            "SELECT status, quantidade, total FROM resumo_status WHERE quantidade > 0")}
+
+    def receita_por_dia(self, dias=7):
+        """[(dia 'AAAA-MM-DD', pedidos entregues, receita)] dos últimos dias com entregas."""
+        return [(dia, quantidade, round(total, 2)) for dia, quantidade, total in self.conexao.execute(
+            "SELECT dia, quantidade, total FROM receita_dia WHERE quantidade > 0 ORDER BY dia DESC LIMIT ?",
+            (dias,))]
+
+    def recalcular_resumo(self):
+        """Refaz os acumulados a partir de todos os pedidos (só para reparo/migração)."""
+        with self.conexao:
+            self.conexao.execute("DELETE FROM resumo_status")
+            self.conexao.execute("DELETE FROM receita_dia")
+            self.conexao.execute(
+                "INSERT INTO resumo_status SELECT status, COUNT(*), COALESCE(SUM(total), 0) "
+                "FROM pedidos GROUP BY status")
+            self.conexao.execute(
+                "INSERT INTO receita_dia SELECT date(data_hora), COUNT(*), COALESCE(SUM(total), 0) "
+                "FROM pedidos WHERE status = 'entregue' GROUP BY date(data_hora)")
+
+    def contar_sem_total(self):
+        """Pedidos sem valor gravado (importados sem os preços do cardápio)."""
+        return self.conexao.execute("SELECT COUNT(*) FROM pedidos WHERE total IS NULL").fetchone()[0]
+
+    def maior_numero(self):
+        """Maior número de pedido já usado (0 se não houver pedidos)."""
+        return self.conexao.execute("SELECT COALESCE(MAX(numero), 0) FROM pedidos").fetchone()[0]
+
+    def __len__(self):
+        return self.conexao.execute("SELECT COALESCE(SUM(quantidade), 0) FROM resumo_status").fetchone()[0]
+
+    # --------------------------------------------------------------------------
+    # Migração de/para JSON
+    # --------------------------------------------------------------------------
+
+    def importar_json(self, caminho="pedidos.json", precos=None):
+        """
+        Copia para o banco os pedidos de um pedidos.json (mais o diário
+        pedidos.json.diario, se existir). Pedidos com o mesmo número são
+        substituídos.
+
+        Args:
+            caminho (str): Arquivo pedidos.json.
+            precos (dict, optional): {código: preço} do cardápio. Os pedidos
+                antigos do cardapio.03.py não têm "total"; com os preços ele é
+                calculado pelos itens. Sem eles o pedido fica sem total e conta
+                como R$ 0 no resumo (veja contar_sem_total).
+
+        Returns:
+            int: Quantidade de pedidos importados.
+        """
+        # Só leitura: o pedidos.json e o diário ficam como estavam
+        pedidos = ler_pedidos(caminho)
+        if precos:
+            for pedido in pedidos.values():
+                if pedido.get("total") is None and all(int(codigo) in precos for codigo in pedido["itens"]):
+                    pedido["total"] = sum(precos[int(codigo)] * quantidade
+                                          for codigo, quantidade in pedido["itens"].items())
+        with self.conexao:
+            for numero, pedido in pedidos.items():
+                self._gravar(numero, pedido)
+        return len(pedidos)
+
+    def exportar_json(self, caminho="pedidos.json"):
+        """Grava todos os pedidos em um arquivo no formato do pedidos.json. Retorna quantos."""
+        pedidos = self.todos()
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(pedidos, f, ensure_ascii=False, indent=2)
+        os.replace(temporario, caminho)
+        return len(pedidos)
+
+    def fechar(self):
+        self.conexao.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importa/exporta os pedidos do restaurante (JSON <-> SQLite)")
+    parser.add_argument("acao", choices=("importar", "exportar"))
+    parser.add_argument("arquivo_json", nargs="?", default="pedidos.json")
+    parser.add_argument("--banco", default=ARQUIVO_BANCO, help=f"arquivo SQLite (padrão: {ARQUIVO_BANCO})")
+    args = parser.parse_args()
+
+    banco = BancoPedidos(args.banco)
+    try:
+        if args.acao == "importar":
+            total = banco.importar_json(args.arquivo_json)
+            print(f"{total} pedidos importados de {args.arquivo_json} para {args.banco}")
+            sem_total = banco.contar_sem_total()
+            if sem_total:
+                print(f"Atenção: {sem_total} pedidos sem total (contam como R$ 0 no resumo). "
+                      f"Para calculá-los pelos preços do cardápio, apague {args.banco} e abra o RestauranteApp, "
+                      f"que importa o {args.arquivo_json} sozinho.")
+        else:
+            total = banco.exportar_json(args.arquivo_json)
+            print(f"{total} pedidos exportados de {args.banco} para {args.arquivo_json}")
+    finally:
+        banco.fechar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Benchmark: Treeview reconstruído a cada mudança vs. atualização diferencial
+# Uso: python benchmark_treeview.py [linhas ...] [--repeticoes 20]
+#
+# Para cada tamanho (padrão: 1.000 e 10.000 linhas) mede o tempo de um
+# "quadro": aplicar uma mudança (uma quantidade alterada e um item novo no
+# fim, como ao clicar em "Adicionar Item") e deixar o Tk redesenhar
+# (update_idletasks). Precisa de uma tela (no Linux sem tela: xvfb-run).
+import argparse
+import statistics
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from vinculo_treeview import VinculoTreeview
+
+def montar_linhas(quantidade):
+    return [(str(codigo), (f"Item {codigo}", 1, f"R$ {codigo * 0.5:.2f}")) for codigo in range(quantidade)]
+
+def reconstruir(tree, linhas):
+    # O jeito antigo do atualizar_pedido_tree: apaga tudo e insere de novo
+    for item in tree.get_children():
+        tree.delete(item)
+    for iid, valores in linhas:
+        tree.insert("", "end", iid=iid, values=valores)
+
+def medir(root, atualizar, linhas, repeticoes):
+    """Tempos (em segundos) de cada quadro: mudança + redesenho."""
+    tempos = []
+    for repeticao in range(repeticoes):
+        # Uma quantidade alterada e um item novo no fim a cada quadro
+        meio = len(linhas) // 2
+        linhas[meio] = (linhas[meio][0], (linhas[meio][1][0], repeticao + 2, linhas[meio][1][2]))
+        linhas.append((f"novo{repeticao}", (f"Novo {repeticao}", 1, "R$ 1.00")))
+        inicio = time.perf_counter()
+        atualizar(linhas)
+        root.update_idletasks()
+        tempos.append(time.perf_counter() - inicio)
+    return tempos
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de quadro do Treeview: reconstrução vs. diferencial")
+    parser.add_argument('linhas', nargs='*', type=int, default=[1_000, 10_000])
+    parser.add_argument('--repeticoes', type=int, default=20, help="quadros medidos por tamanho (mínimo 2)")
+    args = parser.parse_args()
+    if args.repeticoes < 2:
+        # O p95 precisa de pelo menos duas medidas
+        parser.error("--repeticoes precisa ser pelo menos 2")
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as erro:
+        print(f"Sem tela para o Tk ({erro}). No Linux, rode com xvfb-run.")
+        sys.exit(1)
+
+    print(f"{'linhas':>8} {'método':<14} {'mediana (ms)':>13} {'p95 (ms)':>10}")
+    print("-" * 50)
+    for quantidade in args.linhas:
+        for metodo in ('reconstrução', 'diferencial'):
+            tree = ttk.Treeview(root, columns=("Item", "Quantidade", "Subtotal"), show="headings")
+            tree.pack(fill="both", expand=True)
+            linhas = montar_linhas(quantidade)
+            if metodo == 'reconstrução':
+                reconstruir(tree, linhas)
+                atualizar = lambda linhas, tree=tree: reconstruir(tree, linhas)
+            else:
+                vinculo = VinculoTreeview(tree)
+                vinculo.sincronizar(linhas)
+                atualizar = vinculo.sincronizar
+            root.update_idletasks()
+
+            tempos = medir(root, atualizar, linhas, args.repeticoes)
+            p95 = statistics.quantiles(tempos, n=20, method='inclusive')[18]
+            print(f"{quantidade:>8} {metodo:<14} {statistics.median(tempos) * 1000:>13.2f} {p95 * 1000:>10.2f}")
+            tree.destroy()
+
+    root.destroy()
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import argparse
 import datetime
-import json
 import os
 
+from banco_pedidos import LIMITE_RELATORIO, BancoPedidos, PedidoAtual
+from servico_pedidos import ClientePedidos
+from vinculo_treeview import VinculoTreeview
+
+# Intervalo (ms) para conferir os avisos do serviço de pedidos
+INTERVALO_EVENTOS = 200
+
 class RestauranteApp:
-    def __init__(self):
+    def __init__(self, servico=None):
         self.root = tk.Tk()
         self.root.title("🍣 Sistema Restaurante Japonês")
         self.root.geometry("1200x700")
@@ -16,12 +23,17 @@ class RestauranteApp:
         
         # Inicializar dados
         self.cardapio = self.carregar_cardapio()
-        self.pedidos = self.carregar_pedidos()
-        self.numero_pedido = 1000 + len(self.pedidos)
+        self.servico = servico
+        self.banco = self.carregar_pedidos()
+        self.tela_atual = None
         
         # Configurar layout principal
         self.setup_ui()
         
+        # Com o serviço de pedidos, acompanha o que os outros terminais fazem
+        if self.servico:
+            self.root.after(INTERVALO_EVENTOS, self.receber_eventos)
+        
     def setup_styles(self):
         """Configura estilos para a interface"""
         style = ttk.Style()
@@ -78,28 +90,26 @@ class RestauranteApp:
         }
     
     def carregar_pedidos(self):
-        """Carrega pedidos do arquivo JSON"""
+        """Abre o banco de pedidos (pedidos.db), importando o pedidos.json na primeira vez,
+        ou conecta ao serviço de pedidos compartilhado pelos terminais"""
+        if self.servico:
+            return ClientePedidos(*self.servico)
+        banco = BancoPedidos("pedidos.db")
         try:
-            if os.path.exists("pedidos.json"):
-                with open("pedidos.json", "r", encoding="utf-8") as f:
-                    return json.load(f)
+            if not len(banco) and os.path.exists("pedidos.json"):
+                precos = {codigo: item["preco"] for codigo, item in self.cardapio.items()}
+                banco.importar_json("pedidos.json", precos)
         except:
             pass
-        return {}
+        return banco
     
-    def salvar_pedidos(self):
-        """Salva pedidos no arquivo JSON"""
+    def salvar_pedidos(self, pedido):
+        """Grava o pedido novo (com os itens) no banco e devolve o número dado a ele"""
         try:
-            with open("pedidos.json", "w", encoding="utf-8") as f:
-                json.dump(self.pedidos, f, ensure_ascii=False, indent=2)
+            return self.banco.novo_pedido(pedido)
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao salvar pedidos: {e}")
     
-    def gerar_numero_pedido(self):
-        """Gera um número único para o pedido"""
-        self.numero_pedido += 1
-        return self.numero_pedido
-    
     def setup_ui(self):
         """Configura a interface do usuário"""
         # Frame principal
@@ -175,6 +185,7 @@ class RestauranteApp:
         self.content_text.delete("1.0", "end")
         for widget in self.action_frame.winfo_children():
             widget.destroy()
+        self.tela_atual = None
     
     def mostrar_cardapio(self):
         """Exibe o cardápio completo"""
@@ -248,10 +259,8 @@ class RestauranteApp:
         self.cardapio_tree.column("Categoria", width=100)
         
         # Preencher treeview
-        for codigo, item in self.cardapio.items():
-            self.cardapio_tree.insert("", "end", values=(
-                codigo, item["nome"], f"R$ {item['preco']:.2f}", item["categoria"]
-            ))
+        self.cardapio_vinculo = VinculoTreeview(self.cardapio_tree)
+        self.atualizar_cardapio_tree()
         
         cardapio_scroll = ttk.Scrollbar(cardapio_tree_frame, orient="vertical", command=self.cardapio_tree.yview)
         self.cardapio_tree.configure(yscrollcommand=cardapio_scroll.set)
@@ -279,6 +288,7 @@ class RestauranteApp:
         self.pedido_tree.column("Item", width=200)
         self.pedido_tree.column("Quantidade", width=80)
         self.pedido_tree.column("Subtotal", width=100)
+        self.pedido_vinculo = VinculoTreeview(self.pedido_tree)
         
         pedido_scroll = ttk.Scrollbar(pedido_tree_frame, orient="vertical", command=self.pedido_tree.yview)
         self.pedido_tree.configure(yscrollcommand=pedido_scroll.set)
@@ -301,6 +311,10 @@ class RestauranteApp:
                            command=self.adicionar_item_pedido, bg=self.accent_color, fg="white")
         add_btn.pack(side="left", padx=10)
         
+        remover_btn = tk.Button(control_frame, text="Remover Item", 
+                               command=self.remover_item_pedido, bg=self.warning_color, fg="white")
+        remover_btn.pack(side="left", padx=10)
+        
         # Botões de ação
         btn_frame = tk.Frame(main_items_frame, bg=self.bg_color)
         btn_frame.pack(fill="x", pady=10)
@@ -315,8 +329,8 @@ class RestauranteApp:
                               bg=self.warning_color, fg="white", font=("Arial", 12))
         limpar_btn.pack(side="left", padx=10)
         
-        # Dicionário para armazenar pedido atual
-        self.pedido_atual = {}
+        # Itens do pedido atual, com o total acumulado
+        self.pedido_atual = PedidoAtual(self.cardapio)
     
     def adicionar_item_pedido(self):
         """Adiciona item ao pedido atual"""
@@ -336,10 +350,7 @@ class RestauranteApp:
                 return
             
             # Adicionar ao pedido atual
-            if codigo in self.pedido_atual:
-                self.pedido_atual[codigo] += quantidade
-            else:
-                self.pedido_atual[codigo] = quantidade
+            self.pedido_atual.adicionar(codigo, quantidade)
             
             # Atualizar treeview do pedido
             self.atualizar_pedido_tree()
@@ -351,31 +362,52 @@ class RestauranteApp:
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao adicionar item: {e}")
     
+    def remover_item_pedido(self):
+        """Remove do pedido atual a quantidade informada do item selecionado"""
+        try:
+            selection = self.pedido_tree.selection()
+            if not selection or selection[0] == "total":
+                messagebox.showwarning("Aviso", "Selecione um item do pedido!")
+                return
+            
+            quantidade = int(self.quantidade_var.get())
+            if quantidade <= 0:
+                messagebox.showwarning("Aviso", "Quantidade deve ser maior que zero!")
+                return
+            
+            self.pedido_atual.remover(int(selection[0]), quantidade)
+            self.atualizar_pedido_tree()
+            self.quantidade_var.set("1")
+            
+        except ValueError:
+            messagebox.showerror("Erro", "Quantidade inválida!")
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao remover item: {e}")
+    
+    def atualizar_cardapio_tree(self):
+        """Atualiza a treeview do cardápio (só as linhas que mudaram)"""
+        self.cardapio_vinculo.sincronizar(
+            (str(codigo), (codigo, item["nome"], f"R$ {item['preco']:.2f}", item["categoria"]))
+            for codigo, item in self.cardapio.items()
+        )
+    
     def atualizar_pedido_tree(self):
-        """Atualiza a treeview do pedido atual"""
-        # Limpar treeview
-        for item in self.pedido_tree.get_children():
-            self.pedido_tree.delete(item)
-        
-        # Preencher com itens do pedido
-        total_geral = 0
-        for codigo, quantidade in self.pedido_atual.items():
-            item = self.cardapio[codigo]
-            subtotal = item["preco"] * quantidade
-            total_geral += subtotal
-            self.pedido_tree.insert("", "end", values=(
-                item["nome"], quantidade, f"R$ {subtotal:.2f}"
-            ))
+        """Atualiza a treeview do pedido atual (só as linhas que mudaram)"""
+        # O código do item é o id da linha
+        linhas = [
+            (str(codigo), (self.cardapio[codigo]["nome"], quantidade,
+                           f"R$ {self.pedido_atual.subtotal(codigo):.2f}"))
+            for codigo, quantidade in self.pedido_atual.items()
+        ]
         
         # Adicionar linha do total
         if self.pedido_atual:
-            self.pedido_tree.insert("", "end", values=(
-                "TOTAL", "", f"R$ {total_geral:.2f}"
-            ))
+            linhas.append(("total", ("TOTAL", "", f"R$ {self.pedido_atual.total:.2f}")))
+        self.pedido_vinculo.sincronizar(linhas)
     
     def limpar_pedido_atual(self):
         """Limpa o pedido atual"""
-        self.pedido_atual = {}
+        self.pedido_atual.clear()
         self.atualizar_pedido_tree()
         messagebox.showinfo("Sucesso", "Pedido limpo!")
     
@@ -396,18 +428,18 @@ class RestauranteApp:
                 messagebox.showwarning("Aviso", "Número da mesa deve ser maior que zero!")
                 return
             
-            # Gerar número do pedido
-            numero_pedido = self.gerar_numero_pedido()
-            
             # Salvar pedido
-            self.pedidos[numero_pedido] = {
+            pedido = {
                 "mesa": mesa,
                 "itens": self.pedido_atual.copy(),
                 "status": "pendente",
-                "data_hora": datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+                "data_hora": datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
+                "total": self.pedido_atual.total
             }
             
-            self.salvar_pedidos()
+            numero_pedido = self.salvar_pedidos(pedido)
+            if numero_pedido is None:
+                return
             
             messagebox.showinfo("Sucesso", 
                               f"Pedido #{numero_pedido} finalizado com sucesso!\n"
@@ -424,10 +456,10 @@ class RestauranteApp:
     def mostrar_pedidos_pendentes(self):
         """Exibe pedidos pendentes"""
         self.clear_content()
+        self.tela_atual = self.mostrar_pedidos_pendentes
         self.content_title.configure(text="📦 Pedidos Pendentes")
         
-        pedidos_pendentes = {num: ped for num, ped in self.pedidos.items() 
-                           if ped["status"] == "pendente"}
+        pedidos_pendentes = self.banco.por_status("pendente")
         
         if not pedidos_pendentes:
             self.content_text.insert("1.0", "📭 Nenhum pedido pendente!")
@@ -453,8 +485,7 @@ class RestauranteApp:
         self.clear_content()
         self.content_title.configure(text="🍳 Comanda da Cozinha")
         
-        pedidos_pendentes = {num: ped for num, ped in self.pedidos.items() 
-                           if ped["status"] == "pendente"}
+        pedidos_pendentes = self.banco.por_status("pendente", com_itens=False)
         
         if not pedidos_pendentes:
             self.content_text.insert("1.0", "📭 Nenhum pedido pendente para imprimir!")
@@ -483,7 +514,7 @@ class RestauranteApp:
                 return
             
             numero_pedido = int(selecao.split("#")[1].split(" ")[0])
-            pedido = self.pedidos[numero_pedido]
+            pedido = self.banco.obter(numero_pedido)
             
             self.clear_content()
             self.content_title.configure(text=f"🍳 Comanda - Pedido #{numero_pedido}")
@@ -527,8 +558,7 @@ class RestauranteApp:
         self.clear_content()
         self.content_title.configure(text="✅ Confirmar Entrega")
         
-        pedidos_pendentes = {num: ped for num, ped in self.pedidos.items() 
-                           if ped["status"] == "pendente"}
+        pedidos_pendentes = self.banco.por_status("pendente", com_itens=False)
         
         if not pedidos_pendentes:
             self.content_text.insert("1.0", "📭 Nenhum pedido pendente para confirmar entrega!")
@@ -560,15 +590,14 @@ class RestauranteApp:
             numero_pedido = int(selecao.split("#")[1].split(" ")[0])
             
             # Confirmar entrega
-            self.pedidos[numero_pedido]["status"] = "entregue"
-            self.pedidos[numero_pedido]["hora_entrega"] = datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-            
-            self.salvar_pedidos()
+            hora_entrega = datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+            self.banco.atualizar_status(numero_pedido, "entregue", hora_entrega)
+            pedido = self.banco.obter(numero_pedido)
             
             messagebox.showinfo("Sucesso", 
                               f"✅ PEDIDO #{numero_pedido} CONFIRMADO COMO ENTREGUE!\n"
-                              f"📍 Mesa: {self.pedidos[numero_pedido]['mesa']}\n"
-                              f"🕒 Horário da entrega: {self.pedidos[numero_pedido]['hora_entrega']}")
+                              f"📍 Mesa: {pedido['mesa']}\n"
+                              f"🕒 Horário da entrega: {pedido['hora_entrega']}")
             
             # Atualizar interface
             self.confirmar_entrega()
@@ -581,7 +610,7 @@ class RestauranteApp:
         self.clear_content()
         self.content_title.configure(text="🧾 Nota Fiscal")
         
-        if not self.pedidos:
+        if not len(self.banco):
             self.content_text.insert("1.0", "📭 Nenhum pedido cadastrado!")
             return
         
@@ -590,7 +619,7 @@ class RestauranteApp:
                 font=("Arial", 12), bg=self.bg_color, fg=self.fg_color).pack(anchor="w", pady=10)
         
         self.nota_var = tk.StringVar()
-        notas_list = [f"#{num} - Mesa {ped['mesa']} ({ped['status']})" for num, ped in self.pedidos.items()]
+        notas_list = [f"#{num} - Mesa {ped['mesa']} ({ped['status']})" for num, ped in self.banco.todos(com_itens=False).items()]
         self.nota_combo = ttk.Combobox(self.action_frame, textvariable=self.nota_var,
                                      values=notas_list, state="readonly", width=30)
         self.nota_combo.pack(pady=10)
@@ -608,7 +637,7 @@ class RestauranteApp:
                 return
             
             numero_pedido = int(selecao.split("#")[1].split(" ")[0])
-            pedido = self.pedidos[numero_pedido]
+            pedido = self.banco.obter(numero_pedido)
             
             self.clear_content()
             self.content_title.configure(text=f"🧾 Nota Fiscal - Pedido #{numero_pedido}")
@@ -647,38 +676,59 @@ class RestauranteApp:
     def mostrar_relatorio(self):
         """Exibe relatório de pedidos"""
         self.clear_content()
+        self.tela_atual = self.mostrar_relatorio
         self.content_title.configure(text="📊 Relatório de Pedidos")
         
-        if not self.pedidos:
+        if not len(self.banco):
             self.content_text.insert("1.0", "📭 Nenhum pedido foi realizado!")
             return
         
-        pedidos_pendentes = {num: ped for num, ped in self.pedidos.items() 
-                           if ped["status"] == "pendente"}
-        pedidos_entregues = {num: ped for num, ped in self.pedidos.items() 
-                           if ped["status"] == "entregue"}
+        # Contagens e valores vêm dos acumulados do banco; as listas mostram
+        # só os pedidos mais recentes de cada status
+        resumo = self.banco.resumo()
         
         texto = "=" * 60 + "\n"
         texto += "              📊 RELATÓRIO DE PEDIDOS\n"
         texto += "=" * 60 + "\n\n"
         texto += "📋 RESUMO:\n"
-        texto += f"Pedidos Pendentes: {len(pedidos_pendentes)}\n"
-        texto += f"Pedidos Entregues: {len(pedidos_entregues)}\n"
-        texto += f"Total de Pedidos: {len(self.pedidos)}\n\n"
-        
-        if pedidos_pendentes:
-            texto += "⌛ PEDIDOS PENDENTES:\n"
-            for numero, pedido in pedidos_pendentes.items():
-                texto += f"  #{numero} - Mesa {pedido['mesa']} - {pedido['data_hora']}\n"
+        texto += f"Pedidos Pendentes: {resumo.get('pendente', (0, 0))[0]}\n"
+        texto += f"Pedidos Entregues: {resumo.get('entregue', (0, 0))[0]}\n"
+        texto += f"Total de Pedidos: {len(self.banco)}\n\n"
+        
+        receitas = self.banco.receita_por_dia()
+        if receitas:
+            texto += "💰 RECEITA (PEDIDOS ENTREGUES):\n"
+            for dia, quantidade, total in receitas:
+                data = datetime.date.fromisoformat(dia).strftime("%d/%m/%Y")
+                texto += f"  {data}: R$ {total:.2f} ({quantidade} pedidos)\n"
             texto += "\n"
         
-        if pedidos_entregues:
-            texto += "✅ PEDIDOS ENTREGUES:\n"
-            for numero, pedido in pedidos_entregues.items():
-                texto += f"  #{numero} - Mesa {pedido['mesa']} - Entregue: {pedido['hora_entrega']}\n"
+        for status, titulo in (("pendente", "⌛ PEDIDOS PENDENTES"), ("entregue", "✅ PEDIDOS ENTREGUES")):
+            pedidos = self.banco.por_status(status, com_itens=False, limite=LIMITE_RELATORIO)
+            if not pedidos:
+                continue
+            texto += f"{titulo}:\n"
+            for numero, pedido in pedidos.items():
+                if status == "entregue":
+                    texto += f"  #{numero} - Mesa {pedido['mesa']} - Entregue: {pedido['hora_entrega']}\n"
+                else:
+                    texto += f"  #{numero} - Mesa {pedido['mesa']} - {pedido['data_hora']}\n"
+            restantes = resumo[status][0] - len(pedidos)
+            if restantes > 0:
+                texto += f"  ... e mais {restantes} pedidos\n"
+            texto += "\n"
         
         self.content_text.insert("1.0", texto)
     
+    def receber_eventos(self):
+        """Atualiza a tela de consulta aberta quando outro terminal muda algum pedido"""
+        try:
+            if self.banco.receber_eventos() and self.tela_atual:
+                self.tela_atual()
+        except Exception as e:
+            print(f"Erro ao atualizar pedidos: {e}")
+        self.root.after(INTERVALO_EVENTOS, self.receber_eventos)
+    
     def sair(self):
         """Fecha a aplicação"""
         if messagebox.askokcancel("Sair", "Deseja realmente sair do sistema?"):
@@ -687,7 +737,16 @@ class RestauranteApp:
     def run(self):
         """Executa a aplicação"""
         self.root.mainloop()
+        self.banco.fechar()
 
 if __name__ == "__main__":
-    app = RestauranteApp()
+    parser = argparse.ArgumentParser(description="Sistema do restaurante")
+    parser.add_argument("--servico", metavar="HOST:PORTA", nargs="?", const="127.0.0.1:8765",
+                        help="usa o serviço de pedidos (servico_pedidos.py) em vez do pedidos.db local")
+    args = parser.parse_args()
+    servico = None
+    if args.servico:
+        host, _, porta = args.servico.rpartition(":")
+        servico = (host or "127.0.0.1", int(porta))
+    app = RestauranteApp(servico)
     app.run()
\ No newline at end of file
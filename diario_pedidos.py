@@ -0,0 +1,74 @@
+import json
+import os
+
+# ==============================================================================
+# LEITURA DO pedidos.json + DIÁRIO (SÓ PARA MIGRAÇÃO)
+# ==============================================================================
+#
+# Antes do banco SQLite (banco_pedidos.py), cada mudança de pedido era
+# acrescentada como uma linha JSON ao fim de "pedidos.json.diario", e o
+# pedidos.json guardava a "foto" completa:
+#
+#     {"op": "gravar", "numero": 1001, "pedido": {...}}
+#     {"op": "alterar", "numero": 1001, "campos": {"status": "entregue", ...}}
+#     {"op": "remover", "numero": 1001}
+#
+# Hoje os pedidos ficam no banco e esses arquivos só são lidos para importar
+# o histórico antigo. A leitura não altera nada: nem cria o diário, nem
+# compacta, nem corta uma linha incompleta no fim.
+#
+# Exemplo:
+#     pedidos = ler_pedidos("pedidos.json")   # {1001: {...}, ...}
+
+SUFIXO_DIARIO = '.diario'
+
+
+def _chaves_inteiras(pedido):
+    # O JSON transforma os códigos dos itens em texto; o cardápio usa int
+    itens = pedido.get("itens")
+    if isinstance(itens, dict):
+        pedido["itens"] = {int(codigo) if str(codigo).isdigit() else codigo: quantidade
+                           for codigo, quantidade in itens.items()}
+    return pedido
+
+
+def _aplicar(pedidos, evento):
+    numero = int(evento["numero"])
+    if evento["op"] == "gravar":
+        pedidos[numero] = _chaves_inteiras(evento["pedido"])
+    elif evento["op"] == "alterar":
+        pedidos[numero].update(evento["campos"])
+    elif evento["op"] == "remover":
+        pedidos.pop(numero, None)
+    else:
+        raise ValueError(f"Operação desconhecida: {evento['op']}")
+
+
+def ler_pedidos(caminho="pedidos.json"):
+    """
+    Lê a foto e reaplica o diário (caminho + '.diario'), sem gravar nada.
+
+    Args:
+        caminho (str): Arquivo da foto. Os dois arquivos podem não existir.
+
+    Returns:
+        dict: {número do pedido (int): pedido}.
+    """
+    pedidos = {}
+    if os.path.exists(caminho):
+        with open(caminho, "r", encoding="utf-8") as f:
+            for numero, pedido in json.load(f).items():
+                pedidos[int(numero)] = _chaves_inteiras(pedido)
+
+    caminho_diario = caminho + SUFIXO_DIARIO
+    if os.path.exists(caminho_diario):
+        with open(caminho_diario, "rb") as f:
+            for linha in f:
+                # Linha sem "\n" no fim: o programa caiu no meio da escrita
+                if not linha.endswith(b"\n"):
+                    break
+                try:
+                    _aplicar(pedidos, json.loads(linha))
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"Evento inválido no diário de pedidos ignorado: {e}")
+    return pedidos
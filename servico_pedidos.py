@@ -0,0 +1,386 @@
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import queue
+import socket
+import statistics
+import threading
+import time
+
+from banco_pedidos import ARQUIVO_BANCO, BancoPedidos
+
+# ==============================================================================
+# SERVIÇO DE PEDIDOS PARA VÁRIOS TERMINAIS
+# ==============================================================================
+#
+# Um único processo (asyncio) é dono do banco de pedidos e os terminais
+# (RestauranteApp) se conectam a ele por um socket local. Como só o serviço
+# grava, os números de pedido nunca se repetem e nenhum terminal sobrescreve
+# o trabalho do outro. Cada pedido novo ou mudança de status é enviado na hora
+# para todos os terminais conectados.
+#
+# Protocolo: uma mensagem JSON por linha.
+#     terminal -> serviço:  {"id": 7, "op": "por_status", "args": ["pendente"], "kwargs": {}}
+#     serviço -> terminal:  {"id": 7, "ok": true, "resultado": {...}}
+#                           {"id": 7, "ok": false, "tipo": "KeyError", "erro": "..."}
+#     aviso (sem id):       {"evento": "pedido", "numero": 1001, "pedido": {...}}
+#
+# Uso:
+#     python servico_pedidos.py                       # serviço em 127.0.0.1:8765
+#     python cardapiocommenu.01.py --servico 127.0.0.1:8765
+#     python servico_pedidos.py --simular 30          # 30 terminais de teste
+
+HOST_PADRAO = "127.0.0.1"
+PORTA_PADRAO = 8765
+
+# Operações que o terminal pode pedir (os mesmos métodos do BancoPedidos)
+OPERACOES_LEITURA = {"obter", "por_status", "da_mesa", "do_dia", "todos", "resumo", "contar_por_status",
+                     "receita_por_dia", "maior_numero", "quantidade"}
+OPERACOES_ESCRITA = {"novo_pedido", "atualizar_status"}
+
+# Terminal com mais que isso esperando para ser enviado está travado e é desconectado
+LIMITE_BUFFER = 4 * 1024 * 1024
+
+
+def _pedidos_do_json(dados):
+    # No JSON as chaves viram texto; o RestauranteApp usa int
+    return {int(numero): _pedido_do_json(pedido) for numero, pedido in dados.items()}
+
+
+def _pedido_do_json(pedido):
+    if pedido is not None:
+        pedido["itens"] = {int(codigo): quantidade for codigo, quantidade in pedido["itens"].items()}
+    return pedido
+
+
+class ServicoPedidos:
+    """
+    Atende os terminais e repassa os pedidos ao BancoPedidos.
+
+    O asyncio roda tudo em uma thread só, então cada operação no banco
+    acontece inteira antes da próxima: não há duas gravações ao mesmo tempo.
+
+    Args:
+        banco (BancoPedidos): Banco usado apenas pelo serviço.
+    """
+
+    def __init__(self, banco):
+        self.banco = banco
+        self.terminais = set()
+        self.estatisticas = {'conexoes': 0, 'operacoes': 0, 'avisos': 0, 'desconectados': 0}
+
+    async def atender(self, leitor, escritor):
+        self.terminais.add(escritor)
+        self.estatisticas['conexoes'] += 1
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                resposta = self._executar(linha)
+                escritor.write(resposta)
+                await escritor.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.terminais.discard(escritor)
+            escritor.close()
+
+    def _executar(self, linha):
+        identificador = None
+        try:
+            mensagem = json.loads(linha)
+            identificador = mensagem.get("id")
+            operacao = mensagem["op"]
+            if operacao not in OPERACOES_LEITURA | OPERACOES_ESCRITA:
+                raise ValueError(f"Operação desconhecida: {operacao}")
+            args = mensagem.get("args", [])
+            kwargs = mensagem.get("kwargs", {})
+            if operacao == "do_dia" and args and args[0]:
+                args = [datetime.date.fromisoformat(args[0])]
+            if operacao == "quantidade":
+                resultado = len(self.banco)
+            else:
+                resultado = getattr(self.banco, operacao)(*args, **kwargs)
+            self.estatisticas['operacoes'] += 1
+            if operacao == "novo_pedido":
+                self._avisar(resultado)
+            elif operacao == "atualizar_status":
+                self._avisar(args[0] if args else kwargs["numero"])
+            resposta = {"id": identificador, "ok": True, "resultado": resultado}
+        except Exception as erro:
+            resposta = {"id": identificador, "ok": False, "tipo": type(erro).__name__,
+                        "erro": erro.args[0] if erro.args else str(erro)}
+        return (json.dumps(resposta, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def _avisar(self, numero):
+        """Envia o pedido alterado para todos os terminais conectados."""
+        aviso = (json.dumps({"evento": "pedido", "numero": numero, "pedido": self.banco.obter(numero)},
+                            ensure_ascii=False) + "\n").encode("utf-8")
+        for escritor in list(self.terminais):
+            # Sem esperar o envio: um terminal lento não atrasa os outros
+            if escritor.transport.get_write_buffer_size() > LIMITE_BUFFER:
+                self.terminais.discard(escritor)
+                self.estatisticas['desconectados'] += 1
+                escritor.close()
+                continue
+            escritor.write(aviso)
+        self.estatisticas['avisos'] += 1
+
+    async def servir(self, host=HOST_PADRAO, porta=PORTA_PADRAO, pronto=None):
+        """Atende até ser cancelado; "pronto" (threading.Event) é sinalizado ao abrir a porta."""
+        servidor = await asyncio.start_server(self.atender, host, porta)
+        if pronto is not None:
+            pronto.set()
+        async with servidor:
+            await servidor.serve_forever()
+
+
+def iniciar_em_thread(caminho_banco=ARQUIVO_BANCO, host=HOST_PADRAO, porta=PORTA_PADRAO):
+    """
+    Roda o serviço em uma thread (para testes e para a simulação).
+
+    Returns:
+        ServicoPedidos: O serviço já aceitando conexões.
+    """
+    pronto = threading.Event()
+    servico = {}
+
+    def rodar():
+        # O banco é aberto na thread que vai usá-lo (exigência do sqlite3)
+        servico['objeto'] = ServicoPedidos(BancoPedidos(caminho_banco))
+        asyncio.run(servico['objeto'].servir(host, porta, pronto))
+
+    threading.Thread(target=rodar, daemon=True).start()
+    if not pronto.wait(10):
+        raise TimeoutError(f"O serviço de pedidos não abriu {host}:{porta}")
+    return servico['objeto']
+
+
+class ClientePedidos:
+    """
+    Conexão de um terminal com o serviço, com os mesmos métodos do BancoPedidos.
+
+    As respostas e os avisos chegam por uma thread de leitura. Os avisos
+    ficam na fila "eventos", para a interface (Tk) consumir na própria thread:
+        for numero, pedido in cliente.receber_eventos(): ...
+
+    Raises:
+        ConnectionError: Serviço fora do ar ou conexão perdida.
+        TimeoutError: O serviço não respondeu a tempo.
+    """
+
+    def __init__(self, host=HOST_PADRAO, porta=PORTA_PADRAO, tempo_limite=5.0):
+        self.tempo_limite = tempo_limite
+        self._socket = socket.create_connection((host, porta), timeout=tempo_limite)
+        self._socket.settimeout(None)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._arquivo = self._socket.makefile("rb")
+        self._ids = itertools.count(1)
+        self._aguardando = {}  # id -> [threading.Event, resposta]
+        self._trava = threading.Lock()
+        self._conectado = True
+        self.eventos = queue.Queue()
+        threading.Thread(target=self._ler, daemon=True).start()
+
+    def _ler(self):
+        try:
+            for linha in self._arquivo:
+                mensagem = json.loads(linha)
+                if "evento" in mensagem:
+                    self.eventos.put((mensagem["numero"], _pedido_do_json(mensagem["pedido"])))
+                    continue
+                espera = self._aguardando.pop(mensagem["id"], None)
+                if espera is not None:
+                    espera[1] = mensagem
+                    espera[0].set()
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._conectado = False
+            for espera in list(self._aguardando.values()):
+                espera[0].set()
+
+    def _chamar(self, operacao, *args, **kwargs):
+        if not self._conectado:
+            raise ConnectionError("Sem conexão com o serviço de pedidos")
+        identificador = next(self._ids)
+        espera = [threading.Event(), None]
+        self._aguardando[identificador] = espera
+        mensagem = {"id": identificador, "op": operacao, "args": list(args), "kwargs": kwargs}
+        with self._trava:
+            self._socket.sendall((json.dumps(mensagem, ensure_ascii=False) + "\n").encode("utf-8"))
+        if not espera[0].wait(self.tempo_limite):
+            self._aguardando.pop(identificador, None)
+            raise TimeoutError(f"O serviço de pedidos não respondeu ({operacao})")
+        resposta = espera[1]
+        if resposta is None:
+            raise ConnectionError("Conexão com o serviço de pedidos perdida")
+        if not resposta["ok"]:
+            tipo = {"KeyError": KeyError, "ValueError": ValueError}.get(resposta["tipo"], RuntimeError)
+            raise tipo(resposta["erro"])
+        return resposta["resultado"]
+
+    def receber_eventos(self):
+        """Avisos recebidos desde a última chamada: [(número, pedido), ...]."""
+        eventos = []
+        while True:
+            try:
+                eventos.append(self.eventos.get_nowait())
+            except queue.Empty:
+                return eventos
+
+    def novo_pedido(self, pedido):
+        return self._chamar("novo_pedido", pedido)
+
+    def atualizar_status(self, numero, status, hora_entrega=None):
+        self._chamar("atualizar_status", numero, status, hora_entrega)
+
+    def obter(self, numero):
+        return _pedido_do_json(self._chamar("obter", numero))
+
+    def por_status(self, *status, com_itens=True, limite=None):
+        return _pedidos_do_json(self._chamar("por_status", *status, com_itens=com_itens, limite=limite))
+
+    def da_mesa(self, mesa, *status, com_itens=True):
+        return _pedidos_do_json(self._chamar("da_mesa", mesa, *status, com_itens=com_itens))
+
+    def do_dia(self, dia=None, com_itens=True):
+        return _pedidos_do_json(self._chamar("do_dia", dia.isoformat() if dia else None, com_itens=com_itens))
+
+    def todos(self, com_itens=True):
+        return _pedidos_do_json(self._chamar("todos", com_itens=com_itens))
+
+    def resumo(self):
+        return {status: tuple(valores) for status, valores in self._chamar("resumo").items()}
+
+    def contar_por_status(self):
+        return self._chamar("contar_por_status")
+
+    def receita_por_dia(self, dias=7):
+        return [tuple(linha) for linha in self._chamar("receita_por_dia", dias)]
+
+    def maior_numero(self):
+        return self._chamar("maior_numero")
+
+    def __len__(self):
+        return self._chamar("quantidade")
+
+    def fechar(self):
+        self._conectado = False
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+
+def simular_terminais(terminais, pedidos_por_terminal, host=HOST_PADRAO, porta=PORTA_PADRAO):
+    """
+    Vários terminais fazendo pedidos ao mesmo tempo contra o serviço.
+
+    Confere que nenhum número se repetiu e que todos os terminais receberam
+    o aviso de todos os pedidos.
+
+    Returns:
+        dict: Pedidos feitos, números repetidos, avisos faltando e latências
+        (p50/p95 em ms) de cada pedido.
+
+    Raises:
+        ValueError: Menos de 1 terminal ou de 1 pedido por terminal.
+    """
+    if terminais < 1 or pedidos_por_terminal < 1:
+        raise ValueError("A simulação precisa de pelo menos 1 terminal e 1 pedido por terminal")
+    clientes = [ClientePedidos(host, porta) for _ in range(terminais)]
+    numeros = []
+    latencias = []
+    trava = threading.Lock()
+    largada = threading.Barrier(terminais)
+
+    def terminal(indice, cliente):
+        largada.wait()
+        for _ in range(pedidos_por_terminal):
+            pedido = {"mesa": indice + 1, "itens": {1: 1, 6: 2}, "status": "pendente",
+                      "data_hora": datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S"), "total": 41.0}
+            inicio = time.perf_counter()
+            numero = cliente.novo_pedido(pedido)
+            with trava:
+                latencias.append(time.perf_counter() - inicio)
+                numeros.append(numero)
+
+    threads = [threading.Thread(target=terminal, args=(indice, cliente))
+               for indice, cliente in enumerate(clientes)]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    segundos = time.perf_counter() - inicio
+
+    # Os avisos podem chegar um pouco depois da última resposta
+    esperados = set(numeros)
+    faltando = 0
+    for cliente in clientes:
+        recebidos = set()
+        limite = time.monotonic() + 5
+        while not esperados <= recebidos and time.monotonic() < limite:
+            try:
+                recebidos.add(cliente.eventos.get(timeout=0.1)[0])
+            except queue.Empty:
+                pass
+        faltando += len(esperados - recebidos)
+        cliente.fechar()
+
+    if len(latencias) > 1:
+        cortes = statistics.quantiles(latencias, n=20, method='inclusive')
+    else:
+        # Um pedido só: p50 e p95 são o próprio tempo
+        cortes = latencias * 19
+    return {
+        'pedidos': len(numeros),
+        'repetidos': len(numeros) - len(esperados),
+        'avisos_faltando': faltando,
+        'segundos': segundos,
+        'p50_ms': cortes[9] * 1000,
+        'p95_ms': cortes[18] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço de pedidos compartilhado pelos terminais do restaurante")
+    parser.add_argument("--host", default=HOST_PADRAO)
+    parser.add_argument("--porta", type=int, default=PORTA_PADRAO)
+    parser.add_argument("--banco", default=ARQUIVO_BANCO, help=f"arquivo SQLite (padrão: {ARQUIVO_BANCO})")
+    parser.add_argument("--simular", type=int, metavar="TERMINAIS", default=None,
+                        help="sobe o serviço com um banco temporário e simula vários terminais")
+    parser.add_argument("--pedidos", type=int, default=50,
+                        help="com --simular, pedidos feitos por terminal (padrão: 50)")
+    args = parser.parse_args()
+
+    if args.simular is not None:
+        if args.simular < 1 or args.pedidos < 1:
+            parser.error("--simular e --pedidos precisam ser pelo menos 1")
+        # Banco em memória: a simulação não mexe nos pedidos de verdade
+        servico = iniciar_em_thread(":memory:", args.host, args.porta)
+        resultado = simular_terminais(args.simular, args.pedidos, args.host, args.porta)
+        print(f"{args.simular} terminais, {resultado['pedidos']} pedidos em {resultado['segundos']:.2f} s")
+        print(f"Latência por pedido: p50 {resultado['p50_ms']:.2f} ms, p95 {resultado['p95_ms']:.2f} ms")
+        print(f"Números repetidos: {resultado['repetidos']}")
+        print(f"Avisos que não chegaram: {resultado['avisos_faltando']}")
+        print(f"Avisos enviados: {servico.estatisticas['avisos'] * args.simular}")
+        return
+
+    servico = ServicoPedidos(BancoPedidos(args.banco))
+    print(f"Serviço de pedidos em {args.host}:{args.porta} (banco {args.banco}). Ctrl+C para parar.")
+    try:
+        asyncio.run(servico.servir(args.host, args.porta))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servico.banco.fechar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# ==============================================================================
+# ATUALIZAÇÃO DIFERENCIAL DE UM ttk.Treeview
+# ==============================================================================
+#
+# Apagar todas as linhas e inserir tudo de novo a cada item adicionado custa
+# uma chamada ao Tk por linha, e com milhares de linhas a janela trava. O
+# vínculo guarda o que já está na tela (por id da linha: código do item ou
+# número do pedido) e, a cada atualização, só insere, altera, move ou apaga o
+# que mudou.
+#
+# Exemplo:
+#     vinculo = VinculoTreeview(self.pedido_tree)
+#     vinculo.sincronizar((str(codigo), (nome, quantidade, subtotal)) for ...)
+
+
+class VinculoTreeview:
+    """
+    Mantém um ttk.Treeview igual a uma lista de linhas, mexendo só no que mudou.
+
+    Args:
+        tree (ttk.Treeview): Treeview controlado pelo vínculo. As linhas
+            devem ser alteradas só por ele.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self._linhas = {}  # id -> (valores, tags) como estão na tela
+        self._ordem = []   # ids na ordem da tela
+        self.estatisticas = {'inseridas': 0, 'alteradas': 0, 'movidas': 0, 'apagadas': 0}
+
+    def __len__(self):
+        return len(self._ordem)
+
+    def sincronizar(self, linhas):
+        """
+        Deixa o Treeview com exatamente estas linhas, nesta ordem.
+
+        Args:
+            linhas (iterable): (id, valores) ou (id, valores, tags) de cada
+                linha; ids repetidos não são permitidos.
+
+        Returns:
+            int: Quantidade de chamadas feitas ao Tk.
+
+        Raises:
+            ValueError: id repetido.
+        """
+        novas = {}
+        ordem = []
+        for linha in linhas:
+            iid, valores = str(linha[0]), tuple(linha[1])
+            tags = tuple(linha[2]) if len(linha) > 2 else ()
+            if iid in novas:
+                raise ValueError(f"Linha '{iid}' repetida")
+            novas[iid] = (valores, tags)
+            ordem.append(iid)
+
+        chamadas = 0
+        apagar = [iid for iid in self._ordem if iid not in novas]
+        if apagar:
+            self.tree.delete(*apagar)
+            self.estatisticas['apagadas'] += len(apagar)
+            chamadas += 1
+        restantes = [iid for iid in self._ordem if iid in novas]
+
+        # Percorre a ordem nova comparando com a da tela: linhas que já estão
+        # na posição certa não são movidas (acrescentar no fim não move nada)
+        posicao = 0
+        movidas = set()
+        for indice, iid in enumerate(ordem):
+            valores, tags = novas[iid]
+            if iid not in self._linhas:
+                self.tree.insert("", indice, iid=iid, values=valores, tags=tags)
+                self.estatisticas['inseridas'] += 1
+                chamadas += 1
+                continue
+            while posicao < len(restantes) and restantes[posicao] in movidas:
+                posicao += 1
+            if posicao < len(restantes) and restantes[posicao] == iid:
+                posicao += 1
+            else:
+                self.tree.move(iid, "", indice)
+                movidas.add(iid)
+                self.estatisticas['movidas'] += 1
+                chamadas += 1
+            if self._linhas[iid] != (valores, tags):
+                self.tree.item(iid, values=valores, tags=tags)
+                self.estatisticas['alteradas'] += 1
+                chamadas += 1
+
+        self._linhas = novas
+        self._ordem = ordem
+        return chamadas
+
+    def limpar(self):
+        """Apaga todas as linhas."""
+        return self.sincronizar(())